@@ -0,0 +1,219 @@
+# answers.py
+import queue
+import sqlite3
+import threading
+import time
+import uuid
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS consultations (
+    id TEXT PRIMARY KEY,
+    started_at REAL NOT NULL,
+    finished_at REAL
+);
+CREATE INDEX IF NOT EXISTS consultations_started_at ON consultations (started_at);
+CREATE TABLE IF NOT EXISTS answers (
+    id INTEGER PRIMARY KEY,
+    consultation_id TEXT NOT NULL,
+    question_key TEXT NOT NULL,
+    answer TEXT NOT NULL,
+    answered_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS answers_consultation ON answers (consultation_id, answered_at);
+CREATE TABLE IF NOT EXISTS uploads (
+    consultation_id TEXT PRIMARY KEY,
+    batch_id TEXT NOT NULL,
+    uploaded_at REAL
+);
+CREATE INDEX IF NOT EXISTS uploads_batch ON uploads (batch_id);
+"""
+
+# Marcador enfileirado por flush()
+FLUSH = ()
+
+class AnswerStore(object):
+    # Respostas das consultas em SQLite (modo WAL). Toda escrita é enfileirada
+    # e gravada por uma única thread, que agrupa as operações pendentes em um
+    # só commit; a thread principal nunca espera pelo disco. As respostas são
+    # só acrescentadas: corrigir uma resposta grava uma nova, e vale a mais recente
+    def __init__(self, path, batch_size=50, flush_interval=0.5):
+        self.path = path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.operations = queue.Queue()
+        # O banco é aberto pela própria thread de escrita: abrir o app não
+        # espera pela criação das tabelas, independente do tamanho do arquivo.
+        # Quem lê de outra thread logo na abertura (sync.py) espera por ready
+        self.ready = threading.Event()
+        # Erro ao abrir o banco: a thread de escrita encerrou e as
+        # operações passam a ser descartadas, sem ninguém esperar por ela
+        self.failed = None
+        self.lock = threading.Lock()
+        self.writer = threading.Thread(target=self.write_loop, name='answers', daemon=True)
+        self.writer.start()
+
+    def start_consultation(self):
+        consultation_id = uuid.uuid4().hex
+        self.enqueue((
+            'INSERT INTO consultations (id, started_at) VALUES (?, ?)',
+            (consultation_id, time.time()),
+        ))
+        return consultation_id
+
+    def finish_consultation(self, consultation_id):
+        self.enqueue((
+            'UPDATE consultations SET finished_at = ? WHERE id = ?',
+            (time.time(), consultation_id),
+        ))
+
+    def record(self, consultation_id, question_key, answer):
+        self.enqueue((
+            'INSERT INTO answers (consultation_id, question_key, answer, answered_at) VALUES (?, ?, ?, ?)',
+            (consultation_id, question_key, answer, time.time()),
+        ))
+
+    # Envio ao servidor (sync.py): cada consulta finalizada entra em um lote,
+    # marcado como enviado quando o servidor recebe o lote inteiro
+    def assign_batch(self, batch_id, consultation_ids):
+        for consultation_id in consultation_ids:
+            self.enqueue((
+                'INSERT OR REPLACE INTO uploads (consultation_id, batch_id) VALUES (?, ?)',
+                (consultation_id, batch_id),
+            ))
+
+    def mark_uploaded(self, batch_id):
+        self.enqueue((
+            'UPDATE uploads SET uploaded_at = ? WHERE batch_id = ?',
+            (time.time(), batch_id),
+        ))
+
+    def release_batch(self, batch_id):
+        self.enqueue((
+            'DELETE FROM uploads WHERE batch_id = ? AND uploaded_at IS NULL',
+            (batch_id,),
+        ))
+
+    def enqueue(self, operation):
+        # Sob o lock: nada entra na fila depois de a thread de escrita
+        # marcar a falha e esvaziá-la
+        with self.lock:
+            if self.failed is None:
+                self.operations.put(operation)
+                return True
+        return False
+
+    def flush(self):
+        # Espera até que tudo o que foi enfileirado esteja gravado. O marcador
+        # FLUSH faz a thread de escrita gravar o lote na hora, sem esperar
+        # flush_interval. Sem a thread de escrita, retorna na hora
+        if self.enqueue(FLUSH):
+            self.operations.join()
+
+    def close(self):
+        self.operations.put(None)
+        self.writer.join()
+
+    def connect(self):
+        connection = sqlite3.connect(self.path, timeout=10)
+        connection.execute('PRAGMA journal_mode=WAL')
+        # Em WAL, NORMAL não corrompe o banco se o app for encerrado no meio
+        # de uma escrita; no pior caso perde-se o último lote
+        connection.execute('PRAGMA synchronous=NORMAL')
+        return connection
+
+    def write_loop(self):
+        connection = None
+        try:
+            connection = self.connect()
+            connection.executescript(SCHEMA)
+        except (OSError, sqlite3.Error) as e:
+            print(f"Failed to open answers database {self.path}: {e}")
+            with self.lock:
+                self.failed = e
+            if connection is not None:
+                connection.close()
+        finally:
+            self.ready.set()
+        if self.failed is not None:
+            self.drain()
+            return
+
+        running = True
+        while running:
+            batch = [self.operations.get()]
+            # Junta o que chegar em seguida (até batch_size ou flush_interval)
+            deadline = time.monotonic() + self.flush_interval
+            while len(batch) < self.batch_size and batch[-1] is not None and batch[-1] is not FLUSH:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(self.operations.get(timeout=timeout))
+                except queue.Empty:
+                    break
+
+            running = batch[-1] is not None
+            try:
+                with connection:
+                    for operation in batch:
+                        if operation is not None and operation is not FLUSH:
+                            connection.execute(*operation)
+            except sqlite3.Error as e:
+                print(f"Failed to write answers: {e}")
+            for _ in batch:
+                self.operations.task_done()
+        connection.close()
+
+    def drain(self):
+        # Libera quem está em flush(): descarta o que já estava na fila
+        while True:
+            try:
+                self.operations.get_nowait()
+            except queue.Empty:
+                return
+            self.operations.task_done()
+
+    # Consultas: abrem a própria conexão (leitores não bloqueiam a escrita em
+    # WAL) e podem ser chamadas de qualquer thread
+    def query(self, sql, parameters=()):
+        connection = self.connect()
+        try:
+            return connection.execute(sql, parameters).fetchall()
+        finally:
+            connection.close()
+
+    def answers(self, consultation_id):
+        # Resposta mais recente de cada pergunta, na ordem em que foram dadas
+        rows = self.query(
+            'SELECT question_key, answer, answered_at FROM answers '
+            'WHERE consultation_id = ? ORDER BY answered_at, id',
+            (consultation_id,),
+        )
+        latest = {}
+        for question_key, answer, answered_at in rows:
+            latest.pop(question_key, None)
+            latest[question_key] = (answer, answered_at)
+        return latest
+
+    def pending_uploads(self, limit):
+        # Consultas finalizadas que ainda não estão em nenhum lote
+        return self.query(
+            'SELECT c.id, c.started_at, c.finished_at FROM consultations c '
+            'LEFT JOIN uploads u ON u.consultation_id = c.id '
+            'WHERE c.finished_at IS NOT NULL AND u.consultation_id IS NULL '
+            'ORDER BY c.started_at LIMIT ?',
+            (limit,),
+        )
+
+    def open_batches(self):
+        # Lotes montados e ainda não recebidos pelo servidor
+        return [row[0] for row in self.query('SELECT DISTINCT batch_id FROM uploads WHERE uploaded_at IS NULL')]
+
+    def consultations(self, limit=20):
+        # Consultas mais recentes: (id, início, fim, número de respostas)
+        return self.query(
+            'SELECT c.id, c.started_at, c.finished_at, '
+            '(SELECT COUNT(*) FROM answers a WHERE a.consultation_id = c.id) '
+            'FROM consultations c ORDER BY c.started_at DESC LIMIT ?',
+            (limit,),
+        )
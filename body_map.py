@@ -0,0 +1,126 @@
+# body_map.py
+#
+# Mapa do corpo tocável para as perguntas de localização
+# (constants.MAPA_CORPORAL_PERGUNTAS). As regiões (constants.MAPA_CORPORAL)
+# são desenhadas com instruções do canvas, uma cor por região: selecionar
+# uma região só troca a cor dela. A região tocada vem de uma grade
+# pré-calculada com o índice da região de cada célula, então cada toque é
+# uma leitura na grade, sem testar os polígonos um a um
+import math
+
+from kivy.graphics import Color, Line, Mesh
+from kivy.properties import StringProperty
+from kivy.uix.widget import Widget
+from kivy.utils import get_color_from_hex
+
+import constants
+
+# Separador das regiões na resposta ("cabeça, tórax direito")
+ANSWER_SEPARATOR = ', '
+
+def build_region_grid(regions, design_size, grid_size):
+    # Grade cols x rows (linhas de baixo para cima) com o índice + 1 da região
+    # que cobre o centro de cada célula, 0 fora do corpo. Preenchida linha a
+    # linha: os pontos em que as arestas de cada polígono cruzam a linha
+    # delimitam os trechos de células dentro dele
+    cols, rows = grid_size
+    design_width, design_height = design_size
+    grid = bytearray(cols * rows)
+    for region_id, (_, points) in enumerate(regions, 1):
+        edges = list(zip(points, points[1:] + points[:1]))
+        for row in range(rows):
+            y = (row + 0.5) * design_height / rows
+            xs = sorted(
+                x1 + (y - y1) * (x2 - x1) / (y2 - y1)
+                for (x1, y1), (x2, y2) in edges
+                if y1 <= y < y2 or y2 <= y < y1
+            )
+            for start, end in zip(xs[::2], xs[1::2]):
+                first = max(0, math.ceil(start * cols / design_width - 0.5))
+                last = min(cols - 1, math.ceil(end * cols / design_width - 0.5) - 1)
+                if last >= first:
+                    grid[row * cols + first:row * cols + last + 1] = bytes([region_id]) * (last - first + 1)
+    return grid
+
+region_grid = None
+
+def get_region_grid():
+    # Calculada uma única vez, na primeira abertura do mapa
+    global region_grid
+    if region_grid is None:
+        region_grid = build_region_grid(constants.MAPA_CORPORAL, constants.MAPA_CORPORAL_TAMANHO,
+                                        constants.MAPA_CORPORAL_GRADE)
+    return region_grid
+
+class BodyMap(Widget):
+    # Nomes das regiões selecionadas, na ordem de constants.MAPA_CORPORAL
+    answer = StringProperty('')
+
+    def __init__(self, **kwargs):
+        super(BodyMap, self).__init__(**kwargs)
+        self.regions = constants.MAPA_CORPORAL
+        self.grid = get_region_grid()
+        self.selected = set()
+        self.normal_color = get_color_from_hex(constants.MAPA_CORPORAL_COR)
+        self.selected_color = get_color_from_hex(constants.MAPA_CORPORAL_COR_SELECIONADA)
+
+        self.fill_colors = []
+        self.meshes = []
+        self.outlines = []
+        with self.canvas:
+            for _, points in self.regions:
+                self.fill_colors.append(Color(*self.normal_color))
+                # Polígonos convexos: um leque de triângulos a partir do primeiro vértice
+                self.meshes.append(Mesh(mode='triangle_fan', indices=list(range(len(points)))))
+            Color(*get_color_from_hex(constants.MAPA_CORPORAL_COR_CONTORNO))
+            for _ in self.regions:
+                self.outlines.append(Line(close=True, width=1.2))
+        self.bind(pos=self.update_shapes, size=self.update_shapes)
+
+    def figure_rect(self):
+        # Origem e escala da figura, centralizada no widget sem distorcer
+        design_width, design_height = constants.MAPA_CORPORAL_TAMANHO
+        scale = min(self.width / design_width, self.height / design_height)
+        return self.center_x - design_width * scale / 2, self.center_y - design_height * scale / 2, scale
+
+    def update_shapes(self, *args):
+        x0, y0, scale = self.figure_rect()
+        for (_, points), mesh, outline in zip(self.regions, self.meshes, self.outlines):
+            coords = [(x0 + x * scale, y0 + y * scale) for x, y in points]
+            mesh.vertices = [value for x, y in coords for value in (x, y, 0, 0)]
+            outline.points = [value for coord in coords for value in coord]
+
+    def region_at(self, x, y):
+        # Índice da região no ponto (coordenadas da janela), ou None
+        x0, y0, scale = self.figure_rect()
+        if scale <= 0:
+            return None
+        design_width, design_height = constants.MAPA_CORPORAL_TAMANHO
+        cols, rows = constants.MAPA_CORPORAL_GRADE
+        col = math.floor((x - x0) / scale * cols / design_width)
+        row = math.floor((y - y0) / scale * rows / design_height)
+        if not (0 <= col < cols and 0 <= row < rows):
+            return None
+        region_id = self.grid[row * cols + col]
+        return region_id - 1 if region_id else None
+
+    def on_touch_down(self, touch):
+        if self.disabled or not self.collide_point(*touch.pos):
+            return super(BodyMap, self).on_touch_down(touch)
+        index = self.region_at(*touch.pos)
+        if index is not None:
+            self.selected ^= {index}
+            self.fill_colors[index].rgba = self.selected_color if index in self.selected else self.normal_color
+            self.answer = self.answer_text()
+        return True
+
+    def answer_text(self):
+        return ANSWER_SEPARATOR.join(name for index, (name, _) in enumerate(self.regions) if index in self.selected)
+
+    def set_answer(self, answer):
+        # Seleciona as regiões de uma resposta já dada
+        names = set(answer.split(ANSWER_SEPARATOR)) if answer else set()
+        self.selected = {index for index, (name, _) in enumerate(self.regions) if name in names}
+        for index, color in enumerate(self.fill_colors):
+            color.rgba = self.selected_color if index in self.selected else self.normal_color
+        self.answer = self.answer_text()
@@ -0,0 +1,115 @@
+# bundle.py
+#
+# Pacote único com as imagens do app, lido via mmap. Formato:
+#     MAGIC | tamanho do índice (uint32, little endian) | índice JSON | dados
+# O índice mapeia o caminho original de cada imagem para
+# [posição relativa ao início dos dados, tamanho, largura, altura].
+# Gerado por tools/build_bundle.py; sem o pacote as imagens são lidas dos
+# arquivos soltos
+import json
+import mmap
+import os
+import struct
+
+from kivy.core.image import ImageLoader
+
+import constants
+
+MAGIC = b'ACPK1\n'
+HEADER_SIZE = struct.Struct('<I')
+
+class AssetBundle(object):
+    def __init__(self, path):
+        self.path = path
+        self.file = open(path, 'rb')
+        self.data = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        if self.data[:len(MAGIC)] != MAGIC:
+            self.close()
+            raise ValueError(f'{path} is not an asset bundle')
+        start = len(MAGIC) + HEADER_SIZE.size
+        header_size, = HEADER_SIZE.unpack_from(self.data, len(MAGIC))
+        self.index = json.loads(self.data[start:start + header_size].decode('utf-8'))
+        self.data_start = start + header_size
+
+    def __contains__(self, source):
+        return source in self.index
+
+    def read(self, source):
+        # Fatia do mmap: sem open/stat por imagem, e as páginas só são lidas
+        # do armazenamento quando acessadas
+        offset, length, _, _ = self.index[source]
+        offset += self.data_start
+        return self.data[offset:offset + length]
+
+    def chunks(self, source, chunk_size):
+        offset, length, _, _ = self.index[source]
+        offset += self.data_start
+        for start in range(offset, offset + length, chunk_size):
+            yield self.data[start:min(start + chunk_size, offset + length)]
+
+    def size(self, source):
+        _, _, width, height = self.index[source]
+        return width, height
+
+    def close(self):
+        if not self.data.closed:
+            self.data.close()
+        self.file.close()
+
+class BundleReader(object):
+    # Arquivo em memória no formato esperado pelos loaders do Kivy (inline)
+    def __init__(self, data):
+        self.data = data
+
+    def read(self):
+        return self.data
+
+def write_bundle(path, entries):
+    # entries: [(caminho original, largura, altura)]. Grava o índice e depois
+    # copia os arquivos em sequência, sem carregar todos na memória
+    index = {}
+    offset = 0
+    for source, width, height in entries:
+        length = os.path.getsize(source)
+        index[source] = [offset, length, width, height]
+        offset += length
+    header = json.dumps(index, ensure_ascii=False).encode('utf-8')
+
+    tmp_path = f'{path}.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(MAGIC)
+        f.write(HEADER_SIZE.pack(len(header)))
+        f.write(header)
+        for source, _, _ in entries:
+            with open(source, 'rb') as image:
+                for chunk in iter(lambda: image.read(65536), b''):
+                    f.write(chunk)
+    os.replace(tmp_path, path)
+    return index
+
+asset_bundle = None
+
+def get_bundle():
+    # Pacote aberto uma única vez; None quando não existe (desenvolvimento)
+    global asset_bundle
+    if asset_bundle is None and os.path.exists(constants.ASSET_BUNDLE):
+        try:
+            asset_bundle = AssetBundle(constants.ASSET_BUNDLE)
+        except (OSError, ValueError) as e:
+            print(f"Asset bundle unavailable: {e}")
+            asset_bundle = False
+    return asset_bundle or None
+
+def load_bundled(source, bundle=None):
+    # Decodifica a imagem a partir do pacote; pode rodar em qualquer thread
+    # (a textura só é criada ao acessar .texture, na thread principal).
+    # None quando a imagem não está no pacote
+    bundle = bundle or get_bundle()
+    if bundle is None or source not in bundle:
+        return None
+    ext = source.rsplit('.', 1)[-1].lower()
+    for loader in ImageLoader.loaders:
+        if loader.can_load_memory() and ext in loader.extensions():
+            # O decodificador SDL2 exige bytes: a fatia do mmap é a única cópia
+            return loader(source, ext=ext, rawdata=BundleReader(bundle.read(source)), inline=True, nocache=True)
+    return None
@@ -1,3 +1,5 @@
+WINDOW_SIZE = (450, 800)
+
 TITLE_FONT_SIZE = 32
 
 TITLE_HEIGHT = 40
@@ -12,6 +14,177 @@ BUTTON_MARGIN = 30
 
 BUTTON_BACKGROUND_COLOR = "#06AB98"
 
+IMAGES_DIR = 'assets/imagens'
+
+BACKGROUND_IMAGE = 'assets/imagens/background.png'
+
+# Variantes redimensionadas geradas por tools/build_assets.py
+VARIANTS_DIR = 'assets/variantes'
+
+VARIANTS_MANIFEST = 'assets/variantes/manifest.json'
+
+# Atlas gerados por tools/build_atlas.py
+ATLAS_DIR = 'assets/atlas'
+
+# Pacote único com as imagens das perguntas, gerado por tools/build_bundle.py
+ASSET_BUNDLE = 'assets/imagens.pack'
+
+# Clipes em Libras das perguntas (<pergunta>.mp4) e os seus pôsteres
+# (<pergunta>.jpg, primeiro quadro), gerados por tools/build_posters.py
+VIDEOS_DIR = 'assets/videos'
+
+BACK_BUTTON_IMAGE = 'assets/imagens/left_arrow.png'
+
+# Constrói as telas sob demanda em vez de todas na inicialização
+LAZY_SCREENS = True
+
+# Pré-carrega, com o app ocioso, as telas acessíveis a partir da tela atual
+PREFETCH_SCREENS = True
+
+# Intervalo (em segundos) entre a construção de duas telas pré-carregadas
+PREFETCH_INTERVAL = 0.1
+
+# Modo de reciclagem (quiosque): um número fixo de telas de menu é
+# reaproveitado para todas as seções, limitando o número de widgets
+RECYCLE_SCREENS = False
+
+# Telas de menu no modo de reciclagem (recomendado 3: a atual, a que está
+# saindo numa transição e a que está sendo preparada; valores menores que 2
+# são tratados como 2)
+RECYCLE_POOL_SIZE = 3
+
+# Orçamento de memória (em bytes) do cache de texturas das perguntas
+TEXTURE_CACHE_BYTES = 64 * 1024 * 1024
+
+# Threads usadas para decodificar as imagens das perguntas fora da thread principal
+DECODE_WORKERS = 2
+
+# Abre o popup imediatamente (com a miniatura) e decodifica a imagem em segundo plano
+ASYNC_IMAGE_DECODE = True
+
+# Toca o clipe em Libras da pergunta no popup, quando existe (requer ffpyplayer)
+LIBRAS_VIDEOS = True
+
+# Quadros decodificados mantidos à frente por clipe
+VIDEO_BUFFER_FRAMES = 8
+
+# Clipes mantidos abertos: o da pergunta atual e os das perguntas vizinhas
+VIDEO_OPEN_CLIPS = 3
+
+# Profundidade máxima da pilha do botão voltar
+NAVIGATION_HISTORY_DEPTH = 50
+
+# Pré-carrega as imagens das perguntas mais prováveis segundo o histórico de navegação
+PREDICTIVE_PREFETCH = True
+
+# Quantas perguntas prováveis são pré-carregadas a cada navegação
+PREDICTIVE_PREFETCH_TOP_K = 3
+
+# Número máximo de textos renderizados mantidos no cache de textos
+TEXT_CACHE_ENTRIES = 512
+
+# Banco SQLite das respostas das consultas, no diretório de dados do app
+ANSWERS_DATABASE = 'respostas.sqlite3'
+
+# As respostas são gravadas em lotes de até ANSWERS_BATCH_SIZE operações,
+# esperando até ANSWERS_FLUSH_INTERVAL segundos para juntar um lote
+ANSWERS_BATCH_SIZE = 50
+ANSWERS_FLUSH_INTERVAL = 0.5
+
+# Transição entre telas: 'none', 'fade', 'slide' ou 'auto' (escolhida pelo
+# tempo de quadro medido na inicialização, entre 'slide' e 'none')
+TRANSITION_PROFILE = 'auto'
+
+TRANSITION_DURATION = 0.4
+
+# Quadros medidos na inicialização no modo 'auto'
+TRANSITION_PROBE_FRAMES = 30
+
+# Tempo de quadro máximo (mediana) para manter a transição deslizante
+TRANSITION_SLIDE_MAX_FRAME_MS = 25
+
+# Número máximo de resultados exibidos na tela de busca
+SEARCH_MAX_RESULTS = 20
+
+# Tamanho máximo das imagens no resumo exportado da consulta
+EXPORT_IMAGE_SIZE = (112, 200)
+
+# Servidor da clínica que recebe as consultas finalizadas (ver sync.py), ex.:
+# 'https://prontuario.exemplo/acesso/consultas'; None desativa o envio
+SYNC_URL = None
+
+# Consultas por lote e tamanho de cada pedaço enviado
+SYNC_BATCH_SIZE = 20
+SYNC_CHUNK_BYTES = 64 * 1024
+
+# Segundos sem toques na tela antes de enviar cada pedaço
+SYNC_IDLE_SECONDS = 2
+
+# Intervalo (s) entre verificações de consultas pendentes
+SYNC_INTERVAL = 60
+
+# Espera entre tentativas após uma falha: dobra de SYNC_RETRY_MIN até SYNC_RETRY_MAX
+SYNC_RETRY_MIN = 2
+SYNC_RETRY_MAX = 300
+
+# Tempo máximo (s) de cada requisição
+SYNC_TIMEOUT = 15
+
+# Modo de duas telas (ver mirror.py): None, 'leader' (app do médico) ou
+# 'follower' (app que espelha a pergunta para o paciente)
+MIRROR_MODE = None
+
+# Endereço em que o líder aceita seguidores (só janelas no mesmo aparelho;
+# '0.0.0.0' para aceitar outro aparelho na rede) e endereço do líder usado
+# pelo seguidor
+MIRROR_BIND_HOST = '127.0.0.1'
+MIRROR_LEADER_HOST = '127.0.0.1'
+MIRROR_PORT = 8765
+
+# Senha compartilhada entre líder e seguidor (ou ACESSO_MIRROR_TOKEN).
+# Obrigatória: sem ela o modo de duas telas não é ativado
+MIRROR_TOKEN = None
+
+# Tempo (s) que o líder espera a senha de um seguidor recém-conectado
+MIRROR_HELLO_TIMEOUT = 5
+
+# Enviar também a resposta do paciente ao seguidor. Desligado: o seguidor
+# mostra só a tela e a pergunta, e nenhuma resposta trafega pela rede
+MIRROR_ANSWERS = False
+
+# Intervalo (s) entre tentativas de conexão do seguidor
+MIRROR_RETRY_INTERVAL = 1.0
+
+# Medições de latência mantidas pelo líder
+MIRROR_LATENCY_SAMPLES = 1000
+
+# Instrumentação de navegação, popups e imagens (ver instrumentation.py)
+INSTRUMENTATION = False
+
+# Número de eventos mantidos no buffer circular em memória
+INSTRUMENTATION_BUFFER_SIZE = 1000
+
+# Grava os eventos em instrumentacao.jsonl no diretório de dados do app
+INSTRUMENTATION_FILE = True
+
+# Tamanho máximo de cada arquivo JSONL e quantos arquivos antigos manter
+INSTRUMENTATION_FILE_BYTES = 1024 * 1024
+INSTRUMENTATION_FILE_BACKUPS = 3
+
+# Perguntas respondidas tocando no mapa do corpo (body_map.py) em vez da imagem
+MAPA_CORPORAL_PERGUNTAS = ['HMA_local', 'HMA_decalogo_dor_local']
+
+# Perguntas de escala (ESCALAS, no fim do arquivo) são desenhadas por scale.py
+# no lugar da imagem
+
+# Resolução da grade de regiões do mapa do corpo usada para achar a região tocada
+MAPA_CORPORAL_GRADE = (100, 200)
+
+# Cores das regiões do mapa do corpo: normal, selecionada e contorno
+MAPA_CORPORAL_COR = "#D9EFEC"
+MAPA_CORPORAL_COR_SELECIONADA = "#E4572E"
+MAPA_CORPORAL_COR_CONTORNO = "#06AB98"
+
 RELACAO_IMAGENS_TEXTOS = {
 "identificacao_nome" : ["qual é seu nome?"],
 "identificacao_idade" : ["qual é sua idade?"],
@@ -28,7 +201,7 @@ RELACAO_IMAGENS_TEXTOS = {
 "HMA_desencadeante" : ["o que você acha que causou o problema?"],
 "HMA_agravante" : ["o que piora o problema?"],
 "HMA_atenuante" : ["o que melhora o problema?"],
-"HMA_medicamentos_nao_cronicos" : ["você tomou alguma medicação para o seu problema?"],
+"HMA_medicamentos_nao_cronicos_tipo" : ["você tomou alguma medicação para o seu problema?"],
 "HMA_medicamentos_nao_cronicos_dose" : ["qual a dose do medicamento?"],
 "HMA_medicamentos_nao_cronicos_posologia" : ["tomou quantas vezes ao dia?"],
 "HMA_decalogo_dor_local" : ["onde dói?"],
@@ -42,7 +215,7 @@ RELACAO_IMAGENS_TEXTOS = {
 "HMA_decalogo_dor_fatores_atenuantes" : ["o que melhora a dor?"],
 "HMA_decalogo_dor_fatores_agravantes" : ["o que piora a dor?"],
 "HMA_decalogo_dor_sintomas_associados" : ["sente mais alguma coisa?"],
-"HPP_cirurgias" : ["você já fez alguma cirurgia?"],
+"HPP_cirurgias_sim_nao" : ["você já fez alguma cirurgia?"],
 "HPP_cirurgias_quantidade" : ["quantas cirurgias você fez?"],
 "HPP_alergias" : ["você tem alguma alergia?"],
 "HPP_DCNT" : ["você tem alguma doença crônica?"],
@@ -98,4 +271,228 @@ RELACAO_IMAGENS_TEXTOS = {
 "revisao_sistemas_neurologico" : ["você tem/teve algum sintoma parecido?"],
 "revisao_sistemas_osteomuscular" : ["você tem/teve algum sintoma parecido?"],
 "revisao_sistemas_hematologico" : ["você tem/teve algum sintoma parecido?"],
-}
\ No newline at end of file
+}
+
+# Árvore de telas da anamnese: nome da tela -> título e botões. O destino de
+# cada botão é outra tela da árvore (ou 'about_screen') ou uma chave de
+# RELACAO_IMAGENS_TEXTOS, que abre a imagem da pergunta
+ARVORE_TELAS = {
+# Home Screen
+"home_screen" : {"titulo": "ACESSO", "voltar": False, "botoes": [
+    ["INICIAR", "starting_screen"],
+    ["BUSCAR PERGUNTA", "search_screen"],
+    ["SOBRE O APP", "about_screen"],
+]},
+# Level 1 Screens
+"starting_screen" : {"titulo": "SELECIONE A ETAPA DA ENTREVISTA", "botoes": [
+    ["IDENTIFICAÇÃO", "identificacao"],
+    ["QUEIXA PRINCIPAL", "queixa_principal"],
+    ["HMA", "HMA"],
+    ["HISTÓRIA PREGRESSA", "HPP"],
+    ["HISTÓRIA FISIOLÓGICA", "Hfisio"],
+    ["HISTÓRIA FAMILIAL", "Hfamilial"],
+    ["HISTÓRIA FAMILIAR", "Hfamiliar"],
+    ["HISTÓRIA PSICOSSOCIAL", "Hpsico"],
+    ["USO DE SUBSTÂNCIAS", "subst"],
+    ["HÁBITOS DE VIDA", "habitos"],
+    ["REVISÃO DE SISTEMAS", "revisao_sistemas"],
+    ["EXPORTAR RESUMO", "exportar_resumo"],
+]},
+# Level 2 Screens
+"identificacao" : {"titulo": "IDENTIFICAÇÃO", "botoes": [
+    ["NOME", "identificacao_nome"],
+    ["IDADE", "identificacao_idade"],
+    ["NATURALIDADE", "identificacao_naturalidade"],
+    ["ESTADO CIVIL", "identificacao_estado_civil"],
+    ["PROFISSÃO", "identificacao_profissao"],
+]},
+"queixa_principal" : {"titulo": "QUEIXA PRINCIPAL", "botoes": [
+    ["PERGUNTA ABERTA", "queixa_principal_pergunta_aberta"],
+    # Sem imagem ainda: volta para a árvore quando ela for desenhada
+    # ["IMAGENS AUXILIARES", "queixa_principal_imagens_auxiliares"],
+]},
+"HMA" : {"titulo": "HMA", "botoes": [
+    ["INÍCIO DOS SINTOMAS", "HMA_inicio"],
+    ["LOCAL DOS SINTOMAS", "HMA_local"],
+    ["EVOLUÇÃO DOS SINTOMAS", "HMA_evolucao"],
+    ["IRRADIAÇÃO DOS SINTOMAS", "HMA_irradiacao"],
+    ["SINTOMAS ASSOCIADOS", "HMA_sintomas"],
+    ["FATOR DESENCADEANTE", "HMA_desencadeante"],
+    ["FATOR AGRAVANTE", "HMA_agravante"],
+    ["FATOR ATENUANTE", "HMA_atenuante"],
+    ["MEDICAMENTOS NÃO CRÔNICOS", "HMA_medicamentos_nao_cronicos"],
+    # ["DECÁLOGO DA DOR", "HMA_decalogo"],
+]},
+"HPP" : {"titulo": "HPP", "botoes": [
+    ["CIRURGIAS", "HPP_cirurgias"],
+    ["ALERGIAS", "HPP_alergias"],
+    ["DCNT", "HPP_DCNT"],
+    ["MEDICAMENTOS CRÔNICOS", "HPP_medicamentos_cronicos"],
+    ["CALENDÁRIO VACINAL", "HPP_vacinacao"],
+]},
+"Hfisio" : {"titulo": "HISTÓRIA FISIOLÓGICA", "botoes": [
+    ["DUM", "Hfisio_DUM"],
+    ["RELAÇÃO SEXUAL", "Hfisio_relacao_sexual"],
+    ["GESTAÇÃO", "Hfisio_gestacao"],
+    ["EXAMES PREVENTIVOS", "Hfisio_exames_preventivos"],
+    ["MENOPAUSA", "Hfisio_menopausa"],
+    ["PUBERDADE", "Hfisio_puberdade"],
+]},
+"Hfamilial" : {"titulo": "HISTÓRIA FAMILIAL", "botoes": [
+    ["DOENÇAS NO TRABALHO", "Hfamilial_trabalho"],
+    ["DOENÇAS NA ESCOLA", "Hfamilial_escola"],
+]},
+"Hfamiliar" : {"titulo": "HISTÓRIA FAMILIAR", "botoes": [
+    ["DCNT", "Hfamiliar_DCNT"],
+    ["ÓBITOS", "Hfamiliar_obitos"],
+]},
+"Hpsico" : {"titulo": "HISTÓRIA PSICOSSOCIAL", "botoes": [
+    ["RENDA FAMILIAR", "Hpsico_renda"],
+    ["RELIGIÃO", "Hpsico_religiao"],
+    ["ESCOLARIDADE", "Hpsico_escolaridade"],
+    ["HABITAÇÃO", "Hpsico_habitacao"],
+    ["RELAÇÕES FAMILIARES", "Hpsico_relacoes"],
+]},
+"subst" : {"titulo": "HISTÓRIA PSICOSSOCIAL", "botoes": [
+    ["ÁLCOOL", "subst_alcool"],
+    ["TABACO", "subst_tabaco"],
+    ["DROGAS ILÍCITAS", "subst_drogas_ilicitas"],
+]},
+"habitos" : {"titulo": "HÁBITOS DE VIDA", "botoes": [
+    ["ATIVIDADE FÍSICA", "habitos_atividade_fisica"],
+    ["SONO", "habitos_sono"],
+    ["ALIMENTAÇÃO", "habitos_alimentacao"],
+    ["HIGIENE", "habitos_higiene"],
+]},
+"revisao_sistemas" : {"titulo": "HÁBITOS DE VIDA", "botoes": [
+    ["CARDIOVASCULAR", "revisao_sistemas_cardiovascular"],
+    ["RESPIRAÇÃO", "revisao_sistemas_respiratorio"],
+    ["TGI", "revisao_sistemas_TGI"],
+    ["UROGENITAL", "revisao_sistemas_urogenital"],
+    ["NEUROLÓGICO", "revisao_sistemas_neurologico"],
+    ["HEMATOLÓGICO", "revisao_sistemas_hematologico"],
+    ["ENDÓCRINO", "revisao_sistemas_endocrino"],
+    ["OSTEOMUSCULAR", "revisao_sistemas_osteomuscular"],
+]},
+# Level 3 Screens
+"HMA_medicamentos_nao_cronicos" : {"titulo": "MEDICAMENTOS NÃO CRÔNICOS", "botoes": [
+    ["MEDICAMENTO", "HMA_medicamentos_nao_cronicos_tipo"],
+    # Sem imagem ainda: voltam para a árvore quando forem desenhadas
+    # ["DOSE", "HMA_medicamentos_nao_cronicos_dose"],
+    # ["POSOLOGIA", "HMA_medicamentos_nao_cronicos_posologia"],
+]},
+"HMA_decalogo" : {"titulo": "DECÁLOGO DA DOR", "botoes": [
+    ["LOCALIZAÇÃO", "HMA_decalogo_dor_local"],
+    ["IRRADIAÇÃO", "HMA_decalogo_dor_irradiacao"],
+    ["QUALIDADE", "HMA_decalogo_dor_qualidade"],
+    ["INTENSIDADE", "HMA_decalogo_dor_intensidade"],
+    ["DURAÇÃO", "HMA_decalogo_dor_duracao"],
+    ["EVOLUÇÃO", "HMA_decalogo_dor_evolucao"],
+    ["RELAÇÃO COM FUNÇÕES ORGÂNICAS", "HMA_decalogo_dor_funcoes_organicas"],
+    ["FATOR DESENCADEANTE", "HMA_decalogo_dor_fatores_desencadeantes"],
+    ["FATOR AGRAVANTE", "HMA_decalogo_dor_fatores_agravantes"],
+    ["FATOR ATENUANTE", "HMA_decalogo_dor_fatores_atenuantes"],
+    ["SINTOMAS ASSOCIADOS", "HMA_decalogo_dor_sintomas_associados"],
+]},
+"HPP_cirurgias" : {"titulo": "CIRURGIAS", "botoes": [
+    ["FEZ OU NÃO", "HPP_cirurgias_sim_nao"],
+    ["QUANTIDADE", "HPP_cirurgias_quantidade"],
+]},
+"HPP_medicamentos_cronicos" : {"titulo": "MEDICAMENTOS CRÔNICOS", "botoes": [
+    ["MEDICAMENTO", "HPP_medicamentos_cronicos_tipo"],
+    ["DOSE", "HPP_medicamentos_cronicos_dose"],
+    ["POSOLOGIA", "HPP_medicamentos_cronicos_posologia"],
+]},
+"Hfisio_relacao_sexual" : {"titulo": "RELAÇÃO SEXUAL", "botoes": [
+    ["PRATICA OU NÃO", "Hfisio_relacao_sexual_sim_nao"],
+    ["FREQUÊNCIA", "Hfisio_relacao_sexual_frequencia"],
+    ["PARCEIROS", "Hfisio_relacao_sexual_parceiros"],
+    ["CONTRACEPTIVOS", "Hfisio_relacao_sexual_contraceptivos"],
+]},
+"Hfisio_gestacao" : {"titulo": "GESTAÇÃO", "botoes": [
+    ["QUANTIDADE", "Hfisio_gestacoes_quantidade"],
+    ["TIPO DE PARTO", "Hfisio_gestacoes_partos"],
+    ["ABORTAMENTOS", "Hfisio_gestacoes_abortos"],
+]},
+"Hfisio_exames_preventivos" : {"titulo": "EXAMES PREVENTIVOS", "botoes": [
+    ["CITOPATOLÓGICO", "Hfisio_exames_preventivos_citopatologico"],
+    ["MAMOGRAFIA", "Hfisio_exames_preventivos_mamografia"],
+]},
+"Hfisio_menopausa" : {"titulo": "MENOPAUSA", "botoes": [
+    ["INÍCIO", "Hfisio_menopausa_inicio"],
+    ["SINTOMAS", "Hfisio_menopausa_sintomas"],
+]},
+"Hfisio_puberdade" : {"titulo": "PUBERDADE", "botoes": [
+    ["MENARCA", "Hfisio_puberdade_menarca"],
+    ["TELARCA", "Hfisio_puberdade_telarca"],
+    ["PUBARCA", "Hfisio_puberdade_pubarca"],
+    # ["SEXARCA", "Hfisio_puberdade_sexarca"],
+]},
+"Hpsico_habitacao" : {"titulo": "HABITAÇÃO", "botoes": [
+    ["LOCAL", "Hpsico_habitacao_local"],
+    ["CONDIÇÕES", "Hpsico_habitacao_condicoes"],
+    ["SANEAMENTO", "Hpsico_habitacao_saneamento"],
+]},
+"subst_alcool" : {"titulo": "ÁLCOOL", "botoes": [
+    ["FAZ USO", "subst_alcool_uso"],
+    ["INÍCIO DO USO", "subst_alcool_inicio"],
+    ["DOSE", "subst_alcool_quantidade"],
+]},
+"subst_tabaco" : {"titulo": "TABACO", "botoes": [
+    ["FAZ USO", "subst_tabaco_uso"],
+    ["INÍCIO DO USO", "subst_tabaco_inicio"],
+    ["DOSE", "subst_tabaco_quantidade"],
+]},
+"subst_drogas_ilicitas" : {"titulo": "DROGAS ILÍCITAS", "botoes": [
+    ["FAZ USO", "subst_drogas_ilicitas_uso"],
+    ["INÍCIO DO USO", "subst_drogas_ilicitas_inicio"],
+    ["DOSE", "subst_drogas_ilicitas_quantidade"],
+]},
+}
+
+# Regiões do mapa do corpo (vista de frente: o lado direito do paciente fica
+# à esquerda da tela), como polígonos convexos em uma figura de
+# MAPA_CORPORAL_TAMANHO unidades com a origem embaixo à esquerda. Em
+# sobreposições vale a região que vem depois
+MAPA_CORPORAL_TAMANHO = (100, 200)
+
+MAPA_CORPORAL = [
+    ["cabeça", [[44, 195], [56, 195], [61, 188], [61, 176], [56, 169], [44, 169], [39, 176], [39, 188]]],
+    ["pescoço", [[45, 169], [55, 169], [55, 161], [45, 161]]],
+    ["tórax direito", [[30, 161], [50, 161], [50, 130], [32, 130]]],
+    ["tórax esquerdo", [[50, 161], [70, 161], [68, 130], [50, 130]]],
+    ["abdome superior", [[32, 130], [68, 130], [67, 112], [33, 112]]],
+    ["abdome inferior", [[33, 112], [67, 112], [66, 96], [34, 96]]],
+    ["pelve", [[34, 96], [66, 96], [62, 84], [38, 84]]],
+    ["braço direito", [[18, 156], [30, 161], [29, 128], [19, 126]]],
+    ["braço esquerdo", [[81, 126], [71, 128], [70, 161], [82, 156]]],
+    ["antebraço direito", [[19, 126], [29, 128], [27, 98], [18, 97]]],
+    ["antebraço esquerdo", [[82, 97], [73, 98], [71, 128], [81, 126]]],
+    ["mão direita", [[18, 97], [27, 98], [27, 86], [17, 86]]],
+    ["mão esquerda", [[83, 86], [73, 86], [73, 98], [82, 97]]],
+    ["coxa direita", [[38, 84], [50, 84], [49, 52], [38, 52]]],
+    ["coxa esquerda", [[62, 52], [51, 52], [50, 84], [62, 84]]],
+    ["perna direita", [[38, 52], [49, 52], [48, 14], [40, 14]]],
+    ["perna esquerda", [[60, 14], [52, 14], [51, 52], [62, 52]]],
+    ["pé direito", [[40, 14], [48, 14], [49, 4], [34, 4]]],
+    ["pé esquerdo", [[66, 4], [51, 4], [52, 14], [60, 14]]],
+]
+
+# Perguntas de escala: opções na ordem da escala, cores do início ao fim
+# (interpoladas entre as opções) e, opcionalmente, os rótulos das extremidades
+ESCALAS = {
+"HMA_decalogo_dor_intensidade" : {"opcoes": ["0", "1", "2", "3", "4", "5", "6", "7", "8", "9", "10"],
+    "cores": ["#43A047", "#FDD835", "#E53935"], "extremos": ["sem dor", "pior dor"]},
+"HMA_evolucao" : {"opcoes": ["melhorou", "ficou igual", "piorou"],
+    "cores": ["#43A047", "#FDD835", "#E53935"]},
+"HPP_cirurgias_quantidade" : {"opcoes": ["0", "1", "2", "3", "4", "5+"],
+    "cores": ["#D9EFEC", "#06AB98"], "extremos": ["nenhuma", "5 ou mais"]},
+"Hfisio_gestacoes_quantidade" : {"opcoes": ["0", "1", "2", "3", "4", "5+"],
+    "cores": ["#D9EFEC", "#06AB98"], "extremos": ["nenhuma", "5 ou mais"]},
+"subst_alcool_quantidade" : {"opcoes": ["menos de 1 dose por semana", "1 a 7 doses por semana", "8 a 14 doses por semana", "mais de 14 doses por semana"],
+    "cores": ["#D9EFEC", "#06AB98"]},
+"subst_tabaco_quantidade" : {"opcoes": ["menos de 5 por dia", "5 a 10 por dia", "11 a 20 por dia", "mais de 20 por dia"],
+    "cores": ["#D9EFEC", "#06AB98"]},
+"subst_drogas_ilicitas_quantidade" : {"opcoes": ["raramente", "todo mês", "toda semana", "todo dia"],
+    "cores": ["#D9EFEC", "#06AB98"]},
+}
@@ -0,0 +1,141 @@
+# export.py
+import base64
+import html
+import os
+import threading
+import time
+
+from kivy.clock import Clock
+from kivy.utils import get_hex_from_color
+
+import constants
+from body_map import ANSWER_SEPARATOR
+from bundle import get_bundle
+from scale import scale_colors
+from textures import get_variant_manifest, pick_variant
+
+# Tamanho de leitura das imagens embutidas (múltiplo de 3, para que cada
+# pedaço vire base64 sem preenchimento no meio do arquivo)
+IMAGE_CHUNK_BYTES = 3 * 16 * 1024
+
+def section_questions(tree, screen_name, seen=None):
+    # Perguntas de uma seção na ordem dos botões, descendo pelas subtelas
+    seen = set() if seen is None else seen
+    seen.add(screen_name)
+    for _, target in tree[screen_name].button_texts:
+        if target in constants.RELACAO_IMAGENS_TEXTOS:
+            yield target
+        elif target in tree and target not in seen:
+            yield from section_questions(tree, target, seen)
+
+def export_image_source(question_key):
+    # Variante reduzida da imagem (miniatura), ou a original sem as variantes
+    entry = get_variant_manifest().get(question_key)
+    if entry:
+        return pick_variant(entry, *constants.EXPORT_IMAGE_SIZE)
+    return f'{constants.IMAGES_DIR}/{question_key}.jpg'
+
+def image_chunks(source):
+    # Pedaços da imagem, do pacote de imagens ou do arquivo solto
+    bundle = get_bundle()
+    if bundle is not None and source in bundle:
+        yield from bundle.chunks(source, IMAGE_CHUNK_BYTES)
+    elif os.path.exists(source):
+        with open(source, 'rb') as image:
+            yield from iter(lambda: image.read(IMAGE_CHUNK_BYTES), b'')
+
+def write_image(f, source):
+    # Embute a imagem em base64 aos pedaços: só um pedaço fica na memória
+    chunks = image_chunks(source)
+    first = next(chunks, None)
+    if first is None:
+        return
+    f.write('<img src="data:image/jpeg;base64,')
+    f.write(base64.b64encode(first).decode('ascii'))
+    for chunk in chunks:
+        f.write(base64.b64encode(chunk).decode('ascii'))
+    f.write('">')
+
+def write_scale(f, spec, answer):
+    # Escala como o paciente viu: as opções nas cores da escala, a escolhida em destaque
+    f.write('<div class="escala">')
+    for option, color in zip(spec['opcoes'], scale_colors(spec['cores'], len(spec['opcoes']))):
+        selected = ' escolhida' if option == answer else ''
+        f.write(f'<span class="opcao{selected}" style="background:{get_hex_from_color(color[:3])}">'
+                f'{html.escape(option)}</span>')
+    f.write('</div>')
+
+def write_body_map(f, answer):
+    # Mapa do corpo em SVG com as regiões escolhidas preenchidas
+    names = set(answer.split(ANSWER_SEPARATOR)) if answer else set()
+    width, height = constants.MAPA_CORPORAL_TAMANHO
+    f.write(f'<svg viewBox="0 0 {width} {height}" width="{constants.EXPORT_IMAGE_SIZE[0]}">')
+    for name, points in constants.MAPA_CORPORAL:
+        # No mapa o y cresce para cima; no SVG, para baixo
+        coords = ' '.join(f'{x},{height - y}' for x, y in points)
+        fill = constants.MAPA_CORPORAL_COR_SELECIONADA if name in names else constants.MAPA_CORPORAL_COR
+        f.write(f'<polygon points="{coords}" fill="{fill}" stroke="{constants.MAPA_CORPORAL_COR_CONTORNO}">'
+                f'<title>{html.escape(name)}</title></polygon>')
+    f.write('</svg>')
+
+def write_question_figure(f, question_key, answer):
+    # O que o paciente viu no popup: a escala ou o mapa do corpo com a
+    # resposta marcada, ou a imagem da pergunta
+    if question_key in constants.ESCALAS:
+        write_scale(f, constants.ESCALAS[question_key], answer)
+    elif question_key in constants.MAPA_CORPORAL_PERGUNTAS:
+        write_body_map(f, answer)
+    else:
+        write_image(f, export_image_source(question_key))
+
+def write_summary(store, consultation_id, tree, path):
+    # Gera o resumo em HTML seção por seção (ordem da starting_screen),
+    # gravando cada seção no disco antes de montar a próxima
+    store.flush()
+    answers = store.answers(consultation_id)
+    tmp_path = f'{path}.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write('<!DOCTYPE html>\n<html lang="pt-BR"><head><meta charset="utf-8">'
+                '<title>Resumo da consulta</title><style>'
+                'body{font-family:sans-serif;max-width:800px;margin:auto}'
+                '.pergunta{display:flex;gap:16px;align-items:center;page-break-inside:avoid;margin:8px 0}'
+                'img{width:%dpx}svg{flex:none}'
+                '.escala{display:flex;flex-wrap:wrap;gap:2px;width:%dpx;flex:none}'
+                '.opcao{padding:4px 6px;border-radius:4px;font-size:12px}'
+                '.escolhida{outline:3px solid %s;font-weight:bold}</style></head><body>\n'
+                % (constants.EXPORT_IMAGE_SIZE[0], 2 * constants.EXPORT_IMAGE_SIZE[0], constants.BUTTON_BACKGROUND_COLOR))
+        started = min((answered_at for _, answered_at in answers.values()), default=time.time())
+        f.write(f'<h1>Resumo da consulta</h1><p>{time.strftime("%d/%m/%Y %H:%M", time.localtime(started))}</p>\n')
+
+        for section_title, section in tree['starting_screen'].button_texts:
+            if section not in tree:
+                continue
+            questions = [key for key in section_questions(tree, section) if key in answers]
+            if not questions:
+                continue
+            f.write(f'<h2>{html.escape(section_title)}</h2>\n')
+            for question_key in questions:
+                answer, _ = answers[question_key]
+                f.write('<div class="pergunta">')
+                write_question_figure(f, question_key, answer)
+                question_text = constants.RELACAO_IMAGENS_TEXTOS[question_key][0]
+                f.write(f'<div><p><b>{html.escape(question_text.capitalize())}</b></p>'
+                        f'<p>{html.escape(answer)}</p></div></div>\n')
+            f.flush()
+        f.write('</body></html>\n')
+    os.replace(tmp_path, path)
+    return path
+
+def export_summary(store, consultation_id, tree, path, callback):
+    # Roda write_summary em uma thread; callback(path, error) é chamado na
+    # thread principal quando o arquivo estiver pronto
+    def run():
+        try:
+            result, error = write_summary(store, consultation_id, tree, path), None
+        except Exception as e:
+            result, error = None, e
+        Clock.schedule_once(lambda dt: callback(result, error), 0)
+
+    thread = threading.Thread(target=run, name='export', daemon=True)
+    thread.start()
+    return thread
@@ -0,0 +1,102 @@
+# instrumentation.py
+#
+# Medições de navegação, popups e imagens para uso em campo: cada evento
+# (com a duração em ms, quando medido) vai para um buffer circular em
+# memória e, opcionalmente, para um arquivo JSONL com rotação. Ativado por
+# constants.INSTRUMENTATION ou pela variável de ambiente ACESSO_INSTRUMENTATION
+# (com o caminho do arquivo JSONL):
+#     ACESSO_INSTRUMENTATION=eventos.jsonl python main.py
+# Desativado, cada ponto medido custa apenas a checagem de `enabled`
+import json
+import logging
+import logging.handlers
+import os
+import threading
+import time
+from collections import deque
+
+import constants
+
+log_path = os.environ.get('ACESSO_INSTRUMENTATION')
+enabled = constants.INSTRUMENTATION or bool(log_path)
+
+events = deque(maxlen=constants.INSTRUMENTATION_BUFFER_SIZE)
+counters = {}
+# Protege counters: timed() também é chamado das threads de decodificação
+lock = threading.Lock()
+file_logger = None
+
+def configure(log_file=None, max_bytes=constants.INSTRUMENTATION_FILE_BYTES,
+              backup_count=constants.INSTRUMENTATION_FILE_BACKUPS):
+    # Liga a instrumentação; com log_file os eventos também são gravados em
+    # JSONL, com rotação a cada max_bytes (mantendo backup_count arquivos)
+    global enabled, file_logger
+    enabled = True
+    if log_file and file_logger is None:
+        handler = logging.handlers.RotatingFileHandler(
+            log_file, maxBytes=max_bytes, backupCount=backup_count, encoding='utf-8')
+        handler.setFormatter(logging.Formatter('%(message)s'))
+        file_logger = logging.getLogger('acesso.instrumentation')
+        file_logger.setLevel(logging.INFO)
+        file_logger.propagate = False
+        file_logger.addHandler(handler)
+
+def count(name, amount=1):
+    if enabled:
+        with lock:
+            counters[name] = counters.get(name, 0) + amount
+
+def event(name, **info):
+    # Evento pontual (ex.: início de sessão com os dados do aparelho)
+    if enabled:
+        record(dict(name=name, time=round(time.time(), 3), **info))
+
+def record(entry):
+    # deque.append é atômico: pode ser chamado das threads de decodificação
+    events.append(entry)
+    if file_logger is not None:
+        file_logger.info(json.dumps(entry, ensure_ascii=False))
+
+class timer(object):
+    # Mede a duração de um bloco e conta as ocorrências:
+    # with instrumentation.timer('go_to_screen', screen=...)
+    def __init__(self, name, **info):
+        self.name = name
+        self.info = info
+
+    def __enter__(self):
+        if enabled:
+            self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        if enabled and hasattr(self, 'start'):
+            timed(self.name, (time.perf_counter() - self.start) * 1000, **self.info)
+        return False
+
+def timed(name, ms, **info):
+    # Registra uma duração já medida (usado também por profiling.timer)
+    with lock:
+        counters[name] = counters.get(name, 0) + 1
+    record(dict(name=name, time=round(time.time(), 3), ms=round(ms, 2), **info))
+
+def recent(name=None, limit=None):
+    # Eventos mais recentes do buffer, opcionalmente filtrados pelo nome
+    result = [entry for entry in events if name is None or entry['name'] == name]
+    return result[-limit:] if limit else result
+
+def stats():
+    # Por nome: número de medições no buffer, média e máximo em ms
+    durations = {}
+    for entry in list(events):
+        if 'ms' in entry:
+            durations.setdefault(entry['name'], []).append(entry['ms'])
+    with lock:
+        counter_values = dict(counters)
+    return {
+        'counters': counter_values,
+        'timers': {
+            name: {'count': len(values), 'mean_ms': round(sum(values) / len(values), 2), 'max_ms': max(values)}
+            for name, values in durations.items()
+        },
+    }
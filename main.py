@@ -1,85 +1,521 @@
 # main.py
+import os
+import time
+
+import profiling
+import instrumentation
+
+if profiling.enabled:
+    # Modo benchmark (CI): janela fora da tela e sem interpretar os argumentos
+    os.environ.setdefault('SDL_VIDEODRIVER', 'offscreen')
+    os.environ.setdefault('KIVY_NO_ARGS', '1')
+
+import kivy
 from kivy.core.window import Window
+from kivy.logger import Logger
+from kivy.utils import platform
 from kivy.app import App
+from kivy.clock import Clock
+from kivy.core.image import Image as CoreImage
+from kivy.graphics import Color, Rectangle
+from kivy.uix.image import Image
 from kivy.uix.screenmanager import ScreenManager
+profiling.mark('kivy_imported')
 from screens import *
+from textures import texture_cache, text_cache, preload_thumbnails
+from prediction import TransitionModel
+from navigation import NavigationHistory, section_paths
+from answers import AnswerStore
+from export import export_summary
+from transitions import FrameProbe, make_transition, profile_for_frame_time
+from video import get_clip_pool
+from mirror import MirrorFollower, MirrorLeader, mirror_config
+from sync import SyncEngine
+profiling.mark('screens_imported')
+
+import constants
 
 # Set the window size to a typical self.screen_managerartphone size
-Window.size = (450, 800)
+Window.size = constants.WINDOW_SIZE
+
+# Registro nome da tela -> fábrica, gerado a partir da árvore de telas
+# (constants.ARVORE_TELAS). As telas só são construídas na primeira vez em
+# que são visitadas (ou pré-carregadas quando o app está ocioso)
+SCREEN_FACTORIES = screen_factories()
 
 class CustomScreenManager(ScreenManager):
-    def __init__(self, **kwargs):
+    def __init__(self, screen_factories=None, screen_specs=None, recycle_pool_size=0, answer_store=None, export_dir=None, **kwargs):
         super(CustomScreenManager, self).__init__(**kwargs)
-        self.screen_stack = []
+        # Pilha de telas do botão voltar, limitada e sem repetições
+        self.history = NavigationHistory(constants.NAVIGATION_HISTORY_DEPTH)
+        # Caminho de cada seção a partir da tela inicial (jump_to_section)
+        self.paths = None
+        self.screen_factories = dict(screen_factories or {})
+        self.prefetch_queue = []
+        self.prefetch_event = None
+
+        # Modo de reciclagem: no máximo recycle_pool_size MenuScreens existem ao
+        # mesmo tempo, e são reaproveitadas para as telas da árvore (screen_specs)
+        self.screen_specs = screen_specs or {}
+        # Pelo menos 2: a tela atual nunca é reaproveitada, então com 1 não
+        # haveria o que reciclar
+        self.recycle_pool_size = max(recycle_pool_size, 2) if recycle_pool_size else 0
+        self.last_used = {}
+        self.navigation_count = 0
+
+        # Modelo de transições (tela/pergunta -> próxima pergunta), usado para
+        # pré-carregar as imagens mais prováveis enquanto o médico está na tela
+        self.transition_model = TransitionModel()
+        self.last_question_key = None
+
+        # Respostas da consulta em andamento. A consulta começa na primeira
+        # resposta e termina ao voltar para a tela inicial
+        self.answer_store = answer_store
+        self.consultation_id = None
+        self.current_answers = {}
+        # Pasta dos resumos exportados
+        self.export_dir = export_dir
+        # Modo de duas telas: MirrorLeader que recebe a tela e a pergunta
+        # atuais (app do médico), ou None
+        self.mirror = None
+        self.mirrored_question = None
+        # Envio das consultas finalizadas ao servidor da clínica (sync.py), ou None
+        self.sync = None
+
+        # Fundo único compartilhado por todas as telas: a imagem é
+        # decodificada e enviada à GPU uma só vez, independente do número de telas
+        self.background_texture = CoreImage(constants.BACKGROUND_IMAGE).texture
+        with self.canvas.before:
+            Color(1, 1, 1, 1)
+            self.background = Rectangle(texture=self.background_texture, pos=self.pos, size=self.size)
+        self.bind(pos=self.update_background, size=self.update_background)
+
+    def update_background(self, *args):
+        self.background.pos = self.pos
+        self.background.size = self.size
+
+    def texture_report(self):
+        # Conta as texturas distintas usadas pelas telas já construídas
+        textures = {id(self.background_texture)}
+        image_widgets = 0
+        for screen in self.screens:
+            for widget in screen.walk(restrict=True):
+                if isinstance(widget, Image) and widget.texture is not None:
+                    image_widgets += 1
+                    textures.add(id(widget.texture))
+        return {
+            'screens': len(self.screens),
+            'image_widgets': image_widgets,
+            'textures': len(textures),
+        }
+
+    def widget_report(self):
+        # Conta os widgets mantidos vivos pelas telas
+        widgets = 0
+        for screen in self.screens:
+            widgets += sum(1 for _ in screen.walk(restrict=True))
+        return {
+            'screens': len(self.screens),
+            'widgets': widgets,
+        }
+
+    def register_screen(self, name, factory):
+        self.screen_factories[name] = factory
+
+    def ensure_screen(self, name):
+        # Constrói a tela na primeira vez em que ela é necessária
+        if self.has_screen(name):
+            return
+
+        if self.recycle_pool_size and name in self.screen_specs:
+            pool = [screen for screen in self.screens if isinstance(screen, MenuScreen)]
+            if len(pool) >= self.recycle_pool_size and self.recycle_screen(pool, name):
+                return
+
+        if name in self.screen_factories:
+            with profiling.timer('screen', screen=name):
+                self.add_widget(self.screen_factories[name](name=name))
+
+    def recycle_screen(self, pool, name):
+        # Reaproveita a MenuScreen usada há mais tempo (nunca a tela atual).
+        # False se não há nenhuma além da atual: a tela é construída
+        candidates = [screen for screen in pool if screen is not self.current_screen]
+        if not candidates:
+            return False
+        screen = min(candidates, key=lambda screen: self.last_used.get(screen.name, 0))
+        with profiling.timer('screen', screen=name, recycled=True):
+            screen.bind_spec(self.screen_specs[name])
+            screen.name = name
+        return True
+
+    def build_all_screens(self):
+        for name in self.screen_factories:
+            self.ensure_screen(name)
+
+    def schedule_prefetch(self, screen):
+        # Enfileira as telas acessíveis a partir da tela atual para serem
+        # construídas uma por vez enquanto o app está ocioso. No modo de
+        # reciclagem não há pré-carregamento: ele descartaria telas do conjunto
+        if self.recycle_pool_size:
+            return
+
+        for _, screen_name in getattr(screen, 'button_texts', []):
+            if screen_name in self.screen_factories and not self.has_screen(screen_name) \
+                    and screen_name not in self.prefetch_queue:
+                self.prefetch_queue.append(screen_name)
+
+        if self.prefetch_queue and self.prefetch_event is None:
+            self.prefetch_event = Clock.schedule_once(self.prefetch_next, constants.PREFETCH_INTERVAL)
+
+    def prefetch_next(self, dt):
+        self.prefetch_event = None
+        # Não compete com uma transição em andamento
+        if self.transition.is_active:
+            self.prefetch_event = Clock.schedule_once(self.prefetch_next, constants.PREFETCH_INTERVAL)
+            return
+
+        if self.prefetch_queue:
+            self.ensure_screen(self.prefetch_queue.pop(0))
+
+        if self.prefetch_queue:
+            self.prefetch_event = Clock.schedule_once(self.prefetch_next, constants.PREFETCH_INTERVAL)
 
     def on_current(self, instance, value):
+        # Garante que a tela de destino exista antes da navegação
+        if value:
+            self.ensure_screen(value)
+            self.navigation_count += 1
+            self.last_used[value] = self.navigation_count
+
         # Se a navegação foi feita via back_button, não adiciona a tela atual à pilha
         if not getattr(self, 'navigating_back', False):
             if self.current_screen:
-                current_screen_name = self.current_screen.name
-
-                # Evita adicionar a mesma tela duas vezes seguidas ou adicionar a home_screen
-                if self.screen_stack and self.screen_stack[-1] == current_screen_name:
-                    return
-
-                if current_screen_name != 'home_screen':  # Evita adicionar a tela inicial
-                    self.screen_stack.append(current_screen_name)
-        
-        # Exibe a pilha atual
-        print(f"Current stack: {self.screen_stack}")
-        
+                self.history.push(self.current_screen.name)
+        if value:
+            self.history.visit(value)
+
+        # Exibe a pilha atual (formatada só com o nível debug ativo)
+        Logger.debug('Navigation: current stack %s', self.history)
+
         super(CustomScreenManager, self).on_current(instance, value)
 
+        if value == 'home_screen':
+            self.finish_consultation()
+
+        if self.mirror is not None and value:
+            self.mirror.publish(s=value)
+
+        if constants.PREFETCH_SCREENS and value:
+            self.schedule_prefetch(self.get_screen(value))
+
+        if constants.PREDICTIVE_PREFETCH and value:
+            contexts = [f'tela:{value}']
+            if self.last_question_key:
+                contexts.append(f'pergunta:{self.last_question_key}')
+            self.prefetch_predicted(contexts)
+
+    def on_question_opened(self, question_key):
+        # Chamado por BaseScreen.show_image_popup a cada pergunta aberta
+        self.transition_model.record(f'tela:{self.current}', question_key)
+        if self.last_question_key:
+            self.transition_model.record(f'pergunta:{self.last_question_key}', question_key)
+        self.last_question_key = question_key
+
+        if self.mirror is not None:
+            if constants.MIRROR_ANSWERS:
+                self.mirror.publish(q=question_key, a=self.current_answers.get(question_key, ''))
+            else:
+                self.mirror.publish(q=question_key)
+
+        if constants.PREDICTIVE_PREFETCH:
+            self.prefetch_predicted([f'pergunta:{question_key}'])
+
+    def prefetch_predicted(self, contexts):
+        question_keys = self.transition_model.predict(contexts, constants.PREDICTIVE_PREFETCH_TOP_K)
+        # O modelo salvo pode ter perguntas que não existem mais na árvore
+        texture_cache.prefetch([
+            popup_image_source(question_key) for question_key in question_keys
+            if has_question_image(question_key)
+        ])
+
+    def record_answer(self, question_key, answer):
+        # Chamado pelo popup de imagens ao salvar a resposta do paciente
+        if self.consultation_id is None and self.answer_store is not None:
+            self.consultation_id = self.answer_store.start_consultation()
+        self.current_answers[question_key] = answer
+        if self.answer_store is not None:
+            self.answer_store.record(self.consultation_id, question_key, answer)
+        if self.mirror is not None and constants.MIRROR_ANSWERS:
+            self.mirror.publish(a=answer)
+        instrumentation.count('answers')
+
+    def on_popup_dismissed(self, popup):
+        if self.mirror is not None:
+            self.mirror.publish(q=None)
+
+    def apply_mirror(self, message):
+        # Modo seguidor: aplica a tela e a pergunta recebidas do líder. A
+        # imagem vem do cache local; a resposta só é exibida, não registrada
+        screen_name = message.get('s')
+        if screen_name and screen_name != self.current and (screen_name in self.screen_factories or self.has_screen(screen_name)):
+            self.current = screen_name
+        question_key = message.get('q', self.mirrored_question)
+        answer = message.get('a', self.current_answers.get(question_key, ''))
+        popup = get_image_popup()
+        if question_key is None or question_key not in constants.RELACAO_IMAGENS_TEXTOS:
+            if self.mirrored_question is not None:
+                popup.dismiss()
+        elif question_key != self.mirrored_question or 'a' in message:
+            self.current_answers[question_key] = answer
+            if question_key != self.mirrored_question:
+                question_text = constants.RELACAO_IMAGENS_TEXTOS[question_key][0]
+                self.current_screen.show_image_popup(question_image_source(question_key), '', question_text, question_key)
+            popup.set_answer(answer)
+            popup.answer_input.disabled = popup.save_button.disabled = True
+            if popup.question_widget is not None:
+                popup.question_widget.disabled = True
+        self.mirrored_question = question_key
+
+    def finish_consultation(self):
+        if self.consultation_id is not None:
+            self.answer_store.finish_consultation(self.consultation_id)
+            if self.sync is not None:
+                self.sync.wake()
+        self.consultation_id = None
+        self.current_answers = {}
+
+    def export_summary(self):
+        # Exporta em segundo plano o resumo da consulta em andamento
+        if self.consultation_id is None or self.export_dir is None:
+            show_message('Resumo', 'Nenhuma resposta registrada nesta consulta.')
+            return
+        os.makedirs(self.export_dir, exist_ok=True)
+        path = os.path.join(self.export_dir, f"consulta-{time.strftime('%Y%m%d-%H%M%S')}-{self.consultation_id[:8]}.html")
+        with instrumentation.timer('export_summary_start'):
+            export_summary(self.answer_store, self.consultation_id, self.screen_specs, path, self.on_summary_exported)
+
+    def on_summary_exported(self, path, error):
+        if error is not None:
+            Logger.error(f'Export: {error}')
+            show_message('Resumo', 'Não foi possível exportar o resumo.')
+        else:
+            show_message('Resumo', f'Resumo salvo em {path}')
+
     def go_to_previous_screen(self):
         # Marca que a navegação está sendo feita via back_button
         self.navigating_back = True
-        
-        # Verifica se há telas na pilha para voltar
-        if self.screen_stack:
-            previous_screen = self.screen_stack.pop()  # Remove a última tela
+
+        # Volta para a última tela da pilha; se ela está vazia, vá para a tela inicial
+        previous_screen = self.history.pop() or 'home_screen'
+        with instrumentation.timer('go_to_previous_screen', screen=previous_screen):
             self.current = previous_screen
-        else:
-            # Se a pilha está vazia, vá para a tela inicial
-            self.current = 'home_screen'
-        
+
         # Após navegar, desfaz a marcação da navegação via back_button
         self.navigating_back = False
-    
+
+    def jump_to_section(self, name):
+        # Vai direto para uma seção da árvore (ex.: 'HMA'), montando a pilha
+        # com o caminho a partir da tela inicial para que o voltar funcione
+        paths = self.section_paths()
+        if name not in paths:
+            Logger.warning(f'Navigation: unknown section {name}')
+            return
+        self.history.reset(paths[name])
+        self.navigating_back = True
+        self.current = name
+        self.navigating_back = False
+
+    def section_paths(self):
+        if self.paths is None:
+            self.paths = section_paths(
+                {name: spec.button_texts for name, spec in self.screen_specs.items()}
+            )
+        return self.paths
+
 class SlideApp(App):
     def build(self):
-        self.screen_manager = CustomScreenManager()
-        # Home Screen
-        self.screen_manager.add_widget(HomeScreen(name='home_screen'))
-        # Level 1 Screens
-        self.screen_manager.add_widget(StartingScreen(name='starting_screen'))
-        self.screen_manager.add_widget(AboutScreen(name='about_screen'))
-        # Level 2 Screens
-        self.screen_manager.add_widget(IdentificacaoScreen(name='identificacao'))
-        self.screen_manager.add_widget(QueixaPrincipalScreen(name='queixa_principal'))
-        self.screen_manager.add_widget(HMAScreen(name='HMA'))
-        self.screen_manager.add_widget(HPPScreen(name='HPP'))
-        self.screen_manager.add_widget(HistoriaFisiologicaScreen(name='Hfisio'))
-        self.screen_manager.add_widget(HistoriaFamilialScreen(name='Hfamilial'))
-        self.screen_manager.add_widget(HistoriaFamiliarScreen(name='Hfamiliar'))
-        self.screen_manager.add_widget(HistoriaPsicossocialScreen(name='Hpsico'))
-        self.screen_manager.add_widget(SubstanciasScreen(name='subst'))
-        self.screen_manager.add_widget(HabitosDeVidaScreen(name='habitos'))
-        self.screen_manager.add_widget(RevisaoDeSistemasScreen(name='revisao_sistemas'))
-        # Level 3 Screens
-        self.screen_manager.add_widget(HMAMedicamentosNaoCronicosScreen(name='HMA_medicamentos_nao_cronicos'))
-        self.screen_manager.add_widget(HMADecalogoDaDorScreen(name='HMA_decalogo'))
-        self.screen_manager.add_widget(HPPCirurgiasScreen(name='HPP_cirurgias'))
-        self.screen_manager.add_widget(HPPMedicamentosCronicosScreen(name='HPP_medicamentos_cronicos'))
-        self.screen_manager.add_widget(HistoriaFisiologicaRelacaoSexualScreen(name='Hfisio_relacao_sexual'))
-        self.screen_manager.add_widget(HistoriaFisiologicaGestacaoScreen(name='Hfisio_gestacao'))
-        self.screen_manager.add_widget(HistoriaFisiologicaExamesPreventivosScreen(name='Hfisio_exames_preventivos'))
-        self.screen_manager.add_widget(HistoriaFisiologicaMenopausaScreen(name='Hfisio_menopausa'))
-        self.screen_manager.add_widget(HistoriaFisiologicaPuberdadeScreen(name='Hfisio_puberdade'))
-        self.screen_manager.add_widget(HistoriaPsicossocialHabitacaoScreen(name='Hpsico_habitacao'))
-        self.screen_manager.add_widget(SubstanciasAlcoolScreen(name='subst_alcool'))
-        self.screen_manager.add_widget(SubstanciasTabacoScreen(name='subst_tabaco'))
-        self.screen_manager.add_widget(SubstanciasDrogasIlicitasScreen(name='subst_drogas_ilicitas'))
+        start_time = time.perf_counter()
+
+        if instrumentation.enabled:
+            self.start_instrumentation()
+
+        # Sem diretório de dados, respostas e modelo de transições valem só durante a sessão
+        answers_path = self.data_path(constants.ANSWERS_DATABASE)
+        self.answer_store = AnswerStore(
+            answers_path, constants.ANSWERS_BATCH_SIZE, constants.ANSWERS_FLUSH_INTERVAL
+        ) if answers_path else None
+
+        self.screen_manager = CustomScreenManager(
+            screen_factories=SCREEN_FACTORIES,
+            screen_specs=load_screen_tree(),
+            recycle_pool_size=constants.RECYCLE_POOL_SIZE if constants.RECYCLE_SCREENS else 0,
+            answer_store=self.answer_store,
+            export_dir=self.data_path('resumos'),
+            # No modo 'auto' começa com a deslizante até medir o tempo de quadro
+            transition=make_transition('slide' if constants.TRANSITION_PROFILE == 'auto' else constants.TRANSITION_PROFILE),
+        )
+        self.transition_model_path = self.data_path('transicoes.json')
+        if self.transition_model_path:
+            self.screen_manager.transition_model.load(self.transition_model_path)
+
+        if constants.LAZY_SCREENS:
+            # Apenas a tela inicial é construída; as demais sob demanda
+            self.screen_manager.ensure_screen('home_screen')
+        else:
+            self.screen_manager.build_all_screens()
+
+        # Mede o tempo de construção das telas na inicialização
+        elapsed_ms = (time.perf_counter() - start_time) * 1000
+        print(f"Build time: {elapsed_ms:.1f} ms ({len(self.screen_manager.screens)} screens)")
+        profiling.mark('built', screens=len(self.screen_manager.screens))
+
+        self.sync = None
+        sync_url = os.environ.get('ACESSO_SYNC_URL') or constants.SYNC_URL
+        spool_dir = self.data_path('envio')
+        if sync_url and self.answer_store is not None and spool_dir:
+            self.sync = SyncEngine(self.answer_store, sync_url, spool_dir)
+            self.screen_manager.sync = self.sync
+            # O envio espera a interface ficar ociosa entre um pedaço e outro
+            Window.bind(on_touch_down=self.on_user_activity)
+
+        self.mirror = None
+        mode, host, port, token = mirror_config()
+        if mode:
+            self.start_mirror(mode, host, port, token)
+
+        if profiling.enabled:
+            Window.bind(on_flip=self.on_benchmark_first_frame)
         return self.screen_manager
 
+    def on_start(self):
+        if constants.ASYNC_IMAGE_DECODE:
+            Clock.schedule_once(preload_thumbnails, constants.PREFETCH_INTERVAL)
+        if constants.TRANSITION_PROFILE == 'auto':
+            # Guardado em self: o Kivy mantém só referências fracas aos callbacks
+            self.frame_probe = FrameProbe(constants.TRANSITION_PROBE_FRAMES, self.on_frame_probe)
+            self.frame_probe.start()
+
+    def on_frame_probe(self, frame_ms):
+        # Não troca a transição no meio de uma navegação
+        if self.screen_manager.transition.is_active:
+            Clock.schedule_once(lambda dt: self.on_frame_probe(frame_ms), constants.PREFETCH_INTERVAL)
+            return
+        profile = profile_for_frame_time(frame_ms)
+        self.screen_manager.transition = make_transition(profile)
+        Logger.info(f'Transitions: {profile} (frame time {frame_ms:.1f} ms)')
+        instrumentation.event('transition_profile', profile=profile, frame_ms=round(frame_ms, 2))
+
+    # Modo benchmark: registra o primeiro quadro e a abertura do primeiro
+    # popup, grava o JSON e encerra o app
+    def on_benchmark_first_frame(self, *args):
+        Window.unbind(on_flip=self.on_benchmark_first_frame)
+        profiling.mark('first_frame')
+        Clock.schedule_once(self.open_benchmark_popup, 0)
+
+    def open_benchmark_popup(self, dt):
+        question_key = next(iter(constants.RELACAO_IMAGENS_TEXTOS))
+        question_text = constants.RELACAO_IMAGENS_TEXTOS[question_key][0]
+        with profiling.timer('show_image_popup', key=question_key):
+            self.screen_manager.current_screen.show_image_popup(question_image_source(question_key), '', question_text)
+        self.benchmark_popup_opened = False
+        Window.bind(on_flip=self.on_benchmark_popup_frame)
+
+    def on_benchmark_popup_frame(self, *args):
+        # popup_opened: primeiro quadro com o popup (ainda sem a imagem
+        # completa, se ela é decodificada em segundo plano); first_popup:
+        # primeiro quadro com a imagem completa
+        popup = get_image_popup()
+        if not self.benchmark_popup_opened:
+            self.benchmark_popup_opened = True
+            profiling.mark('popup_opened')
+        if popup.image.texture is None or popup.image.texture is not texture_cache.textures.get(popup.source):
+            return
+        Window.unbind(on_flip=self.on_benchmark_popup_frame)
+        profiling.mark('first_popup')
+        profiling.write()
+        self.stop()
+
+    def start_instrumentation(self):
+        log_file = instrumentation.log_path
+        if not log_file and constants.INSTRUMENTATION_FILE:
+            log_file = self.data_path('instrumentacao.jsonl')
+        instrumentation.configure(log_file)
+        # Identifica o aparelho, para comparar os tempos entre dispositivos
+        instrumentation.event('session', platform=platform, kivy=kivy.__version__,
+                              window=list(Window.size), dpi=Window.dpi)
+
+    def start_mirror(self, mode, host, port, token):
+        manager = self.screen_manager
+        if not token:
+            Logger.error('Mirror: set MIRROR_TOKEN or ACESSO_MIRROR_TOKEN to enable two screens')
+            return
+        if mode == 'follower':
+            self.mirror = MirrorFollower(host, port, token, self.on_mirror_message)
+            return
+        try:
+            self.mirror = MirrorLeader(host, port, token)
+        except OSError as e:
+            Logger.error(f'Mirror: cannot listen on port {port}: {e}')
+            return
+        if instrumentation.enabled:
+            self.mirror.on_latency = lambda ms: instrumentation.timed('mirror_latency', ms)
+        manager.mirror = self.mirror
+        manager.mirror.publish(s=manager.current)
+        get_image_popup().bind(on_dismiss=manager.on_popup_dismissed)
+
+    def on_user_activity(self, *args):
+        self.sync.touch()
+
+    def on_mirror_message(self, message):
+        # Chamado na thread do seguidor: aplica na thread principal e só
+        # então confirma, para que a latência medida inclua a aplicação
+        def apply(dt):
+            self.screen_manager.apply_mirror(message)
+            self.mirror.ack(message['n'])
+        Clock.schedule_once(apply, 0)
+
+    def data_path(self, filename):
+        # Arquivo no diretório de dados do app, ou None se ele não puder ser criado
+        try:
+            return os.path.join(self.user_data_dir, filename)
+        except OSError:
+            return None
+
+    def save_transition_model(self):
+        if self.transition_model_path:
+            self.screen_manager.transition_model.save(self.transition_model_path)
+
+    def on_pause(self):
+        # No Android o app pode ser encerrado enquanto pausado
+        self.save_transition_model()
+        if self.answer_store is not None:
+            self.answer_store.flush()
+        return True
+
+    def on_stop(self):
+        self.save_transition_model()
+        # Antes de fechar o banco, que a thread de envio usa
+        if self.sync is not None:
+            print(f"Sync: {self.sync.stats()}")
+            self.sync.close()
+            self.sync = None
+        if self.answer_store is not None:
+            self.screen_manager.finish_consultation()
+            self.answer_store.close()
+        # Fecha os clipes em Libras abertos e as suas threads de decodificação
+        get_clip_pool().close()
+        if isinstance(self.mirror, MirrorLeader):
+            print(f"Mirror: {self.mirror.stats()}")
+        if self.mirror is not None:
+            self.mirror.close()
+
+        # Relatório de memória de texturas ao final da sessão
+        print(f"Texture report: {self.screen_manager.texture_report()}")
+        print(f"Widget report: {self.screen_manager.widget_report()}")
+        print(f"Texture cache: {texture_cache.stats()}")
+        print(f"Text cache: {text_cache.stats()}")
+        if instrumentation.enabled:
+            print(f"Instrumentation: {instrumentation.stats()}")
+
 if __name__ == '__main__':
     SlideApp().run()
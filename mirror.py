@@ -0,0 +1,274 @@
+# mirror.py
+#
+# Modo de duas telas: o app do médico (líder) espelha a tela atual e o popup
+# da pergunta em um segundo app (seguidor), na mesma máquina ou na rede
+# local. Pela conexão TCP persistente passam só os campos que mudaram, em
+# JSON por linha:
+#     {"n": 12, "s": "HMA"}                    tela atual
+#     {"n": 13, "q": "HMA_dor_local", "a": ""}  popup aberto (pergunta, resposta)
+#     {"n": 14, "q": null}                     popup fechado
+# O seguidor busca as imagens no próprio cache e responde {"ack": n} depois
+# de aplicar o estado; o líder mede assim a latência de ponta a ponta.
+# Ao conectar, o seguidor se identifica com a senha compartilhada
+# ({"hello": senha}); sem ela o líder fecha a conexão sem enviar nada. A
+# resposta do paciente ("a") só é enviada com constants.MIRROR_ANSWERS.
+# Ativado por constants.MIRROR_MODE ou pela variável de ambiente ACESSO_MIRROR,
+# com a senha em constants.MIRROR_TOKEN ou em ACESSO_MIRROR_TOKEN:
+#     ACESSO_MIRROR=leader ACESSO_MIRROR_TOKEN=... python main.py
+#     ACESSO_MIRROR=follower:192.168.0.10 ACESSO_MIRROR_TOKEN=... python main.py
+import hmac
+import json
+import os
+import queue
+import socket
+import statistics
+import threading
+import time
+from collections import deque
+
+import constants
+
+def mirror_config():
+    # (modo, host, porta, senha) da variável ACESSO_MIRROR ('leader[:porta]'
+    # ou 'follower[:host[:porta]]') ou das constantes; modo None desativa
+    # (porta inválida também desativa, com aviso)
+    token = os.environ.get('ACESSO_MIRROR_TOKEN') or constants.MIRROR_TOKEN
+    value = os.environ.get('ACESSO_MIRROR')
+    if not value:
+        host = constants.MIRROR_BIND_HOST if constants.MIRROR_MODE == 'leader' else constants.MIRROR_LEADER_HOST
+        return constants.MIRROR_MODE, host, constants.MIRROR_PORT, token
+    mode, _, rest = value.partition(':')
+    if mode == 'leader':
+        host, port = constants.MIRROR_BIND_HOST, rest
+    else:
+        host, _, port = rest.partition(':')
+        host = host or constants.MIRROR_LEADER_HOST
+    try:
+        port = int(port or constants.MIRROR_PORT)
+    except ValueError:
+        print(f"Mirror: invalid port in ACESSO_MIRROR={value!r}, two screens disabled")
+        return None, host, None, token
+    return mode, host, port, token
+
+def encode(message):
+    return (json.dumps(message, separators=(',', ':'), ensure_ascii=False) + '\n').encode('utf-8')
+
+def connect_options(sock):
+    # Mensagens pequenas e frequentes: envia na hora, sem esperar juntar (Nagle)
+    sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+def close_socket(sock):
+    # shutdown antes de close: a thread de leitura (makefile) ainda tem
+    # uma referência ao socket e só assim recebe o fim da conexão
+    try:
+        sock.shutdown(socket.SHUT_RDWR)
+    except OSError:
+        pass
+    sock.close()
+
+class MirrorLeader(object):
+    # Aceita seguidores que apresentam a senha e envia a cada um o estado
+    # completo ao conectar e depois só os campos alterados. O envio roda em
+    # uma thread própria: publish() nunca bloqueia a thread principal
+    def __init__(self, host, port, token):
+        if not token:
+            raise ValueError('mirror token is required')
+        self.token = token.encode('utf-8')
+        self.state = {}
+        self.seq = 0
+        self.clients = []
+        self.lock = threading.Lock()
+        self.outbox = queue.Queue()
+        # Número da mensagem -> instante do envio, até chegar a confirmação
+        self.sent = {}
+        self.latencies = deque(maxlen=constants.MIRROR_LATENCY_SAMPLES)
+        self.messages = 0
+        self.bytes_sent = 0
+        self.confirmed = 0
+        self.on_latency = None
+
+        self.server = socket.create_server((host, port))
+        self.port = self.server.getsockname()[1]
+        threading.Thread(target=self.accept, name='mirror-accept', daemon=True).start()
+        threading.Thread(target=self.send_loop, name='mirror-send', daemon=True).start()
+
+    def publish(self, **delta):
+        # Envia só os campos que mudaram desde a última mensagem
+        changed = {key: value for key, value in delta.items() if self.state.get(key, object()) != value}
+        if not changed:
+            return
+        # Sob o lock: a thread que aceita seguidores lê state e seq juntos e
+        # enfileira o estado completo na mesma ordem das alterações
+        with self.lock:
+            self.state.update(changed)
+            self.seq += 1
+            changed['n'] = self.seq
+            self.outbox.put(changed)
+
+    def accept(self):
+        while True:
+            try:
+                conn, address = self.server.accept()
+            except OSError:
+                return
+            connect_options(conn)
+            threading.Thread(target=self.serve_follower, args=(conn, address), name='mirror-ack', daemon=True).start()
+
+    def serve_follower(self, conn, address):
+        # Nada é enviado antes de o seguidor apresentar a senha
+        reader = conn.makefile('rb')
+        conn.settimeout(constants.MIRROR_HELLO_TIMEOUT)
+        try:
+            hello = json.loads(reader.readline())
+            token = str(hello.get('hello', '')).encode('utf-8') if isinstance(hello, dict) else b''
+        except (OSError, ValueError):
+            token = b''
+        if not hmac.compare_digest(token, self.token):
+            print(f"Mirror: rejected follower from {address[0]}")
+            reader.close()
+            close_socket(conn)
+            return
+        conn.settimeout(None)
+        print(f"Mirror: follower connected from {address[0]}")
+        # O estado completo entra na fila como qualquer mensagem, então
+        # não fica à frente de alterações já enfileiradas
+        with self.lock:
+            self.outbox.put((conn, dict(self.state, n=self.seq)))
+        self.read_acks(conn, reader)
+
+    def send_loop(self):
+        while True:
+            item = self.outbox.get()
+            if item is None:
+                return
+            if isinstance(item, tuple):
+                conn, message = item
+                if self.send(conn, encode(message)):
+                    with self.lock:
+                        self.clients.append(conn)
+                continue
+            data = encode(item)
+            with self.lock:
+                clients = list(self.clients)
+                if clients:
+                    self.sent[item['n']] = time.perf_counter()
+            for conn in clients:
+                self.send(conn, data)
+            self.messages += 1
+            self.bytes_sent += len(data)
+
+    def send(self, conn, data):
+        try:
+            conn.sendall(data)
+            return True
+        except OSError:
+            self.drop(conn)
+            return False
+
+    def drop(self, conn):
+        with self.lock:
+            if conn in self.clients:
+                self.clients.remove(conn)
+                print("Mirror: follower disconnected")
+            if not self.clients:
+                self.sent.clear()
+        close_socket(conn)
+
+    def read_acks(self, conn, reader):
+        try:
+            for line in reader:
+                message = json.loads(line)
+                if not isinstance(message, dict):
+                    continue
+                seq = message.get('ack')
+                with self.lock:
+                    sent_at = self.sent.pop(seq, None)
+                if sent_at is not None:
+                    ms = (time.perf_counter() - sent_at) * 1000
+                    self.latencies.append(ms)
+                    self.confirmed += 1
+                    if self.on_latency is not None:
+                        self.on_latency(ms)
+        except (OSError, ValueError):
+            pass
+        self.drop(conn)
+
+    def stats(self):
+        latencies = sorted(self.latencies)
+        result = {
+            'followers': len(self.clients),
+            'messages': self.messages,
+            'confirmed': self.confirmed,
+            'bytes_per_message': round(self.bytes_sent / self.messages, 1) if self.messages else 0,
+        }
+        if latencies:
+            result.update(
+                latency_median_ms=round(statistics.median(latencies), 2),
+                latency_p95_ms=round(latencies[int(0.95 * (len(latencies) - 1))], 2),
+                latency_max_ms=round(latencies[-1], 2),
+            )
+        return result
+
+    def close(self):
+        self.outbox.put(None)
+        self.server.close()
+        with self.lock:
+            clients, self.clients = self.clients, []
+        for conn in clients:
+            close_socket(conn)
+
+class MirrorFollower(object):
+    # Conecta ao líder (tentando de novo se a conexão cair), apresenta a
+    # senha e chama on_message(mensagem) na thread de leitura; quem aplica
+    # a mensagem chama ack(n) depois de aplicá-la
+    def __init__(self, host, port, token, on_message, reconnect=True):
+        self.address = (host, port)
+        self.token = token
+        self.on_message = on_message
+        self.reconnect = reconnect
+        self.sock = None
+        self.lock = threading.Lock()
+        self.closed = False
+        self.thread = threading.Thread(target=self.run, name='mirror-follow', daemon=True)
+        self.thread.start()
+
+    def run(self):
+        while not self.closed:
+            try:
+                sock = socket.create_connection(self.address, timeout=constants.MIRROR_RETRY_INTERVAL)
+            except OSError:
+                time.sleep(constants.MIRROR_RETRY_INTERVAL)
+                continue
+            sock.settimeout(None)
+            connect_options(sock)
+            self.sock = sock
+            print(f"Mirror: connected to {self.address[0]}:{self.address[1]}")
+            try:
+                sock.sendall(encode({'hello': self.token}))
+                for line in sock.makefile('rb'):
+                    self.on_message(json.loads(line))
+            except (OSError, ValueError):
+                pass
+            self.sock = None
+            sock.close()
+            if not self.reconnect:
+                return
+            if not self.closed:
+                print("Mirror: connection lost, retrying")
+                time.sleep(constants.MIRROR_RETRY_INTERVAL)
+
+    def ack(self, seq):
+        sock = self.sock
+        if sock is None:
+            return
+        try:
+            with self.lock:
+                sock.sendall(encode({'ack': seq}))
+        except OSError:
+            pass
+
+    def close(self):
+        self.closed = True
+        sock = self.sock
+        if sock is not None:
+            close_socket(sock)
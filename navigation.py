@@ -0,0 +1,100 @@
+# navigation.py
+from collections import OrderedDict
+
+# Telas que não vêm da árvore, construídas por classes próprias (screens.py)
+SPECIAL_SCREENS = ['about_screen', 'search_screen']
+
+# Destinos de botões que executam uma ação do CustomScreenManager em vez de navegar
+ACTIONS = ['exportar_resumo']
+
+class NavigationHistory(object):
+    # Pilha de telas anteriores usada pelo botão voltar. Cada tela aparece no
+    # máximo uma vez: voltar a uma tela que já está na pilha descarta tudo o
+    # que veio depois dela (ciclos não crescem a pilha). A profundidade é
+    # limitada, descartando as telas mais antigas
+    def __init__(self, max_depth, root='home_screen'):
+        self.max_depth = max_depth
+        self.root = root
+        # OrderedDict como pilha: pertinência, push e pop em O(1)
+        self.screens = OrderedDict()
+
+    def __contains__(self, name):
+        return name in self.screens
+
+    def __len__(self):
+        return len(self.screens)
+
+    def __iter__(self):
+        return iter(self.screens)
+
+    def __repr__(self):
+        return repr(list(self.screens))
+
+    def push(self, name):
+        # A tela inicial não entra na pilha: é o destino quando ela esvazia
+        if name == self.root:
+            return
+        if name in self.screens:
+            self.truncate(name)
+        self.screens[name] = None
+        if len(self.screens) > self.max_depth:
+            self.screens.popitem(last=False)
+
+    def visit(self, name):
+        # Chegando em uma tela que já está na pilha: o caminho volta a ser o
+        # de quando ela foi visitada pela primeira vez
+        if name in self.screens:
+            self.truncate(name)
+
+    def truncate(self, name):
+        # Remove a tela e todas as que foram empilhadas depois dela
+        while self.screens:
+            last, _ = self.screens.popitem()
+            if last == name:
+                break
+
+    def pop(self):
+        if not self.screens:
+            return None
+        name, _ = self.screens.popitem()
+        return name
+
+    def peek(self):
+        return next(reversed(self.screens), None)
+
+    def reset(self, names=()):
+        self.screens.clear()
+        for name in names:
+            self.push(name)
+
+    def clear(self):
+        self.screens.clear()
+
+def section_paths(button_texts_by_screen, root='home_screen'):
+    # Para cada tela da árvore, o caminho de telas a partir da inicial (busca
+    # em largura, ou seja, o caminho mais curto). Usado para pular direto
+    # para uma seção com a pilha do botão voltar já montada
+    paths = {root: []}
+    queue = [root]
+    while queue:
+        name = queue.pop(0)
+        for _, target in button_texts_by_screen.get(name, ()):
+            if target in button_texts_by_screen and target not in paths:
+                paths[target] = paths[name] + [name]
+                queue.append(target)
+    return paths
+
+def validate_screen_tree(button_texts_by_screen, questions):
+    # Problemas de estrutura da árvore: (tela, destino, descrição). A
+    # verificação das imagens fica em tools/check_assets.py
+    problems = []
+    for name, button_texts in button_texts_by_screen.items():
+        for text, target in button_texts:
+            if target in questions:
+                if target in button_texts_by_screen:
+                    problems.append((name, target, 'is both a screen and a question; the screen is unreachable'))
+                elif not questions[target] or not questions[target][0].strip():
+                    problems.append((name, target, 'has no question text'))
+            elif target not in button_texts_by_screen and target not in SPECIAL_SCREENS and target not in ACTIONS:
+                problems.append((name, target, 'is neither a screen nor a question'))
+    return problems
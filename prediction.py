@@ -0,0 +1,51 @@
+# prediction.py
+import json
+import os
+
+class TransitionModel(object):
+    # Modelo de frequência de transições: para cada contexto (tela atual ou
+    # última pergunta aberta) conta quais perguntas foram abertas em seguida.
+    # É salvo entre execuções para prever as próximas imagens a pré-carregar
+    def __init__(self, max_keys_per_context=20):
+        self.max_keys_per_context = max_keys_per_context
+        self.counts = {}
+
+    def record(self, context, question_key):
+        if context is None:
+            return
+        keys = self.counts.setdefault(context, {})
+        # Mantém só as perguntas mais frequentes de cada contexto. A menos
+        # frequente sai antes de a nova entrar, para que a nova fique e possa
+        # ganhar contagem; no empate sai a mais antiga (ordem de inserção)
+        if question_key not in keys and len(keys) >= self.max_keys_per_context:
+            least = min(keys, key=keys.get)
+            del keys[least]
+        keys[question_key] = keys.get(question_key, 0) + 1
+
+    def top(self, context, k):
+        keys = self.counts.get(context)
+        if not keys:
+            return []
+        return sorted(keys, key=keys.get, reverse=True)[:k]
+
+    def predict(self, contexts, k):
+        # Junta as previsões de vários contextos, somando as contagens
+        scores = {}
+        for context in contexts:
+            for question_key, count in self.counts.get(context, {}).items():
+                scores[question_key] = scores.get(question_key, 0) + count
+        return sorted(scores, key=scores.get, reverse=True)[:k]
+
+    def load(self, path):
+        try:
+            with open(path, encoding='utf-8') as f:
+                self.counts = json.load(f)
+        except (OSError, ValueError):
+            self.counts = {}
+
+    def save(self, path):
+        # Grava em um arquivo temporário e troca, para não corromper o modelo
+        tmp_path = f'{path}.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.counts, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
@@ -0,0 +1,60 @@
+# profiling.py
+#
+# Marcações de tempo da inicialização do app. Ativado pela variável de
+# ambiente ACESSO_BENCHMARK com o caminho do arquivo JSON de saída:
+#     ACESSO_BENCHMARK=startup.json python main.py
+import json
+import os
+import time
+
+import instrumentation
+
+START_TIME = time.perf_counter()
+
+output_path = os.environ.get('ACESSO_BENCHMARK')
+enabled = bool(output_path)
+
+marks = []
+timers = []
+
+def elapsed_ms(since=START_TIME):
+    return round((time.perf_counter() - since) * 1000, 2)
+
+def mark(name, **info):
+    # Registra o instante (em ms desde a importação deste módulo) de um evento
+    if enabled:
+        marks.append(dict(name=name, ms=elapsed_ms(), **info))
+
+class timer(object):
+    # Mede a duração de um bloco: with profiling.timer('screen', name=...).
+    # Com a instrumentação ligada, a medição também vai para ela
+    def __init__(self, name, **info):
+        self.name = name
+        self.info = info
+
+    def __enter__(self):
+        if enabled or instrumentation.enabled:
+            self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        if enabled:
+            timers.append(dict(name=self.name, start_ms=elapsed_ms(START_TIME) - elapsed_ms(self.start),
+                               ms=elapsed_ms(self.start), **self.info))
+        if instrumentation.enabled and hasattr(self, 'start'):
+            instrumentation.timed(self.name, elapsed_ms(self.start), **self.info)
+        return False
+
+def summary():
+    result = {mark['name']: mark['ms'] for mark in marks}
+    totals = {}
+    for entry in timers:
+        totals[entry['name']] = round(totals.get(entry['name'], 0) + entry['ms'], 2)
+    result['totals'] = totals
+    return result
+
+def write(path=None):
+    path = path or output_path
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({'summary': summary(), 'marks': marks, 'timers': timers}, f, indent=1, ensure_ascii=False)
+    print(f"Benchmark written to {path}")
@@ -0,0 +1,146 @@
+# scale.py
+#
+# Perguntas de escala (constants.ESCALAS: dor de 0 a 10, evolução,
+# quantidades) desenhadas com instruções do canvas no lugar da imagem: sem
+# decodificação nem textura da imagem, e nítidas em qualquer tamanho de
+# janela. Os textos das opções vêm do cache de textos compartilhado. Tocar
+# em uma opção a escolhe como resposta
+from kivy.graphics import Color, Line, Rectangle, RoundedRectangle
+from kivy.properties import StringProperty
+from kivy.uix.widget import Widget
+from kivy.utils import get_color_from_hex
+
+import constants
+from textures import text_cache
+
+GAP = 6
+RADIUS = 8
+# Altura máxima de cada opção
+MAX_CELL_SIZE = 90
+TEXT_COLOR = (0, 0, 0, 1)
+
+def scale_colors(stops, count):
+    # count cores interpoladas entre as cores de constants.ESCALAS (início ao fim)
+    stops = [get_color_from_hex(stop) for stop in stops]
+    if len(stops) == 1 or count == 1:
+        return [stops[0]] * count
+    colors = []
+    for i in range(count):
+        position = i / (count - 1) * (len(stops) - 1)
+        index = min(int(position), len(stops) - 2)
+        t = position - index
+        colors.append([a + (b - a) * t for a, b in zip(stops[index], stops[index + 1])])
+    return colors
+
+class ScaleWidget(Widget):
+    # Opção escolhida (texto da opção) ou ''
+    answer = StringProperty('')
+
+    def __init__(self, spec, **kwargs):
+        super(ScaleWidget, self).__init__(**kwargs)
+        self.options = spec['opcoes']
+        self.ends = spec.get('extremos')
+        self.selected = None
+        self.vertical = False
+        self.cells = []
+
+        self.backgrounds = []
+        self.texts = []
+        self.end_texts = []
+        with self.canvas:
+            for color in scale_colors(spec['cores'], len(self.options)):
+                Color(*color)
+                self.backgrounds.append(RoundedRectangle(radius=[RADIUS]))
+            Color(1, 1, 1, 1)
+            for _ in self.options:
+                self.texts.append(Rectangle())
+            for _ in self.ends or ():
+                self.end_texts.append(Rectangle())
+            self.selection_color = Color(*get_color_from_hex(constants.BUTTON_BACKGROUND_COLOR))
+            self.selection_color.a = 0
+            self.selection = Line(width=3)
+        self.bind(pos=self.update_shapes, size=self.update_shapes)
+
+    def text_texture(self, text, width=None):
+        return text_cache.get(text, constants.BUTTON_FONT_SIZE, width, True, TEXT_COLOR)
+
+    def update_shapes(self, *args):
+        count = len(self.options)
+        end_height = max((self.text_texture(text).height for text in self.ends or ()), default=0)
+        available_height = self.height - 2 * (end_height + GAP)
+
+        # Lado a lado enquanto os textos cabem nas opções; senão, uma embaixo da outra
+        cell_width = (self.width - GAP * (count - 1)) / count
+        widest = max(self.text_texture(option).width for option in self.options)
+        self.vertical = widest + 2 * GAP > cell_width
+        if self.vertical:
+            cell_width = self.width
+            cell_height = min((available_height - GAP * (count - 1)) / count, MAX_CELL_SIZE)
+            top = self.center_y + (cell_height * count + GAP * (count - 1)) / 2
+            self.cells = [(self.x, top - (i + 1) * cell_height - i * GAP, cell_width, cell_height) for i in range(count)]
+        else:
+            cell_height = min(available_height, MAX_CELL_SIZE)
+            y = self.center_y - cell_height / 2
+            self.cells = [(self.x + i * (cell_width + GAP), y, cell_width, cell_height) for i in range(count)]
+        self.cell_size = (cell_width, cell_height)
+
+        for option, (x, y, width, height), background, text in zip(self.options, self.cells, self.backgrounds, self.texts):
+            background.pos = (x, y)
+            background.size = (width, height)
+            texture = self.text_texture(option, int(width - 2 * GAP) if self.vertical else None)
+            text.texture = texture
+            text.size = texture.size
+            text.pos = (int(x + (width - texture.width) / 2), int(y + (height - texture.height) / 2))
+
+        # Rótulos das extremidades: o primeiro junto à primeira opção, o último junto à última
+        for i, (text, rect) in enumerate(zip(self.ends or (), self.end_texts)):
+            texture = self.text_texture(text)
+            x, y, width, height = self.cells[0 if i == 0 else -1]
+            rect.texture = texture
+            rect.size = texture.size
+            if self.vertical:
+                rect.pos = (int(x + (width - texture.width) / 2), int(y + height + GAP if i == 0 else y - GAP - texture.height))
+            else:
+                rect.pos = (int(x if i == 0 else x + width - texture.width), int(y - GAP - texture.height))
+        self.update_selection()
+
+    def update_selection(self):
+        if self.selected is None or not self.cells:
+            self.selection_color.a = 0
+            return
+        x, y, width, height = self.cells[self.selected]
+        self.selection_color.a = 1
+        self.selection.rounded_rectangle = (x - 3, y - 3, width + 6, height + 6, RADIUS)
+
+    def option_at(self, x, y):
+        # Índice da opção no ponto, calculado a partir da posição (sem
+        # percorrer as opções); None nos espaços entre elas
+        if not self.cells:
+            return None
+        cell_width, cell_height = self.cell_size
+        if self.vertical:
+            top = self.cells[0][1] + cell_height
+            index = int((top - y) // (cell_height + GAP))
+        else:
+            index = int((x - self.x) // (cell_width + GAP))
+        if not 0 <= index < len(self.cells):
+            return None
+        cell_x, cell_y, width, height = self.cells[index]
+        if cell_x <= x <= cell_x + width and cell_y <= y <= cell_y + height:
+            return index
+        return None
+
+    def on_touch_down(self, touch):
+        if self.disabled or not self.collide_point(*touch.pos):
+            return super(ScaleWidget, self).on_touch_down(touch)
+        index = self.option_at(*touch.pos)
+        if index is not None:
+            self.selected = index
+            self.update_selection()
+            self.answer = self.options[index]
+        return True
+
+    def set_answer(self, answer):
+        self.selected = self.options.index(answer) if answer in self.options else None
+        self.update_selection()
+        self.answer = self.options[self.selected] if self.selected is not None else ''
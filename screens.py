@@ -1,32 +1,91 @@
 # screens.py
 import os.path
+from collections import namedtuple
+from functools import partial
 
+from kivy.clock import Clock
 from kivy.core.window import Window
 from kivy.uix.screenmanager import Screen
-from kivy.uix.button import Button
 from kivy.uix.boxlayout import BoxLayout
-from kivy.uix.gridlayout import GridLayout
-from kivy.uix.image import Image
 from kivy.uix.floatlayout import FloatLayout
-from kivy.uix.behaviors import ButtonBehavior
 from kivy.uix.label import Label
 from kivy.uix.popup import Popup
-from kivy.uix.carousel import Carousel
-from kivy.uix.scrollview import ScrollView
+from kivy.uix.textinput import TextInput
 from kivy.utils import get_color_from_hex
-from widgets import ImageButton
+from widgets import ImageButton, ImagePopup, MenuList, TextLabel
 from kivy.uix.widget import Widget
+from textures import texture_cache, get_variant_manifest, pick_variant, thumbnail_texture
+import profiling
+import instrumentation
+from search import build_index
+from video import adjacent_questions, get_clip_pool, has_clip, poster_path
+from body_map import BodyMap
+from scale import ScaleWidget
 
 
 import constants
 
-# Define a base screen class to handle the background image
+image_popup = None
+
+def get_image_popup():
+    # O popup de imagens é construído uma única vez e compartilhado pelas telas
+    global image_popup
+    if image_popup is None:
+        image_popup = ImagePopup()
+    return image_popup
+
+question_widgets = {}
+
+def get_question_widget(question_key):
+    # Widget que substitui a imagem da pergunta no popup (None para as
+    # perguntas com imagem), construído uma única vez e reaproveitado
+    if question_key in constants.MAPA_CORPORAL_PERGUNTAS:
+        if 'body_map' not in question_widgets:
+            question_widgets['body_map'] = BodyMap()
+        return question_widgets['body_map']
+    if question_key in constants.ESCALAS:
+        if question_key not in question_widgets:
+            question_widgets[question_key] = ScaleWidget(constants.ESCALAS[question_key])
+        return question_widgets[question_key]
+    return None
+
+def is_widget_question(question_key):
+    return question_key in constants.MAPA_CORPORAL_PERGUNTAS or question_key in constants.ESCALAS
+
+def has_question_image(question_key):
+    return question_key in constants.RELACAO_IMAGENS_TEXTOS and not is_widget_question(question_key)
+
+def question_image_source(question_key, size=None):
+    # Usa a menor variante pré-gerada suficiente para o tamanho de exibição.
+    # Sem as variantes (ex.: em desenvolvimento), usa a imagem original
+    entry = get_variant_manifest().get(question_key)
+    if entry:
+        width, height = size or Window.size
+        return pick_variant(entry, width, height)
+    return f'{constants.IMAGES_DIR}/{question_key}.jpg'
+
+def popup_image_source(question_key):
+    # O que o popup mostra ao abrir: o pôster do clipe em Libras, se houver,
+    # senão a imagem da pergunta. É o que vale pré-carregar
+    if has_clip(question_key):
+        return poster_path(question_key)
+    return question_image_source(question_key)
+
+def show_message(title, text):
+    # Aviso simples, fechado com um toque fora dele
+    message = Label(text=text, halign='center', valign='middle')
+    message.bind(size=lambda s, w: setattr(s, 'text_size', (s.width, None)))
+    Popup(title=title, content=message, size_hint=(0.8, 0.3)).open()
+
+# Define a base screen class. O fundo é desenhado uma única vez pelo
+# CustomScreenManager e compartilhado por todas as telas
 class BaseScreen(Screen):
-    def __init__(self, background_source, **kwargs):
+    def __init__(self, **kwargs):
         super(BaseScreen, self).__init__(**kwargs)
         self.layout = FloatLayout()
-        self.background = Image(source=background_source, allow_stretch=True, keep_ratio=False)
-        self.layout.add_widget(self.background)
+        self.button_texts = []
+        self.image_sources = []
+        self.back_button = None
 
         self.content_layout = BoxLayout(orientation='vertical', size_hint=(None, None), size=(300, 400))
         self.content_layout.pos_hint = {'center_x': 0.5, 'center_y': 0.5}
@@ -35,7 +94,7 @@ class BaseScreen(Screen):
         self.add_widget(self.layout)
 
     def add_back_button(self):
-        back_button = ImageButton(source='assets/imagens/left_arrow.png', on_press=self.go_to_previous_screen)
+        self.back_button = back_button = ImageButton(source=constants.BACK_BUTTON_IMAGE, on_press=self.go_to_previous_screen)
         back_button.size_hint = (None, None)
         back_button.size = (50, 50)
         back_button.pos_hint = {'right': 1, 'bottom': 1}
@@ -49,7 +108,8 @@ class BaseScreen(Screen):
 
     def go_to_screen(self, screen_name):
         if self.manager:
-            self.manager.current = screen_name
+            with instrumentation.timer('go_to_screen', screen=screen_name):
+                self.manager.current = screen_name
         else:
             print("ScreenManager not yet assigned to this screen.")
 
@@ -57,28 +117,23 @@ class BaseScreen(Screen):
         # Cria o layout vertical principal
         title_layout = BoxLayout(orientation='vertical', size_hint_y=None)
         
-        # Cria o título como um Label
-        title = Label(
+        # Cria o título com o texto renderizado pelo cache de textos
+        self.title_label = title = TextLabel(
             text=title_text,
             font_size=font_size,
             size_hint=(1, None),
             # outline_color = get_color_from_hex('#32a852'),
             # outline_width = 5,
             # underline = True,
-            halign='center',
-            valign='middle',
             color=get_color_from_hex(hex_color),
             bold=True,
-            font_name='Roboto'  # Use a bold font for the title
+            font_name='Roboto',  # Use a bold font for the title
+            text_width=Window.width * 0.6  # Limita a largura do texto para centralização
         )
         # Other font options could include:
         # font_name='Roboto-Italic'  # Use an italic font for the title
         # font_name='Roboto-Black'  # Use a black (heavier) font for the title
         # font_name='Roboto-Light'  # Use a light font for the title
-        title.bind(
-            texture_size=lambda instance, size: setattr(instance, 'height', instance.texture_size[1] + 20)  # Altura dinâmica
-        )
-        title.text_size = (Window.width * 0.6, None)  # Limita a largura do texto para centralização
 
         # Adiciona espaçamento proporcional
         spacer_top = Widget(size_hint=(1, None), height=Window.height * 0.02)  # Espaço de 2% da altura
@@ -92,106 +147,88 @@ class BaseScreen(Screen):
         # Define a altura total do layout com base nos componentes
         title_layout.height = spacer_top.height + title.height + spacer_bottom.height
 
+        # Altura do título pela textura em cache (antes ajustada por um bind em texture_size)
+        title.height = title.texture_height + 20
+
         # Adiciona o layout de título ao conteúdo principal
         self.content_layout.add_widget(title_layout)
 
-    def create_image_popup_handler(self, image_source, text_info, image_description):
-        # This function returns a lambda that will call show_image_popup with the correct arguments
-        return lambda instance: self.show_image_popup(image_source, text_info, image_description)
+    def show_image_popup(self, image_source, text_info, image_description, question_key=None):
+        # O contexto da medição (consulta ao cache) só é montado com a instrumentação ligada
+        if not instrumentation.enabled:
+            self.open_image_popup(image_source, text_info, image_description, question_key)
+            return
+        with instrumentation.timer('show_image_popup', key=question_key, cached=image_source in texture_cache):
+            self.open_image_popup(image_source, text_info, image_description, question_key)
+
+    def open_image_popup(self, image_source, text_info, image_description, question_key=None):
+        if question_key and self.manager and hasattr(self.manager, 'on_question_opened'):
+            self.manager.on_question_opened(question_key)
+
+        # Reaproveita o mesmo popup e busca a imagem no cache de texturas
+        popup = get_image_popup()
+        answer_info = self.answer_info(question_key)
+
+        # Perguntas respondidas em um widget (mapa do corpo, escalas): sem imagem a decodificar
+        question_widget = get_question_widget(question_key)
+        if question_widget is not None:
+            popup.show(None, text_info, image_description, None, question_widget=question_widget, **answer_info)
+            return
+
+        # Com o clipe em Libras da pergunta, o popup mostra o pôster (primeiro
+        # quadro) no lugar da imagem enquanto o vídeo começa a tocar
+        if question_key:
+            clip = get_clip_pool().get(question_key)
+            if clip is not None:
+                image_source = clip.poster
+                answer_info['clip'] = clip
+            # Abrir um clipe é lento: os vizinhos só depois de o popup aparecer
+            Clock.schedule_once(lambda dt: self.preopen_adjacent_clips(question_key), 0)
+        if not constants.ASYNC_IMAGE_DECODE:
+            popup.show(texture_cache.get(image_source), text_info, image_description, image_source, **answer_info)
+            return
+
+        # Abre o popup na hora com a miniatura; a imagem completa é
+        # decodificada em segundo plano e trocada quando estiver pronta
+        if image_source in texture_cache:
+            placeholder = None
+        else:
+            placeholder = thumbnail_texture(question_key) if question_key else None
+        popup.show(placeholder, text_info, image_description, image_source, **answer_info)
+        texture_cache.get_async(image_source, lambda texture: popup.set_texture(image_source, texture))
+
+    def preopen_adjacent_clips(self, question_key):
+        question_keys = [target for _, target in self.button_texts if target in constants.RELACAO_IMAGENS_TEXTOS]
+        get_clip_pool().preopen(adjacent_questions(question_keys, question_key), current=question_key)
+
+    def answer_info(self, question_key):
+        # Resposta já dada na consulta atual e para onde enviar a nova
+        if not question_key or not hasattr(self.manager, 'record_answer'):
+            return {}
+        return {
+            'question_key': question_key,
+            'answer': self.manager.current_answers.get(question_key, ''),
+            'on_answer': self.manager.record_answer,
+        }
+
+    def on_enter(self, *args):
+        # Pré-carrega as imagens (ou os pôsteres dos clipes) de todos os botões da tela atual
+        texture_cache.prefetch(self.image_sources)
 
-    def show_image_popup(self, image_source, text_info, image_description):
-        content = BoxLayout(orientation='vertical', padding=10)
-        
-        # Add image
-        img = Image(source=image_source)
-        content.add_widget(img)
-        
-        # Add text info
-        info_label = Label(
-            text=text_info,
-            size_hint=(1, None),
-            height=40,
-            halign='center',
-            valign='middle',
-            color=get_color_from_hex('#000000')
-        )
-        info_label.bind(
-            size=lambda s, w: setattr(s, 'text_size', (s.width, None))  # Update text size for wrapping
-        )
-        content.add_widget(info_label)
-
-        # Add close button
-        close_button = Button(
-            text='FECHAR', 
-            size_hint_y=None, height=40,                 
-            background_color=get_color_from_hex(constants.BUTTON_BACKGROUND_COLOR),
-            background_normal='',
-            font_name='Roboto',
-            bold=True
-        )
-        close_button.bind(on_press=lambda instance: popup.dismiss())
-        content.add_widget(close_button)
-
-        # Configure Popup with white background
-        popup = Popup(
-            title=image_description.capitalize(),
-            title_color=get_color_from_hex('#000000'),
-            title_size=constants.TITLE_FONT_SIZE,
-            content=content,
-            size_hint=(1, 1),
-            background='',  # Remove background image
-            #background_color=(1, 1, 1, 1)  # RGBA for white background
-        )
-        popup.open()
-    
     def create_buttons(self, button_texts):
-        # Define o layout em grade para os botões
-        grid_layout = GridLayout(
-            cols=1, 
-            spacing=constants.BUTTON_HEIGHT/2, 
-            size_hint_y=None, 
-            pos_hint={'center_x': 0.5, 'center_y': 0.8}
-        )
-        grid_layout.bind(minimum_height=grid_layout.setter('height'))
-
-        for text, screen_name in button_texts:
-            btn = Button(
-                text=text,
-                font_size=constants.BUTTON_FONT_SIZE,
-                size_hint=(None, None),
-                size=(constants.BUTTON_WIDTH, constants.BUTTON_HEIGHT),  # Tamanho inicial
-                halign='center',
-                valign='middle',
-                background_color=get_color_from_hex(constants.BUTTON_BACKGROUND_COLOR),
-                background_normal='',
-                font_name='Roboto',
-                bold=True
-            )
-            btn.text_size = (btn.width - constants.BUTTON_MARGIN, None)
+        with profiling.timer('create_buttons', screen=self.name):
+            self.build_buttons(button_texts)
 
-            # Ajuste dinâmico da altura
-            btn.bind(
-                texture_size=lambda instance, size: setattr(instance, 'height', instance.texture_size[1] + constants.BUTTON_MARGIN)
-            )
-            btn.pos_hint = {'center_x': 0.5}
-
-            # Ações dos botões
-            if screen_name in constants.RELACAO_IMAGENS_TEXTOS.keys():
-                question_text = constants.RELACAO_IMAGENS_TEXTOS[screen_name][0]
-                btn.bind(on_press=self.create_image_popup_handler(f'assets/imagens/{screen_name}.jpg', '', question_text))
-            else:
-                btn.bind(on_press=lambda instance, sn=screen_name: self.go_to_screen(sn))
-
-            grid_layout.add_widget(btn)
-
-        # Calcula a largura do `ScrollView` considerando a barra de rolagem
+    def build_buttons(self, button_texts):
+        # Calcula a largura da lista considerando a barra de rolagem
         scrollbar_width = 20  # Tamanho médio da barra de rolagem
-        scroll_view = ScrollView(
+        self.menu_list = MenuList(
             size_hint=(None, None),
             size=(constants.BUTTON_WIDTH + scrollbar_width, Window.height * 0.7),
             pos_hint={'center_x': 0.5, 'center_y': 0.8}
         )
-        scroll_view.add_widget(grid_layout)
+        self.menu_list.bind(on_item_press=lambda instance, target: self.on_button_press(target))
+        self.set_buttons(button_texts)
 
         # Layout principal para o conjunto de botões
         main_layout = BoxLayout(
@@ -202,52 +239,82 @@ class BaseScreen(Screen):
         )
 
         # Adiciona elementos ao layout
-        main_layout.add_widget(scroll_view)
+        main_layout.add_widget(self.menu_list)
 
         # Adiciona o layout de botões ao conteúdo da tela
         self.content_layout.add_widget(main_layout)
 
-# Define your screens
-class HomeScreen(BaseScreen):
-    def __init__(self, **kwargs):
-        super(HomeScreen, self).__init__('assets/imagens/background.png', **kwargs)
-
-        self.create_title('ACESSO')
-
-        button_texts = [
-            ('INICIAR', 'starting_screen'),
-            ('SOBRE O APP', 'about_screen'),
+    def set_buttons(self, button_texts):
+        # Guarda os destinos dos botões (usado para pré-carregar as próximas telas)
+        self.button_texts = button_texts
+        self.image_sources = [
+            popup_image_source(screen_name)
+            for _, screen_name in button_texts
+            if has_question_image(screen_name)
         ]
-
-        self.create_buttons(button_texts)
-
-# Level 1 Screens
-class StartingScreen(BaseScreen):
-    def __init__(self, **kwargs):
-        super(StartingScreen, self).__init__('assets/imagens/background.png', **kwargs)
-        
-        self.create_title('SELECIONE A ETAPA DA ENTREVISTA')
-
-        button_texts = [
-            ('IDENTIFICAÇÃO', 'identificacao'),
-            ('QUEIXA PRINCIPAL', 'queixa_principal'),
-            ('HMA', 'HMA'),
-            ('HISTÓRIA PREGRESSA', 'HPP'),
-            ('HISTÓRIA FISIOLÓGICA', 'Hfisio'),
-            ('HISTÓRIA FAMILIAL', 'Hfamilial'),
-            ('HISTÓRIA FAMILIAR', 'Hfamiliar'),
-            ('HISTÓRIA PSICOSSOCIAL', 'Hpsico'),
-            ('USO DE SUBSTÂNCIAS', 'subst'),
-            ('HÁBITOS DE VIDA', 'habitos'),
-            ('REVISÃO DE SISTEMAS', 'revisao_sistemas'),
-        ]
-
-        self.create_buttons(button_texts)
-        self.add_back_button()
+        self.menu_list.set_items(button_texts)
+
+    def on_button_press(self, target):
+        if target in constants.RELACAO_IMAGENS_TEXTOS.keys():
+            question_text = constants.RELACAO_IMAGENS_TEXTOS[target][0]
+            self.show_image_popup(question_image_source(target), '', question_text, target)
+        elif target == 'exportar_resumo':
+            if self.manager and hasattr(self.manager, 'export_summary'):
+                self.manager.export_summary()
+        else:
+            self.go_to_screen(target)
+
+# Estrutura pré-compilada de uma tela da árvore (constants.ARVORE_TELAS)
+ScreenSpec = namedtuple('ScreenSpec', ['name', 'title', 'button_texts', 'back_button'])
+
+screen_tree = None
+
+def load_screen_tree():
+    # Converte a árvore de telas em ScreenSpecs uma única vez
+    global screen_tree
+    if screen_tree is None:
+        screen_tree = {
+            name: ScreenSpec(
+                name=name,
+                title=data['titulo'],
+                button_texts=tuple((text, target) for text, target in data['botoes']),
+                back_button=data.get('voltar', True),
+            )
+            for name, data in constants.ARVORE_TELAS.items()
+        }
+    return screen_tree
+
+class MenuScreen(BaseScreen):
+    # Tela genérica construída a partir de um ScreenSpec da árvore
+    def __init__(self, spec, **kwargs):
+        super(MenuScreen, self).__init__(**kwargs)
+        self.spec = spec
+
+        self.create_title(spec.title)
+        self.create_buttons(spec.button_texts)
+
+        if spec.back_button:
+            # Add home button
+            self.add_back_button()
+
+    def bind_spec(self, spec):
+        # Reaproveita esta tela para outro nó da árvore (modo de reciclagem),
+        # trocando título e botões sem recriar os widgets
+        self.spec = spec
+        self.title_label.text = spec.title
+        self.title_label.height = self.title_label.texture_height + 20
+        with profiling.timer('create_buttons', screen=spec.name):
+            self.set_buttons(spec.button_texts)
+
+        if spec.back_button and self.back_button is None:
+            self.add_back_button()
+        elif not spec.back_button and self.back_button is not None:
+            self.layout.remove_widget(self.back_button)
+            self.back_button = None
 
 class AboutScreen(BaseScreen):
     def __init__(self, **kwargs):
-        super(AboutScreen, self).__init__('assets/imagens/background.png', **kwargs)
+        super(AboutScreen, self).__init__(**kwargs)
 
         self.create_title('SOBRE O APP')
 
@@ -274,416 +341,60 @@ class AboutScreen(BaseScreen):
         # Add home button
         self.add_back_button()
 
-# Level 2 Screens
-class IdentificacaoScreen(BaseScreen):
-    def __init__(self, **kwargs):
-        super(IdentificacaoScreen, self).__init__('assets/imagens/background.png', **kwargs)
+search_index = None
 
-        self.create_title('IDENTIFICAÇÃO')
+def get_search_index():
+    # Índice de busca montado uma única vez, na primeira abertura da busca
+    global search_index
+    if search_index is None:
+        search_index = build_index(load_screen_tree(), constants.RELACAO_IMAGENS_TEXTOS)
+    return search_index
 
-        button_texts = [
-            ('NOME', 'identificacao_nome'),
-            ('IDADE', 'identificacao_idade'),
-            ('NATURALIDADE', 'identificacao_naturalidade'),
-            ('ESTADO CIVIL', 'identificacao_estado_civil'),
-            ('PROFISSÃO', 'identificacao_profissao'),
-        ]
-
-        self.create_buttons(button_texts)
-
-        # Add home button
-        self.add_back_button()
-
-class QueixaPrincipalScreen(BaseScreen):
+class SearchScreen(BaseScreen):
+    # Busca por perguntas e telas enquanto o médico digita. Tocar em um
+    # resultado abre o popup da pergunta (ou a tela) diretamente
     def __init__(self, **kwargs):
-        super(QueixaPrincipalScreen, self).__init__('assets/imagens/background.png', **kwargs)
+        super(SearchScreen, self).__init__(**kwargs)
 
-        self.create_title('QUEIXA PRINCIPAL')
-
-        button_texts = [
-            ('PERGUNTA ABERTA', 'queixa_principal_pergunta_aberta'),
-            ('IMAGENS AUXILIARES', 'queixa_principal_imagens_auxiliares'),
-        ]
+        self.create_title('BUSCAR')
 
-        self.create_buttons(button_texts)
-
-        # Add home button
-        self.add_back_button()
-
-class HMAScreen(BaseScreen):
-    def __init__(self, **kwargs):
-        super(HMAScreen, self).__init__('assets/imagens/background.png', **kwargs)
-        self.create_title('HMA')
-
-        button_texts = [
-            ('INÍCIO DOS SINTOMAS', 'HMA_inicio'),
-            ('LOCAL DOS SINTOMAS', 'HMA_local'),
-            ('EVOLUÇÃO DOS SINTOMAS', 'HMA_evolucao'),
-            ('IRRADIAÇÃO DOS SINTOMAS', 'HMA_irradiacao'),
-            ('SINTOMAS ASSOCIADOS', 'HMA_sintomas'),
-            ('FATOR DESENCADEANTE', 'HMA_desencadeante'),
-            ('FATOR AGRAVANTE', 'HMA_agravante'),
-            ('FATOR ATENUANTE', 'HMA_atenuante'),
-            ('MEDICAMENTOS NÃO CRÔNICOS', 'HMA_medicamentos_nao_cronicos'),
-            # ('DECÁLOGO DA DOR', 'HMA_decalogo'),
-        ]
-
-        self.create_buttons(button_texts)
-
-        # Add home button
-        self.add_back_button()
-
-class HPPScreen(BaseScreen):
-    def __init__(self, **kwargs):
-        super(HPPScreen, self).__init__('assets/imagens/background.png', **kwargs)
-        self.create_title('HPP')
-
-        button_texts = [
-            ('CIRURGIAS', 'HPP_cirurgias'),
-            ('ALERGIAS', 'HPP_alergias'),
-            ('DCNT', 'HPP_DCNT'),
-            ('MEDICAMENTOS CRÔNICOS', 'HPP_medicamentos_cronicos'),
-            ('CALENDÁRIO VACINAL', 'HPP_vacinacao'),
-        ]
-
-        self.create_buttons(button_texts)
-
-        # Add home button
-        self.add_back_button()
-
-class HistoriaFisiologicaScreen(BaseScreen):
-    def __init__(self, **kwargs):
-        super(HistoriaFisiologicaScreen, self).__init__('assets/imagens/background.png', **kwargs)
-        self.create_title('HISTÓRIA FISIOLÓGICA')
-
-        button_texts = [
-            ('DUM', 'Hfisio_DUM'),
-            ('RELAÇÃO SEXUAL', 'Hfisio_relacao_sexual'),
-            ('GESTAÇÃO', 'Hfisio_gestacao'),
-            ('EXAMES PREVENTIVOS', 'Hfisio_exames_preventivos'),
-            ('MENOPAUSA', 'Hfisio_menopausa'),
-            ('PUBERDADE', 'Hfisio_puberdade'),
-        ]
-
-        self.create_buttons(button_texts)
-
-        # Add home button
-        self.add_back_button()
-
-class HistoriaFamilialScreen(BaseScreen):
-    def __init__(self, **kwargs):
-        super(HistoriaFamilialScreen, self).__init__('assets/imagens/background.png', **kwargs)
-        self.create_title('HISTÓRIA FAMILIAL')
-
-        button_texts = [
-            ('DOENÇAS NO TRABALHO', 'Hfamilial_trabalho'),
-            ('DOENÇAS NA ESCOLA', 'Hfamilial_escola'),
-        ]
-
-        self.create_buttons(button_texts)
-
-        # Add home button
-        self.add_back_button()
-
-class HistoriaFamiliarScreen(BaseScreen):
-    def __init__(self, **kwargs):
-        super(HistoriaFamiliarScreen, self).__init__('assets/imagens/background.png', **kwargs)
-        self.create_title('HISTÓRIA FAMILIAR')
-
-        button_texts = [
-            ('DCNT', 'Hfamiliar_DCNT'),
-            ('ÓBITOS', 'Hfamiliar_obitos'),
-        ]
-
-        self.create_buttons(button_texts)
-
-        # Add home button
-        self.add_back_button()
-
-class HistoriaPsicossocialScreen(BaseScreen):
-    def __init__(self, **kwargs):
-        super(HistoriaPsicossocialScreen, self).__init__('assets/imagens/background.png', **kwargs)
-        self.create_title('HISTÓRIA PSICOSSOCIAL')
-
-        button_texts = [
-            ('RENDA FAMILIAR', 'Hpsico_renda'),
-            ('RELIGIÃO', 'Hpsico_religiao'),
-            ('ESCOLARIDADE', 'Hpsico_escolaridade'),
-            ('HABITAÇÃO', 'Hpsico_habitacao'),
-            ('RELAÇÕES FAMILIARES', 'Hpsico_relacoes'),
-        ]
-
-        self.create_buttons(button_texts)
-
-        # Add home button
-        self.add_back_button()
-
-class SubstanciasScreen(BaseScreen):
-    def __init__(self, **kwargs):
-        super(SubstanciasScreen, self).__init__('assets/imagens/background.png', **kwargs)
-        self.create_title('HISTÓRIA PSICOSSOCIAL')
-
-        button_texts = [
-            ('ÁLCOOL', 'subst_alcool'),
-            ('TABACO', 'subst_tabaco'),
-            ('DROGAS ILÍCITAS', 'subst_drogas_ilicitas'),
-        ]
-
-        self.create_buttons(button_texts)
-
-        # Add home button
-        self.add_back_button()
-
-class HabitosDeVidaScreen(BaseScreen):
-    def __init__(self, **kwargs):
-        super(HabitosDeVidaScreen, self).__init__('assets/imagens/background.png', **kwargs)
-        self.create_title('HÁBITOS DE VIDA')
-
-        button_texts = [
-            ('ATIVIDADE FÍSICA', 'habitos_atividade_fisica'),
-            ('SONO', 'habitos_sono'),
-            ('ALIMENTAÇÃO', 'habitos_alimentacao'),
-            ('HIGIENE', 'habitos_higiene'),
-        ]
-
-        self.create_buttons(button_texts)
-
-        # Add home button
-        self.add_back_button()
-
-class RevisaoDeSistemasScreen(BaseScreen):
-    def __init__(self, **kwargs):
-        super(RevisaoDeSistemasScreen, self).__init__('assets/imagens/background.png', **kwargs)
-        self.create_title('HÁBITOS DE VIDA')
-
-        button_texts = [
-            ('CARDIOVASCULAR', 'revisao_sistemas_cardiovascular'),
-            ('RESPIRAÇÃO', 'revisao_sistemas_respiratorio'),
-            ('TGI', 'revisao_sistemas_TGI'),
-            ('UROGENITAL', 'revisao_sistemas_urogenital'),
-            ('NEUROLÓGICO', 'revisao_sistemas_neurologico'),
-            ('HEMATOLÓGICO', 'revisao_sistemas_hematologico'),
-            ('ENDÓCRINO', 'revisao_sistemas_endocrino'),
-            ('OSTEOMUSCULAR', 'revisao_sistemas_osteomuscular'),
-        ]
-
-        self.create_buttons(button_texts)
-
-        # Add home button
-        self.add_back_button()
-
-# Level 3 Screens
-class HMAMedicamentosNaoCronicosScreen(BaseScreen):
-    def __init__(self, **kwargs):
-        super(HMAMedicamentosNaoCronicosScreen, self).__init__('assets/imagens/background.png', **kwargs)
-        self.create_title('MEDICAMENTOS NÃO CRÔNICOS')
-
-        button_texts = [
-            ('MEDICAMENTO', 'HMA_medicamentos_nao_cronicos_tipo'),
-            ('DOSE', 'HMA_medicamentos_nao_cronicos_dose'),
-            ('POSOLOGIA', 'HMA_medicamentos_nao_cronicos_posologia'),
-        ]
-
-        self.create_buttons(button_texts)
-
-        # Add home button
-        self.add_back_button()
-
-class HMADecalogoDaDorScreen(BaseScreen):
-    def __init__(self, **kwargs):
-        super(HMADecalogoDaDorScreen, self).__init__('assets/imagens/background.png', **kwargs)
-        self.create_title('DECÁLOGO DA DOR')
-
-        button_texts = [
-            ('LOCALIZAÇÃO', 'HMA_decalogo_localizacao'),
-            ('IRRADIAÇÃO', 'HMA_decalogo_irradiacao'),
-            ('QUALIDADE', 'HMA_decalogo_qualidade'),
-            ('INTENSIDADE', 'HMA_decalogo_intensidade'),
-            ('DURAÇÃO', 'HMA_decalogo_duracao'),
-            ('EVOLUÇÃO', 'HMA_decalogo_evolucao'),
-            ('RELAÇÃO COM FUNÇÕES ORGÂNICAS', 'HMA_decalogo_relacao'),
-            ('FATOR DESENCADEANTE', 'HMA_decalogo_desencadeante'),
-            ('FATOR AGRAVANTE', 'HMA_decalogo_agravante'),
-            ('FATOR ATENUANTE', 'HMA_decalogo_atenuante'),
-            ('SINTOMAS ASSOCIADOS', 'HMA_decalogo_sintomas'),
-        ]
-
-        self.create_buttons(button_texts)
-
-        # Add home button
-        self.add_back_button()
-
-class HPPCirurgiasScreen(BaseScreen):
-    def __init__(self, **kwargs):
-        super(HPPCirurgiasScreen, self).__init__('assets/imagens/background.png', **kwargs)
-        self.create_title('CIRURGIAS')
-
-        button_texts = [
-            ('FEZ OU NÃO', 'HPP_cirurgias_sim_nao'),
-            ('QUANTIDADE', 'HPP_cirurgias_quantidade'),
-        ]
-
-        self.create_buttons(button_texts)
-
-        # Add home button
-        self.add_back_button()
-
-class HPPMedicamentosCronicosScreen(BaseScreen):
-    def __init__(self, **kwargs):
-        super(HPPMedicamentosCronicosScreen, self).__init__('assets/imagens/background.png', **kwargs)
-        self.create_title('MEDICAMENTOS CRÔNICOS')
-
-        button_texts = [
-            ('MEDICAMENTO', 'HPP_medicamentos_cronicos_tipo'),
-            ('DOSE', 'HPP_medicamentos_cronicos_dose'),
-            ('POSOLOGIA', 'HPP_medicamentos_cronicos_posologia'),
-        ]
-
-        self.create_buttons(button_texts)
-
-        # Add home button
-        self.add_back_button()
-
-class HistoriaFisiologicaRelacaoSexualScreen(BaseScreen):
-    def __init__(self, **kwargs):
-        super(HistoriaFisiologicaRelacaoSexualScreen, self).__init__('assets/imagens/background.png', **kwargs)
-        self.create_title('RELAÇÃO SEXUAL')
-
-        button_texts = [
-            ('PRATICA OU NÃO', 'Hfisio_relacao_sexual_sim_nao'),
-            ('FREQUÊNCIA', 'Hfisio_relacao_sexual_frequencia'),
-            ('PARCEIROS', 'Hfisio_relacao_sexual_parceiros'),
-            ('CONTRACEPTIVOS', 'Hfisio_relacao_sexual_contraceptivos'),
-        ]
-
-        self.create_buttons(button_texts)
-
-        # Add home button
-        self.add_back_button()
-
-class HistoriaFisiologicaGestacaoScreen(BaseScreen):
-    def __init__(self, **kwargs):
-        super(HistoriaFisiologicaGestacaoScreen, self).__init__('assets/imagens/background.png', **kwargs)
-        self.create_title('GESTAÇÃO')
-
-        button_texts = [
-            ('QUANTIDADE', 'Hfisio_gestacoes_quantidade'),
-            ('TIPO DE PARTO', 'Hfisio_gestacoes_partos'),
-            ('ABORTAMENTOS', 'Hfisio_gestacoes_abortos'),
-        ]
-
-        self.create_buttons(button_texts)
-
-        # Add home button
-        self.add_back_button()
-
-class HistoriaFisiologicaExamesPreventivosScreen(BaseScreen):
-    def __init__(self, **kwargs):
-        super(HistoriaFisiologicaExamesPreventivosScreen, self).__init__('assets/imagens/background.png', **kwargs)
-        self.create_title('EXAMES PREVENTIVOS')
-
-        button_texts = [
-            ('CITOPATOLÓGICO', 'Hfisio_exames_preventivos_citopatologico'),
-            ('MAMOGRAFIA', 'Hfisio_exames_preventivos_mamografia'),
-        ]
-
-        self.create_buttons(button_texts)
-
-        # Add home button
-        self.add_back_button()
-
-class HistoriaFisiologicaMenopausaScreen(BaseScreen):
-    def __init__(self, **kwargs):
-        super(HistoriaFisiologicaMenopausaScreen, self).__init__('assets/imagens/background.png', **kwargs)
-        self.create_title('MENOPAUSA')
-
-        button_texts = [
-            ('INÍCIO', 'Hfisio_menopausa_inicio'),
-            ('SINTOMAS', 'Hfisio_menopausa_sintomas'),
-        ]
-
-        self.create_buttons(button_texts)
-
-        # Add home button
-        self.add_back_button()
-
-class HistoriaFisiologicaPuberdadeScreen(BaseScreen):
-    def __init__(self, **kwargs):
-        super(HistoriaFisiologicaPuberdadeScreen, self).__init__('assets/imagens/background.png', **kwargs)
-        self.create_title('PUBERDADE')
-
-        button_texts = [
-            ('MENARCA', 'Hfisio_puberdade_menarca'),
-            ('TELARCA', 'Hfisio_puberdade_telarca'),
-            ('PUBARCA', 'Hfisio_puberdade_pubarca'),
-            # ('SEXARCA', 'Hfisio_puberdade_sexarca'),
-        ]
-
-        self.create_buttons(button_texts)
-
-        # Add home button
-        self.add_back_button()
-
-class HistoriaPsicossocialHabitacaoScreen(BaseScreen):
-    def __init__(self, **kwargs):
-        super(HistoriaPsicossocialHabitacaoScreen, self).__init__('assets/imagens/background.png', **kwargs)
-        self.create_title('HABITAÇÃO')
-
-        button_texts = [
-            ('LOCAL', 'Hpsico_habitacao_local'),
-            ('CONDIÇÕES', 'Hpsico_habitacao_condicoes'),
-            ('SANEAMENTO', 'Hpsico_habitacao_saneamento'),
-        ]
-
-        self.create_buttons(button_texts)
-
-        # Add home button
-        self.add_back_button()
-
-class SubstanciasAlcoolScreen(BaseScreen):
-    def __init__(self, **kwargs):
-        super(SubstanciasAlcoolScreen, self).__init__('assets/imagens/background.png', **kwargs)
-        self.create_title('ÁLCOOL')
-
-        button_texts = [
-            ('FAZ USO', 'subst_alcool_uso'),
-            ('INÍCIO DO USO', 'subst_alcool_inicio'),
-            ('DOSE', 'subst_alcool_quantidade'),
-        ]
-
-        self.create_buttons(button_texts)
-
-        # Add home button
-        self.add_back_button()
-
-class SubstanciasTabacoScreen(BaseScreen):
-    def __init__(self, **kwargs):
-        super(SubstanciasTabacoScreen, self).__init__('assets/imagens/background.png', **kwargs)
-        self.create_title('TABACO')
-
-        button_texts = [
-            ('FAZ USO', 'subst_tabaco_uso'),
-            ('INÍCIO DO USO', 'subst_tabaco_inicio'),
-            ('DOSE', 'subst_tabaco_quantidade'),
-        ]
+        self.search_input = TextInput(
+            hint_text='Pergunta ou seção',
+            multiline=False,
+            size_hint=(1, None),
+            height=40,
+            font_size=constants.BUTTON_FONT_SIZE * 0.8
+        )
+        self.search_input.bind(text=lambda instance, text: self.update_results(text))
+        self.content_layout.add_widget(self.search_input)
 
-        self.create_buttons(button_texts)
+        self.create_buttons([])
 
         # Add home button
         self.add_back_button()
 
-class SubstanciasDrogasIlicitasScreen(BaseScreen):
-    def __init__(self, **kwargs):
-        super(SubstanciasDrogasIlicitasScreen, self).__init__('assets/imagens/background.png', **kwargs)
-        self.create_title('DROGAS ILÍCITAS')
-
-        button_texts = [
-            ('FAZ USO', 'subst_drogas_ilicitas_uso'),
-            ('INÍCIO DO USO', 'subst_drogas_ilicitas_inicio'),
-            ('DOSE', 'subst_drogas_ilicitas_quantidade'),
-        ]
-
-        self.create_buttons(button_texts)
-
-        # Add home button
-        self.add_back_button()
\ No newline at end of file
+    def update_results(self, query):
+        with instrumentation.timer('search', length=len(query)):
+            results = get_search_index().search(query, constants.SEARCH_MAX_RESULTS)
+        self.set_buttons([
+            (f'{label} ({detail})' if detail else label, target)
+            for label, target, detail in results
+        ])
+
+    def on_button_press(self, target):
+        # Telas abrem com a pilha do botão voltar montada pelo caminho da árvore
+        if target in load_screen_tree() and hasattr(self.manager, 'jump_to_section'):
+            self.manager.jump_to_section(target)
+        else:
+            super(SearchScreen, self).on_button_press(target)
+
+    def on_enter(self, *args):
+        super(SearchScreen, self).on_enter(*args)
+        self.search_input.focus = True
+
+def screen_factories():
+    # Nome da tela -> fábrica, usado pelo CustomScreenManager para construir sob demanda
+    factories = {name: partial(MenuScreen, spec) for name, spec in load_screen_tree().items()}
+    factories['about_screen'] = AboutScreen
+    factories['search_screen'] = SearchScreen
+    return factories
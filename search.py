@@ -0,0 +1,76 @@
+# search.py
+import heapq
+import re
+import unicodedata
+
+from navigation import section_paths
+
+def fold(text):
+    # Minúsculas e sem acentos: 'Gestação' -> 'gestacao'
+    decomposed = unicodedata.normalize('NFKD', text.lower())
+    return ''.join(char for char in decomposed if not unicodedata.combining(char))
+
+def tokenize(text):
+    return re.findall(r'\w+', fold(text))
+
+class SearchIndex(object):
+    # Índice de busca por prefixo: cada prefixo de cada palavra aponta para
+    # as entradas que o contêm. Montado uma vez; a busca só cruza conjuntos,
+    # sem percorrer as entradas nem normalizar textos a cada tecla
+    def __init__(self):
+        # (rótulo, destino, texto de apoio); o destino é uma tela ou pergunta
+        self.entries = []
+        self.prefixes = {}
+
+    def add(self, label, target, detail='', keywords=()):
+        entry_id = len(self.entries)
+        self.entries.append((label, target, detail))
+        tokens = set(tokenize(label)) | set(tokenize(detail))
+        for keyword in keywords:
+            tokens.update(tokenize(keyword))
+        for token in tokens:
+            for end in range(1, len(token) + 1):
+                self.prefixes.setdefault(token[:end], set()).add(entry_id)
+        return entry_id
+
+    def search(self, query, limit=20):
+        # Todas as palavras da busca precisam casar (como prefixo) com
+        # alguma palavra da entrada. Ordem: menos palavras na entrada primeiro
+        tokens = tokenize(query)
+        if not tokens:
+            return []
+        # Começa pelo menor conjunto para que a interseção seja barata
+        matches = sorted((self.prefixes.get(token, set()) for token in tokens), key=len)
+        result = matches[0]
+        for match in matches[1:]:
+            result = result & match
+            if not result:
+                return []
+        # Só as `limit` melhores são ordenadas, mesmo que muitas casem
+        ranked = heapq.nsmallest(limit, result, key=lambda entry_id: (len(self.entries[entry_id][0]), entry_id))
+        return [self.entries[entry_id] for entry_id in ranked]
+
+def build_index(tree, questions, root='home_screen'):
+    # Indexa só o que dá para alcançar a partir da tela inicial
+    # (navigation.section_paths): telas (título e rótulos dos botões que
+    # levam a elas) e perguntas (texto e rótulo do botão). O texto de apoio
+    # traz a seção e o botão, para distinguir perguntas com o mesmo texto
+    paths = section_paths({name: spec.button_texts for name, spec in tree.items()}, root)
+    index = SearchIndex()
+    labels = {}
+    for name in paths:
+        for text, target in tree[name].button_texts:
+            labels.setdefault(target, []).append(text)
+
+    for name, path in paths.items():
+        if name == root:
+            continue
+        parents = [tree[parent].title for parent in path if parent != root]
+        index.add(tree[name].title, name, ' › '.join(parents), labels.get(name, []))
+
+    for name in paths:
+        spec = tree[name]
+        for text, target in spec.button_texts:
+            if target in questions and target not in tree and questions[target]:
+                index.add(questions[target][0].capitalize(), target, f'{spec.title} › {text}')
+    return index
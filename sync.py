@@ -0,0 +1,243 @@
+# sync.py
+#
+# Envio das consultas finalizadas para o servidor da clínica, em segundo
+# plano. As consultas pendentes são agrupadas em lotes; cada lote é gravado
+# comprimido (gzip) em um arquivo de envio com um id próprio e enviado em
+# pedaços por uma conexão HTTP persistente (keep-alive):
+#     HEAD  <url>/<lote>   -> Upload-Offset: bytes já recebidos pelo servidor
+#     PATCH <url>/<lote>   Upload-Offset/Upload-Length + pedaço -> novo Upload-Offset
+# Se a conexão cair, o lote continua do ponto que o servidor confirmou, com
+# o mesmo arquivo. Só um lote é montado por vez e cada pedaço espera a
+# interface ficar ociosa, então o envio não disputa com a thread principal.
+# Ativado por constants.SYNC_URL ou pela variável de ambiente ACESSO_SYNC_URL;
+# tools/sync_server.py é um servidor de teste local
+import gzip
+import http.client
+import json
+import os
+import random
+import sqlite3
+import threading
+import time
+import uuid
+from urllib.parse import urlsplit
+
+import constants
+import instrumentation
+
+SPOOL_SUFFIX = '.json.gz'
+
+class SyncError(Exception):
+    pass
+
+class SyncEngine(object):
+    def __init__(self, store, url, spool_dir, batch_size=constants.SYNC_BATCH_SIZE,
+                 chunk_bytes=constants.SYNC_CHUNK_BYTES, idle_seconds=constants.SYNC_IDLE_SECONDS):
+        self.store = store
+        parts = urlsplit(url)
+        self.scheme = parts.scheme
+        self.host = parts.hostname
+        self.port = parts.port
+        self.base_path = parts.path.rstrip('/')
+        self.spool_dir = spool_dir
+        self.batch_size = batch_size
+        self.chunk_bytes = chunk_bytes
+        self.idle_seconds = idle_seconds
+        self.connection = None
+        self.last_activity = 0
+        self.wake_event = threading.Event()
+        self.stop_event = threading.Event()
+        self.metrics = {
+            'batches': 0, 'records': 0, 'bytes_raw': 0, 'bytes_compressed': 0,
+            'bytes_sent': 0, 'requests': 0, 'connections': 0, 'retries': 0,
+            'resumed': 0, 'send_seconds': 0.0, 'last_error': None,
+        }
+        os.makedirs(spool_dir, exist_ok=True)
+        self.thread = threading.Thread(target=self.run, name='sync', daemon=True)
+        self.thread.start()
+
+    def touch(self):
+        # Chamado pela thread principal a cada interação do usuário
+        self.last_activity = time.monotonic()
+
+    def wake(self):
+        # Há consultas novas para enviar
+        self.wake_event.set()
+
+    def close(self, timeout=1):
+        # Não espera o fim de um envio em andamento: o lote é retomado na
+        # próxima vez que o app abrir
+        self.stop_event.set()
+        self.wake_event.set()
+        self.thread.join(timeout)
+        self.disconnect()
+
+    def stats(self):
+        stats = dict(self.metrics)
+        seconds = stats.pop('send_seconds')
+        stats['throughput_kb_s'] = round(stats['bytes_sent'] / 1024 / seconds, 1) if seconds else 0
+        if stats['bytes_raw']:
+            stats['compression_ratio'] = round(stats['bytes_compressed'] / stats['bytes_raw'], 3)
+        return stats
+
+    def run(self):
+        # As tabelas são criadas pela thread de escrita do banco: numa
+        # instalação nova elas ainda não existem quando o envio começa
+        self.store.ready.wait()
+        released = False
+        retry_delay = constants.SYNC_RETRY_MIN
+        while not self.stop_event.is_set():
+            try:
+                if not released:
+                    self.release_lost_batches()
+                    released = True
+                # Limpa antes de procurar: um wake() durante ou depois da
+                # busca faz o wait() abaixo voltar na hora
+                self.wake_event.clear()
+                batch = self.next_batch()
+                if batch is None:
+                    self.wake_event.wait(constants.SYNC_INTERVAL)
+                    continue
+                self.upload(*batch)
+                retry_delay = constants.SYNC_RETRY_MIN
+            except (OSError, http.client.HTTPException, sqlite3.Error, SyncError) as e:
+                # Sem rede, servidor fora do ar ou banco ocupado: tenta de novo com
+                # espera crescente (com variação, para os aparelhos não voltarem juntos)
+                self.disconnect()
+                self.metrics['retries'] += 1
+                self.metrics['last_error'] = str(e) or type(e).__name__
+                print(f"Sync failed, retrying in {retry_delay:.0f} s: {self.metrics['last_error']}")
+                self.stop_event.wait(retry_delay * random.uniform(0.5, 1))
+                retry_delay = min(retry_delay * 2, constants.SYNC_RETRY_MAX)
+
+    # Lotes
+
+    def spool_path(self, batch_id):
+        return os.path.join(self.spool_dir, f'{batch_id}{SPOOL_SUFFIX}')
+
+    def release_lost_batches(self):
+        # Lotes marcados no banco cujo arquivo não chegou a ser gravado (app
+        # encerrado no meio): as consultas voltam a ficar pendentes
+        for batch_id in self.store.open_batches():
+            if not os.path.exists(self.spool_path(batch_id)):
+                self.store.release_batch(batch_id)
+        self.store.flush()
+
+    def next_batch(self):
+        # Um lote interrompido é retomado antes de montar um novo
+        for name in sorted(os.listdir(self.spool_dir)):
+            if name.endswith(SPOOL_SUFFIX):
+                return name[:-len(SPOOL_SUFFIX)], os.path.join(self.spool_dir, name)
+
+        rows = self.store.pending_uploads(self.batch_size)
+        if not rows:
+            return None
+        batch_id = uuid.uuid4().hex
+        consultations = []
+        for consultation_id, started_at, finished_at in rows:
+            answers = self.store.answers(consultation_id)
+            consultations.append({
+                'id': consultation_id,
+                'started_at': started_at,
+                'finished_at': finished_at,
+                'answers': [[key, answer, answered_at] for key, (answer, answered_at) in answers.items()],
+            })
+        raw = json.dumps({'batch': batch_id, 'consultations': consultations},
+                         separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+        data = gzip.compress(raw)
+
+        # As consultas são marcadas antes de o arquivo existir: se o app
+        # cair entre os dois passos, release_lost_batches as libera
+        self.store.assign_batch(batch_id, [row[0] for row in rows])
+        self.store.flush()
+        path = self.spool_path(batch_id)
+        with open(f'{path}.tmp', 'wb') as f:
+            f.write(data)
+        os.replace(f'{path}.tmp', path)
+        self.metrics['records'] += len(rows)
+        self.metrics['bytes_raw'] += len(raw)
+        self.metrics['bytes_compressed'] += len(data)
+        return batch_id, path
+
+    def upload(self, batch_id, path):
+        start = time.perf_counter()
+        total = os.path.getsize(path)
+        url = f'{self.base_path}/{batch_id}'
+        status, headers = self.request('HEAD', url)
+        offset = int(headers.get('Upload-Offset', 0)) if status == 200 else 0
+        if offset:
+            self.metrics['resumed'] += 1
+
+        with open(path, 'rb') as f:
+            while offset < total:
+                if not self.wait_for_idle():
+                    return
+                f.seek(offset)
+                chunk = f.read(self.chunk_bytes)
+                chunk_start = time.perf_counter()
+                status, headers = self.request('PATCH', url, chunk, {
+                    'Upload-Offset': str(offset),
+                    'Upload-Length': str(total),
+                    'Content-Type': 'application/offset+octet-stream',
+                })
+                self.metrics['send_seconds'] += time.perf_counter() - chunk_start
+                # 409: o servidor tem outra posição (ex.: pedaço recebido
+                # mas confirmação perdida); continua de onde ele está
+                if status not in (200, 204, 409) or 'Upload-Offset' not in headers:
+                    raise SyncError(f'upload of batch {batch_id} failed with HTTP {status}')
+                if status != 409:
+                    self.metrics['bytes_sent'] += len(chunk)
+                offset = int(headers['Upload-Offset'])
+
+        # Sem esperar a gravação: se o app cair antes dela, o lote volta a ser
+        # enviado e o servidor identifica as consultas repetidas pelo id
+        self.store.mark_uploaded(batch_id)
+        os.remove(path)
+        self.metrics['batches'] += 1
+        if instrumentation.enabled:
+            instrumentation.timed('sync_batch', (time.perf_counter() - start) * 1000, bytes=total)
+
+    def wait_for_idle(self):
+        # Espera idle_seconds sem interação do usuário; False ao encerrar
+        while not self.stop_event.is_set():
+            remaining = self.last_activity + self.idle_seconds - time.monotonic()
+            if remaining <= 0:
+                return True
+            self.stop_event.wait(remaining)
+        return False
+
+    # HTTP
+
+    def connect(self):
+        if self.connection is None:
+            connection_class = http.client.HTTPSConnection if self.scheme == 'https' else http.client.HTTPConnection
+            self.connection = connection_class(self.host, self.port, timeout=constants.SYNC_TIMEOUT)
+            self.metrics['connections'] += 1
+        return self.connection
+
+    def disconnect(self):
+        if self.connection is not None:
+            self.connection.close()
+            self.connection = None
+
+    def request(self, method, url, body=None, headers=None):
+        # Reaproveita a conexão aberta; se o servidor a fechou enquanto estava
+        # ociosa, abre outra e repete uma vez
+        for attempt in range(2):
+            reused = self.connection is not None
+            connection = self.connect()
+            try:
+                connection.request(method, url, body=body, headers=headers or {})
+                response = connection.getresponse()
+                # Lê a resposta inteira para a conexão poder ser reaproveitada
+                response.read()
+            except (http.client.RemoteDisconnected, BrokenPipeError, ConnectionResetError):
+                self.disconnect()
+                if reused and attempt == 0:
+                    self.metrics['retries'] += 1
+                    continue
+                raise
+            self.metrics['requests'] += 1
+            if response.will_close:
+                self.disconnect()
+            return response.status, response.headers
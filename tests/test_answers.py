@@ -0,0 +1,35 @@
+# tests/test_answers.py
+#
+# Banco de respostas (answers.py). Rodar a partir da raiz do projeto:
+#     python -m unittest discover tests
+import os
+import tempfile
+import threading
+import unittest
+
+from answers import AnswerStore
+
+class AnswerStoreTest(unittest.TestCase):
+    def test_flush_returns_when_database_cannot_open(self):
+        # Diretório de dados inexistente: a thread de escrita não abre o
+        # banco, e flush() (chamado em on_pause) não pode travar o app
+        with tempfile.TemporaryDirectory() as tmp:
+            store = AnswerStore(os.path.join(tmp, 'nao_existe', 'respostas.sqlite3'))
+            store.record('consulta', 'HMA_evolucao', 'piorou')
+            flushed = threading.Event()
+            threading.Thread(target=lambda: (store.flush(), flushed.set()), daemon=True).start()
+            self.assertTrue(flushed.wait(5))
+            self.assertIsNotNone(store.failed)
+            store.close()
+
+    def test_records_are_written(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            store = AnswerStore(os.path.join(tmp, 'respostas.sqlite3'))
+            consultation_id = store.start_consultation()
+            store.record(consultation_id, 'HMA_evolucao', 'piorou')
+            store.flush()
+            self.assertEqual(store.answers(consultation_id)['HMA_evolucao'][0], 'piorou')
+            store.close()
+
+if __name__ == '__main__':
+    unittest.main()
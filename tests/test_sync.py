@@ -0,0 +1,56 @@
+# tests/test_sync.py
+#
+# Envio das consultas (sync.py) contra o servidor de teste
+# (tools/sync_server.py). Rodar a partir da raiz do projeto:
+#     python -m unittest discover tests
+import os
+import tempfile
+import threading
+import time
+import unittest
+
+from answers import AnswerStore
+from sync import SyncEngine
+from tools.sync_server import UploadServer
+
+class SlowStore(AnswerStore):
+    # Banco que demora a abrir (disco lento, app ocupado na abertura)
+    def write_loop(self):
+        time.sleep(0.3)
+        super(SlowStore, self).write_loop()
+
+class SyncEngineTest(unittest.TestCase):
+    def setUp(self):
+        self.server = UploadServer(('127.0.0.1', 0))
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.tmp = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        self.tmp.cleanup()
+
+    def test_starts_right_after_a_new_store(self):
+        # Como em SlideApp.build: o envio começa antes de a thread de escrita
+        # criar as tabelas de um banco novo
+        store = SlowStore(os.path.join(self.tmp.name, 'respostas.sqlite3'))
+        engine = SyncEngine(store, f'http://127.0.0.1:{self.server.server_address[1]}/consultas',
+                            os.path.join(self.tmp.name, 'envio'), idle_seconds=0)
+        try:
+            consultation_id = store.start_consultation()
+            store.record(consultation_id, 'HMA_evolucao', 'piorou')
+            store.finish_consultation(consultation_id)
+            engine.wake()
+
+            deadline = time.monotonic() + 10
+            while consultation_id not in self.server.consultations and time.monotonic() < deadline:
+                time.sleep(0.05)
+            self.assertTrue(engine.thread.is_alive())
+            self.assertIn(consultation_id, self.server.consultations)
+            self.assertEqual(self.server.consultations[consultation_id]['answers'][0][:2], ['HMA_evolucao', 'piorou'])
+        finally:
+            engine.close()
+            store.close()
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,275 @@
+# textures.py
+import json
+import os.path
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+from kivy.clock import Clock
+from kivy.core.image import Image as CoreImage, ImageLoader
+from kivy.core.text import Label as CoreLabel
+
+import constants
+import profiling
+from bundle import load_bundled
+
+class TextureCache(object):
+    # Cache LRU de texturas limitado por um orçamento em bytes. As texturas
+    # menos usadas recentemente são descartadas quando o orçamento estoura.
+    # A decodificação das imagens roda em um conjunto de threads; só o envio
+    # da textura para a GPU acontece na thread principal
+    def __init__(self, max_bytes, decode_workers=2):
+        self.max_bytes = max_bytes
+        self.textures = OrderedDict()
+        self.sizes = {}
+        self.size_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.decode_workers = decode_workers
+        self.executor = None
+        # Fonte -> callbacks esperando a decodificação em andamento
+        self.pending = {}
+
+    def __contains__(self, source):
+        return source in self.textures
+
+    def get(self, source):
+        # Versão síncrona: decodifica na thread atual se não estiver no cache
+        texture = self.textures.get(source)
+        if texture is not None:
+            self.textures.move_to_end(source)
+            self.hits += 1
+            return texture
+
+        self.misses += 1
+        texture = self.load(source)
+        if texture is not None:
+            self.put(source, texture)
+        return texture
+
+    def get_async(self, source, callback):
+        # Chama callback(texture) na thread principal; imediatamente se a
+        # textura já está no cache, ou quando a decodificação terminar
+        texture = self.textures.get(source)
+        if texture is not None:
+            self.textures.move_to_end(source)
+            self.hits += 1
+            callback(texture)
+            return
+
+        self.misses += 1
+        self.decode(source, callback)
+
+    def decode(self, source, callback=None):
+        callbacks = self.pending.get(source)
+        if callbacks is not None:
+            if callback is not None:
+                callbacks.append(callback)
+            return
+
+        self.pending[source] = [callback] if callback is not None else []
+        if self.executor is None:
+            self.executor = ThreadPoolExecutor(max_workers=self.decode_workers, thread_name_prefix='decode')
+        future = self.executor.submit(self.decode_image, source)
+        future.add_done_callback(
+            lambda future: Clock.schedule_once(lambda dt: self.finish_decode(source, future), 0)
+        )
+
+    def decode_image(self, source):
+        # Roda em uma thread do conjunto: lê e decodifica os pixels, sem OpenGL.
+        # Usa o pacote de imagens quando existe; senão, os arquivos soltos
+        with profiling.timer('image_decode', source=source, thread=True):
+            image = load_bundled(source)
+            if image is None and os.path.exists(source):
+                image = ImageLoader.load(source, nocache=True)
+        if image is None:
+            print(f"Image not found: {source}")
+        return image
+
+    def finish_decode(self, source, future):
+        # Roda na thread principal: cria a textura a partir dos pixels decodificados
+        callbacks = self.pending.pop(source, [])
+        try:
+            image = future.result()
+        except Exception as e:
+            print(f"Failed to decode {source}: {e}")
+            image = None
+
+        texture = None
+        if image is not None:
+            with profiling.timer('texture_upload', source=source):
+                texture = image.texture
+            self.put(source, texture)
+
+        for callback in callbacks:
+            callback(texture)
+
+    def load(self, source):
+        image = load_bundled(source)
+        if image is not None:
+            with profiling.timer('image_decode', source=source):
+                return image.texture
+
+        if not os.path.exists(source):
+            print(f"Image not found: {source}")
+            return None
+        # nocache: quem controla o tempo de vida da textura é este cache,
+        # não o cache global do Kivy
+        with profiling.timer('image_decode', source=source):
+            return CoreImage(source, nocache=True).texture
+
+    def put(self, source, texture):
+        if source in self.textures:
+            self.discard(source)
+
+        size = texture.width * texture.height * len(texture.colorfmt)
+        self.textures[source] = texture
+        self.sizes[source] = size
+        self.size_bytes += size
+
+        # Descarta as menos usadas, mantendo ao menos a textura recém-inserida
+        while self.size_bytes > self.max_bytes and len(self.textures) > 1:
+            oldest = next(iter(self.textures))
+            self.discard(oldest)
+
+    def discard(self, source):
+        self.textures.pop(source, None)
+        self.size_bytes -= self.sizes.pop(source, 0)
+
+    def clear(self):
+        self.textures.clear()
+        self.sizes.clear()
+        self.size_bytes = 0
+
+    def prefetch(self, sources):
+        # Decodifica em segundo plano as imagens que ainda não estão no cache
+        for source in sources:
+            if source not in self.textures:
+                self.decode(source)
+
+    def stats(self):
+        return {
+            'textures': len(self.textures),
+            'bytes': self.size_bytes,
+            'max_bytes': self.max_bytes,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': round(self.hits / (self.hits + self.misses), 3) if self.hits + self.misses else None,
+        }
+
+class TextTextureCache(object):
+    # Cache LRU de textos renderizados, chaveado por (texto, fonte, tamanho,
+    # largura, negrito, cor). Textos repetidos entre telas ('DOSE', 'FAZ USO',
+    # ...) são rasterizados uma única vez
+    def __init__(self, max_entries):
+        self.max_entries = max_entries
+        self.labels = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, text, font_size, width=None, bold=False, color=(1, 1, 1, 1), font_name='Roboto'):
+        key = (text, font_name, font_size, width, bold, tuple(color))
+        label = self.labels.get(key)
+        if label is not None:
+            self.labels.move_to_end(key)
+            self.hits += 1
+            return label.texture
+
+        self.misses += 1
+        # O CoreLabel fica guardado para que a textura possa ser recriada se
+        # o contexto OpenGL for perdido (ex.: app pausado no Android)
+        label = CoreLabel(
+            text=text,
+            font_name=font_name,
+            font_size=font_size,
+            bold=bold,
+            color=color,
+            text_size=(width, None),
+            halign='center',
+        )
+        label.refresh()
+        self.labels[key] = label
+        if len(self.labels) > self.max_entries:
+            self.labels.popitem(last=False)
+        return label.texture
+
+    def stats(self):
+        return {
+            'texts': len(self.labels),
+            'hits': self.hits,
+            'misses': self.misses,
+        }
+
+variant_manifest = None
+
+def get_variant_manifest():
+    # Manifesto gerado por tools/build_assets.py, lido uma única vez
+    global variant_manifest
+    if variant_manifest is None:
+        try:
+            with open(constants.VARIANTS_MANIFEST, encoding='utf-8') as f:
+                variant_manifest = json.load(f)
+        except (OSError, ValueError):
+            variant_manifest = {}
+    return variant_manifest
+
+def pick_variant(entry, width, height):
+    # Escolhe a menor variante que ainda cobre a área de exibição
+    variants = sorted(entry['variants'].values(), key=lambda v: v['width'] * v['height'])
+    for variant in variants:
+        if variant['width'] >= width or variant['height'] >= height:
+            return variant['path']
+    # Nenhuma variante é grande o bastante: usa a imagem original
+    return entry['source']
+
+atlas_ids = None
+
+def get_atlas_ids():
+    # Mapeia o nome de cada imagem empacotada para o atlas que a contém
+    global atlas_ids
+    if atlas_ids is None:
+        atlas_ids = {}
+        for atlas_name in ('ui', 'thumbs'):
+            try:
+                with open(os.path.join(constants.ATLAS_DIR, f'{atlas_name}.atlas'), encoding='utf-8') as f:
+                    meta = json.load(f)
+            except (OSError, ValueError):
+                continue
+            for images in meta.values():
+                for image_id in images:
+                    atlas_ids[image_id] = atlas_name
+    return atlas_ids
+
+def atlas_source(source):
+    # Resolve um arquivo de imagem para a sua entrada no atlas, se existir
+    image_id = os.path.splitext(os.path.basename(source))[0]
+    atlas_name = get_atlas_ids().get(image_id)
+    if atlas_name is None:
+        return source
+    return f'atlas://{constants.ATLAS_DIR}/{atlas_name}/{image_id}'
+
+def thumbnail_source(question_key):
+    entry = get_variant_manifest().get(question_key)
+    if entry is None or 'thumb' not in entry['variants']:
+        return None
+    return atlas_source(entry['variants']['thumb']['path'])
+
+def preload_thumbnails(dt=None):
+    # Carrega o atlas de miniaturas com o app ocioso, para que a primeira
+    # miniatura usada como placeholder não pese na abertura do popup
+    if 'thumbs' in get_atlas_ids().values():
+        image_id = next(i for i, name in get_atlas_ids().items() if name == 'thumbs')
+        CoreImage(f'atlas://{constants.ATLAS_DIR}/thumbs/{image_id}')
+
+def thumbnail_texture(question_key):
+    # Miniatura usada enquanto a imagem completa é decodificada. Vinda do
+    # atlas, é só uma região de uma textura já carregada
+    source = thumbnail_source(question_key)
+    if source is None:
+        return None
+    return CoreImage(source).texture
+
+# Cache compartilhado pelas imagens das perguntas
+texture_cache = TextureCache(constants.TEXTURE_CACHE_BYTES, constants.DECODE_WORKERS)
+
+# Cache compartilhado pelos textos dos botões e títulos
+text_cache = TextTextureCache(constants.TEXT_CACHE_ENTRIES)
@@ -0,0 +1,67 @@
+# tools/benchmark_bundle.py
+#
+# Compara a leitura e decodificação das imagens das perguntas a partir dos
+# arquivos soltos e do pacote gerado por tools/build_bundle.py: só leitura
+# (open/stat/read contra fatia do mmap) e leitura + decodificação.
+# Uso (a partir da raiz do projeto, depois de tools.build_bundle):
+#     python -m tools.benchmark_bundle --rounds 5
+import argparse
+import os
+import sys
+import time
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'offscreen')
+os.environ.setdefault('KIVY_NO_ARGS', '1')
+
+from kivy.core.image import ImageLoader
+
+import constants
+from bundle import AssetBundle, load_bundled
+
+def read_loose(source):
+    if os.path.exists(source):
+        with open(source, 'rb') as f:
+            return f.read()
+
+def decode_loose(source):
+    if os.path.exists(source):
+        return ImageLoader.load(source, nocache=True)
+
+def measure(function, sources, rounds):
+    # Média por imagem, em ms, sobre todas as rodadas
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for source in sources:
+            function(source)
+    return (time.perf_counter() - start) * 1000 / (rounds * len(sources))
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark do pacote de imagens.')
+    parser.add_argument('--bundle', default=constants.ASSET_BUNDLE)
+    parser.add_argument('--rounds', type=int, default=5)
+    args = parser.parse_args(argv)
+
+    if not os.path.exists(args.bundle):
+        print(f"{args.bundle} not found: run python -m tools.build_bundle first")
+        return 1
+
+    start = time.perf_counter()
+    bundle = AssetBundle(args.bundle)
+    open_ms = (time.perf_counter() - start) * 1000
+    # As imagens que o app abre nos popups: a variante 1x (ou as originais, sem variantes)
+    sources = [source for source in bundle.index if source.endswith('@1x.jpg')] or list(bundle.index)
+    print(f"bundle open + index: {open_ms:.2f} ms ({len(bundle.index)} images), measuring {len(sources)} images")
+
+    results = [
+        ('read', 'loose', measure(read_loose, sources, args.rounds)),
+        ('read', 'bundle', measure(bundle.read, sources, args.rounds)),
+        ('read + decode', 'loose', measure(decode_loose, sources, args.rounds)),
+        ('read + decode', 'bundle', measure(lambda source: load_bundled(source, bundle), sources, args.rounds)),
+    ]
+    for step, kind, ms in results:
+        print(f"{step:>13} {kind:>6}: {ms:7.3f} ms/image")
+    bundle.close()
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
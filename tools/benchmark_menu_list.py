@@ -0,0 +1,84 @@
+# tools/benchmark_menu_list.py
+#
+# Mede o tempo de construção + layout de uma lista de botões com N itens:
+# GridLayout/ScrollView com um Button por item (implementação antiga)
+# contra a MenuList baseada em RecycleView.
+# Uso (a partir da raiz do projeto):
+#     python -m tools.benchmark_menu_list --sizes 10 100 1000
+import argparse
+import os
+import sys
+import time
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'offscreen')
+os.environ.setdefault('KIVY_NO_ARGS', '1')
+
+from kivy.base import EventLoop
+from kivy.core.window import Window
+from kivy.uix.button import Button
+from kivy.uix.gridlayout import GridLayout
+from kivy.uix.scrollview import ScrollView
+from kivy.utils import get_color_from_hex
+
+import constants
+from widgets import MenuList
+
+def build_grid(button_texts):
+    # Reproduz o create_buttons antigo: um Button por item com bind em texture_size
+    grid_layout = GridLayout(cols=1, spacing=constants.BUTTON_HEIGHT/2, size_hint_y=None)
+    grid_layout.bind(minimum_height=grid_layout.setter('height'))
+    for text, screen_name in button_texts:
+        btn = Button(
+            text=text,
+            font_size=constants.BUTTON_FONT_SIZE,
+            size_hint=(None, None),
+            size=(constants.BUTTON_WIDTH, constants.BUTTON_HEIGHT),
+            halign='center',
+            valign='middle',
+            background_color=get_color_from_hex(constants.BUTTON_BACKGROUND_COLOR),
+            background_normal='',
+            font_name='Roboto',
+            bold=True
+        )
+        btn.text_size = (btn.width - constants.BUTTON_MARGIN, None)
+        btn.bind(
+            texture_size=lambda instance, size: setattr(instance, 'height', instance.texture_size[1] + constants.BUTTON_MARGIN)
+        )
+        grid_layout.add_widget(btn)
+    scroll_view = ScrollView(size_hint=(None, None), size=(constants.BUTTON_WIDTH + 20, Window.height * 0.7))
+    scroll_view.add_widget(grid_layout)
+    return scroll_view
+
+def build_menu_list(button_texts):
+    menu_list = MenuList(size_hint=(None, None), size=(constants.BUTTON_WIDTH + 20, Window.height * 0.7))
+    menu_list.set_items(button_texts)
+    return menu_list
+
+def measure(build, button_texts, frames=3):
+    # Constrói, adiciona à janela e processa alguns quadros (layout + desenho)
+    start = time.perf_counter()
+    widget = build(button_texts)
+    Window.add_widget(widget)
+    for _ in range(frames):
+        EventLoop.idle()
+    elapsed = (time.perf_counter() - start) * 1000
+    widgets = sum(1 for _ in widget.walk(restrict=True))
+    Window.remove_widget(widget)
+    return elapsed, widgets
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark de layout das listas de botões.')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10, 100, 1000])
+    args = parser.parse_args(argv)
+
+    EventLoop.ensure_window()
+    texts = [text for spec in constants.ARVORE_TELAS.values() for text, _ in spec['botoes']]
+    for size in args.sizes:
+        button_texts = [(f'{texts[i % len(texts)]} {i}', f'item_{i}') for i in range(size)]
+        for name, build in (('grid', build_grid), ('menu_list', build_menu_list)):
+            elapsed, widgets = measure(build, button_texts)
+            print(f"{name:>9} {size:>5} items: {elapsed:8.1f} ms, {widgets:>5} widgets")
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
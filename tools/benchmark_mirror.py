@@ -0,0 +1,74 @@
+# tools/benchmark_mirror.py
+#
+# Mede a latência de ponta a ponta do modo de duas telas (mirror.py): este
+# processo é o líder e publica uma sequência de trocas de tela e de
+# pergunta; o seguidor é o próprio app (main.py, com a janela fora da tela),
+# que troca a tela, abre o popup e só então confirma cada mensagem. A
+# latência é medida no líder, do envio até a confirmação.
+# Uso (a partir da raiz do projeto):
+#     python -m tools.benchmark_mirror --messages 200 --interval 0.05
+import argparse
+import os
+import random
+import secrets
+import subprocess
+import sys
+import threading
+import time
+
+import constants
+from mirror import MirrorLeader
+
+def start_follower(port, token):
+    env = dict(os.environ, ACESSO_MIRROR=f'follower:127.0.0.1:{port}', ACESSO_MIRROR_TOKEN=token, KIVY_NO_ARGS='1')
+    env.setdefault('SDL_VIDEODRIVER', 'offscreen')
+    return subprocess.Popen([sys.executable, 'main.py'], env=env,
+                            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+def lead(messages, interval, timeout):
+    token = secrets.token_hex(16)
+    leader = MirrorLeader('127.0.0.1', 0, token)
+    done = threading.Event()
+    follower = start_follower(leader.port, token)
+    try:
+        deadline = time.monotonic() + timeout
+        while not leader.clients:
+            if time.monotonic() > deadline or follower.poll() is not None:
+                print("error: follower did not connect")
+                return 1
+            time.sleep(0.01)
+
+        # Alterna entre telas e perguntas como em uma consulta
+        screens = [name for name in constants.ARVORE_TELAS]
+        questions = list(constants.RELACAO_IMAGENS_TEXTOS)
+        for i in range(messages):
+            if i % 3 == 0:
+                leader.publish(s=random.choice(screens), q=None)
+            else:
+                leader.publish(q=random.choice(questions))
+            time.sleep(interval)
+
+        # publish() não envia nada quando o estado não muda: espera a
+        # confirmação das mensagens de fato enviadas
+        leader.on_latency = lambda ms: leader.confirmed >= leader.seq and done.set()
+        if leader.confirmed < leader.seq and not done.wait(timeout):
+            print(f"error: only {leader.confirmed} of {leader.seq} messages confirmed")
+            return 1
+        print(leader.stats())
+        return 0
+    finally:
+        leader.close()
+        # O seguidor tenta reconectar indefinidamente
+        follower.terminate()
+        follower.wait(timeout)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Mede a latência do modo de duas telas com o app como seguidor.')
+    parser.add_argument('--messages', type=int, default=200)
+    parser.add_argument('--interval', type=float, default=0.05, help='segundos entre mensagens')
+    parser.add_argument('--timeout', type=float, default=60)
+    args = parser.parse_args(argv)
+    return lead(args.messages, args.interval, args.timeout)
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,96 @@
+# tools/benchmark_navigation.py
+#
+# Simula uma sessão longa (passeio aleatório pela árvore de telas, com
+# idas, voltas e retornos à tela inicial) e compara a pilha antiga (lista
+# que cresce a cada navegação, impressa inteira a cada vez) com a
+# NavigationHistory. Não abre janela: mede só a estrutura da pilha.
+# Uso (a partir da raiz do projeto):
+#     python -m tools.benchmark_navigation --navigations 1000 5000 10000
+import argparse
+import io
+import random
+import sys
+import time
+
+import constants
+from navigation import NavigationHistory
+
+class ListStack(object):
+    # Reproduz o comportamento antigo de CustomScreenManager.screen_stack
+    def __init__(self, output):
+        self.screens = []
+        self.output = output
+
+    def forward(self, current, target):
+        if not (self.screens and self.screens[-1] == current) and current != 'home_screen':
+            self.screens.append(current)
+        print(f"Current stack: {self.screens}", file=self.output)
+
+    def back(self):
+        previous = self.screens.pop() if self.screens else 'home_screen'
+        print(f"Current stack: {self.screens}", file=self.output)
+        return previous
+
+class HistoryStack(object):
+    def __init__(self, max_depth):
+        self.history = NavigationHistory(max_depth)
+
+    def forward(self, current, target):
+        self.history.push(current)
+        self.history.visit(target)
+
+    def back(self):
+        return self.history.pop() or 'home_screen'
+
+def random_walk(tree, navigations, back_ratio, seed):
+    # Sequência reproduzível de ('forward', destino) e ('back', None). Nas
+    # telas sem subtelas a ida é um salto para qualquer tela (atalhos,
+    # busca), que é o que fazia a pilha antiga crescer sem limite
+    rng = random.Random(seed)
+    screens = list(tree)
+    steps = []
+    current = 'home_screen'
+    depth = 0
+    for _ in range(navigations):
+        if depth and rng.random() < back_ratio:
+            steps.append(('back', None))
+            depth -= 1
+            continue
+        children = [target for _, target in tree[current]['botoes'] if target in tree]
+        current = rng.choice(children or screens)
+        steps.append(('forward', current))
+        depth += 1
+    return steps
+
+def run(stack, steps):
+    current = 'home_screen'
+    start = time.perf_counter()
+    for action, target in steps:
+        if action == 'forward':
+            stack.forward(current, target)
+            current = target
+        else:
+            current = stack.back()
+    return (time.perf_counter() - start) * 1000
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark da pilha de navegação.')
+    parser.add_argument('--navigations', type=int, nargs='+', default=[1000, 5000, 10000])
+    parser.add_argument('--back-ratio', type=float, default=0.4,
+                        help='probabilidade de usar o botão voltar a cada navegação')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args(argv)
+
+    tree = constants.ARVORE_TELAS
+    for navigations in args.navigations:
+        steps = random_walk(tree, navigations, args.back_ratio, args.seed)
+        old = ListStack(io.StringIO())
+        new = HistoryStack(constants.NAVIGATION_HISTORY_DEPTH)
+        old_ms = run(old, steps)
+        new_ms = run(new, steps)
+        print(f"{navigations:>7} navigations: list {old_ms:9.1f} ms (depth {len(old.screens):>6}, "
+              f"{old.output.tell() / 1e6:8.1f} MB printed)  history {new_ms:7.1f} ms (depth {len(new.history)})")
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
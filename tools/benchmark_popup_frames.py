@@ -0,0 +1,92 @@
+# tools/benchmark_popup_frames.py
+#
+# Abre o popup de várias perguntas com o cache de texturas vazio e mede o
+# tempo de cada quadro, com a decodificação síncrona (antiga) e em segundo plano.
+# Uso (a partir da raiz do projeto):
+#     python -m tools.benchmark_popup_frames --popups 20
+import argparse
+import os
+import statistics
+import sys
+import time
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'offscreen')
+os.environ.setdefault('KIVY_NO_ARGS', '1')
+
+from kivy.clock import Clock
+
+import constants
+from main import SlideApp
+from screens import get_image_popup, question_image_source
+from textures import texture_cache
+
+# Um quadro acima deste tempo (1,5 quadro a 60 fps) conta como quadro perdido
+DROPPED_FRAME_MS = 1000 / 60 * 1.5
+
+# Tempo que cada popup fica aberto
+POPUP_SECONDS = 0.3
+
+class PopupFrameBenchmark(object):
+    def __init__(self, app, popups):
+        self.app = app
+        self.keys = list(constants.RELACAO_IMAGENS_TEXTOS)[:popups]
+        self.modes = [False, True]
+        self.frames = []
+        self.calls = []
+        self.results = {}
+        self.recording = False
+
+    def start(self, dt):
+        Clock.schedule_interval(self.record_frame, 0)
+        self.next_mode()
+
+    def record_frame(self, dt):
+        if self.recording:
+            self.frames.append(dt * 1000)
+
+    def next_mode(self):
+        if not self.modes:
+            self.app.stop()
+            return
+        constants.ASYNC_IMAGE_DECODE = self.modes.pop(0)
+        texture_cache.clear()
+        self.frames = []
+        self.calls = []
+        self.queue = list(self.keys)
+        self.recording = True
+        self.open_next(0)
+
+    def open_next(self, dt):
+        get_image_popup().dismiss(animation=False)
+        if not self.queue:
+            self.recording = False
+            self.results['async' if constants.ASYNC_IMAGE_DECODE else 'sync'] = (list(self.frames), list(self.calls))
+            Clock.schedule_once(lambda dt: self.next_mode(), POPUP_SECONDS)
+            return
+        key = self.queue.pop(0)
+        screen = self.app.screen_manager.current_screen
+        # Tempo em que a thread principal fica presa dentro de show_image_popup
+        start = time.perf_counter()
+        screen.show_image_popup(question_image_source(key), '', constants.RELACAO_IMAGENS_TEXTOS[key][0], key)
+        self.calls.append((time.perf_counter() - start) * 1000)
+        Clock.schedule_once(self.open_next, POPUP_SECONDS)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Tempo de quadro ao abrir popups.')
+    parser.add_argument('--popups', type=int, default=20)
+    args = parser.parse_args(argv)
+
+    app = SlideApp()
+    benchmark = PopupFrameBenchmark(app, args.popups)
+    Clock.schedule_once(benchmark.start, 1)
+    app.run()
+
+    for mode, (frames, calls) in benchmark.results.items():
+        dropped = sum(1 for frame in frames if frame > DROPPED_FRAME_MS)
+        print(f"{mode:>5}: {len(frames)} frames, median {statistics.median(frames):.1f} ms, "
+              f"max {max(frames):.1f} ms, {dropped} dropped (> {DROPPED_FRAME_MS:.0f} ms); "
+              f"show_image_popup median {statistics.median(calls):.1f} ms, max {max(calls):.1f} ms")
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
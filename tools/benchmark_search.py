@@ -0,0 +1,92 @@
+# tools/benchmark_search.py
+#
+# Mede o índice de busca com um catálogo sintético de N perguntas (frases
+# montadas com as palavras das perguntas reais, espalhadas em telas
+# sintéticas): tempo de construção e latência de cada tecla digitada,
+# comparando com uma busca linear que normaliza os textos a cada consulta.
+# Uso (a partir da raiz do projeto):
+#     python -m tools.benchmark_search --questions 100 1000 10000
+import argparse
+import random
+import sys
+import time
+from collections import namedtuple
+
+import constants
+from search import build_index, fold, tokenize
+
+ScreenSpec = namedtuple('ScreenSpec', ['name', 'title', 'button_texts', 'back_button'])
+
+def synthetic_catalog(size, seed):
+    rng = random.Random(seed)
+    words = sorted({word for text, *_ in constants.RELACAO_IMAGENS_TEXTOS.values() for word in text.split()})
+    questions = {}
+    tree = {}
+    for screen in range(max(1, size // 30)):
+        name = f'tela_{screen}'
+        buttons = []
+        for i in range(30):
+            key = f'{name}_pergunta_{i}'
+            questions[key] = [' '.join(rng.choice(words) for _ in range(rng.randint(3, 8))) + '?']
+            buttons.append((' '.join(rng.choice(words) for _ in range(2)).upper(), key))
+        tree[name] = ScreenSpec(name, f'TELA {screen}', tuple(buttons), True)
+    # A busca só indexa o que é alcançável a partir da tela inicial
+    tree['home_screen'] = ScreenSpec('home_screen', 'INÍCIO', tuple((spec.title, name) for name, spec in tree.items()), True)
+    return tree, questions
+
+def linear_search(questions, query, limit=20):
+    # Busca sem índice: normaliza cada texto e compara prefixos a cada tecla
+    tokens = tokenize(query)
+    result = []
+    for key, (text, *_) in questions.items():
+        words = tokenize(text)
+        if all(any(word.startswith(token) for word in words) for token in tokens):
+            result.append(key)
+    return result[:limit]
+
+def typed_queries(questions, count, seed):
+    # Simula a digitação letra a letra de trechos de perguntas existentes
+    rng = random.Random(seed)
+    texts = [text for text, *_ in questions.values()]
+    queries = []
+    for _ in range(count):
+        words = fold(rng.choice(texts)).split()
+        phrase = ' '.join(words[:2])
+        queries.extend(phrase[:end] for end in range(1, len(phrase) + 1))
+    return queries
+
+def percentile(values, fraction):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * fraction))]
+
+def measure(search, queries):
+    times = []
+    for query in queries:
+        start = time.perf_counter()
+        search(query)
+        times.append((time.perf_counter() - start) * 1000)
+    return sum(times) / len(times), percentile(times, 0.99)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark do índice de busca.')
+    parser.add_argument('--questions', type=int, nargs='+', default=[100, 1000, 10000])
+    parser.add_argument('--typed', type=int, default=50, help='frases digitadas letra a letra')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args(argv)
+
+    for size in args.questions:
+        tree, questions = synthetic_catalog(size, args.seed)
+        start = time.perf_counter()
+        index = build_index(tree, questions)
+        build_ms = (time.perf_counter() - start) * 1000
+        queries = typed_queries(questions, args.typed, args.seed)
+
+        index_mean, index_p99 = measure(lambda query: index.search(query, constants.SEARCH_MAX_RESULTS), queries)
+        linear_mean, linear_p99 = measure(lambda query: linear_search(questions, query), queries)
+        print(f"{len(questions):>6} questions: build {build_ms:7.1f} ms, {len(index.prefixes):>6} prefixes | "
+              f"index mean {index_mean:6.3f} ms p99 {index_p99:6.3f} ms | "
+              f"linear mean {linear_mean:7.2f} ms p99 {linear_p99:7.2f} ms ({len(queries)} keystrokes)")
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,80 @@
+# tools/benchmark_startup.py
+#
+# Roda o app várias vezes em modo benchmark (janela fora da tela) e resume os
+# tempos de inicialização. Com --baseline, falha se algum marco regredir.
+# Uso (a partir da raiz do projeto):
+#     python -m tools.benchmark_startup --runs 5 --output startup.json
+#     python -m tools.benchmark_startup --baseline startup.json --tolerance 20
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+# Marcos comparados com a referência
+TRACKED_MARKS = ['kivy_imported', 'screens_imported', 'built', 'first_frame', 'popup_opened', 'first_popup']
+
+def run_once(timeout):
+    with tempfile.TemporaryDirectory() as tmp:
+        output = os.path.join(tmp, 'startup.json')
+        env = dict(os.environ, ACESSO_BENCHMARK=output)
+        subprocess.run([sys.executable, 'main.py'], env=env, timeout=timeout,
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True)
+        with open(output, encoding='utf-8') as f:
+            return json.load(f)['summary']
+
+def aggregate(runs):
+    result = {}
+    for name in TRACKED_MARKS:
+        values = [run[name] for run in runs if name in run]
+        if values:
+            result[name] = round(statistics.median(values), 2)
+    totals = {}
+    for name in {name for run in runs for name in run.get('totals', {})}:
+        totals[name] = round(statistics.median(run['totals'].get(name, 0) for run in runs), 2)
+    result['totals'] = totals
+    return result
+
+def compare(result, baseline, tolerance):
+    regressions = []
+    for name in TRACKED_MARKS:
+        if name in result and name in baseline:
+            limit = baseline[name] * (1 + tolerance / 100)
+            if result[name] > limit:
+                regressions.append(f"{name}: {result[name]:.1f} ms > {limit:.1f} ms (baseline {baseline[name]:.1f} ms)")
+    return regressions
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark de inicialização do app.')
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--timeout', type=float, default=60)
+    parser.add_argument('--output', help='grava a mediana das execuções neste arquivo')
+    parser.add_argument('--baseline', help='arquivo de referência gravado com --output')
+    parser.add_argument('--tolerance', type=float, default=20, help='regressão tolerada, em %%')
+    args = parser.parse_args(argv)
+
+    runs = [run_once(args.timeout) for _ in range(args.runs)]
+    result = aggregate(runs)
+    for name in TRACKED_MARKS:
+        if name in result:
+            print(f"{name}: {result[name]:.1f} ms")
+    for name, total in sorted(result['totals'].items()):
+        print(f"  {name} (total): {total:.1f} ms")
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(result, f, indent=1)
+
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as f:
+            regressions = compare(result, json.load(f), args.tolerance)
+        for regression in regressions:
+            print(f"Regression: {regression}")
+        if regressions:
+            return 1
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
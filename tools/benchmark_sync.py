@@ -0,0 +1,75 @@
+# tools/benchmark_sync.py
+#
+# Envia consultas sintéticas para o servidor de teste (tools/sync_server.py)
+# rodando no mesmo processo, com quedas de conexão simuladas, e confere se
+# todas chegaram inteiras. Mostra a vazão, a compressão, as tentativas e os
+# lotes retomados. Usa um banco temporário, não o do app.
+# Uso (a partir da raiz do projeto):
+#     python -m tools.benchmark_sync --consultations 500 --drop-rate 0.1
+import argparse
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+
+import constants
+from answers import AnswerStore
+from sync import SyncEngine
+from tools.sync_server import UploadServer
+
+def fill_store(store, consultations, answers_per_consultation):
+    question_keys = list(constants.RELACAO_IMAGENS_TEXTOS)
+    expected = {}
+    for _ in range(consultations):
+        consultation_id = store.start_consultation()
+        answers = {}
+        for question_key in random.sample(question_keys, answers_per_consultation):
+            answers[question_key] = random.choice(['sim', 'não', 'há duas semanas', 'dor forte no lado direito'])
+            store.record(consultation_id, question_key, answers[question_key])
+        store.finish_consultation(consultation_id)
+        expected[consultation_id] = answers
+    store.flush()
+    return expected
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Mede o envio das consultas para um servidor local de teste.')
+    parser.add_argument('--consultations', type=int, default=500)
+    parser.add_argument('--answers', type=int, default=40, help='respostas por consulta')
+    parser.add_argument('--drop-rate', type=float, default=0.1, help='fração dos pedaços em que a conexão cai')
+    parser.add_argument('--chunk-kb', type=int, default=constants.SYNC_CHUNK_BYTES // 1024)
+    parser.add_argument('--timeout', type=float, default=120)
+    args = parser.parse_args(argv)
+    # Sem espera longa entre tentativas: as quedas são simuladas
+    constants.SYNC_RETRY_MIN = constants.SYNC_RETRY_MAX = 0.05
+
+    server = UploadServer(('127.0.0.1', 0), drop_rate=args.drop_rate)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    with tempfile.TemporaryDirectory() as tmp:
+        store = AnswerStore(os.path.join(tmp, 'respostas.sqlite3'))
+        expected = fill_store(store, args.consultations, min(args.answers, len(constants.RELACAO_IMAGENS_TEXTOS)))
+
+        start = time.perf_counter()
+        engine = SyncEngine(store, f'http://127.0.0.1:{server.server_address[1]}/consultas', os.path.join(tmp, 'envio'),
+                            chunk_bytes=args.chunk_kb * 1024, idle_seconds=0)
+        deadline = time.monotonic() + args.timeout
+        while (store.pending_uploads(1) or store.open_batches()) and time.monotonic() < deadline:
+            time.sleep(0.05)
+        elapsed = time.perf_counter() - start
+        engine.close()
+        pending = len(store.open_batches())
+        store.close()
+    server.shutdown()
+
+    received = {cid: {key: answer for key, answer, _ in c['answers']} for cid, c in server.consultations.items()}
+    missing = [cid for cid, answers in expected.items() if received.get(cid) != answers]
+    print(f"{len(received)} of {len(expected)} consultations received in {elapsed:.2f} s ({pending} batches pending)")
+    print(engine.stats())
+    if missing:
+        print(f"error: {len(missing)} consultations missing or different")
+        return 1
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,109 @@
+# tools/benchmark_transitions.py
+#
+# Navega por todas as seções da entrevista (starting_screen -> seção ->
+# voltar) com cada transição e mede o tempo dos quadros durante as
+# transições. Com as telas já construídas, mede só o custo de desenho.
+# Uso (a partir da raiz do projeto):
+#     python -m tools.benchmark_transitions --profiles none slide fade
+import argparse
+import os
+import statistics
+import sys
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'offscreen')
+os.environ.setdefault('KIVY_NO_ARGS', '1')
+
+from kivy.clock import Clock
+
+import constants
+from main import SlideApp
+from screens import load_screen_tree, question_image_source
+from textures import texture_cache
+from transitions import make_transition
+
+# Um quadro acima deste tempo (1,5 quadro a 60 fps) conta como quadro perdido
+DROPPED_FRAME_MS = 1000 / 60 * 1.5
+
+# Espera para as imagens pré-carregadas serem decodificadas e enviadas
+WARMUP_SECONDS = 5
+
+def navigation_steps():
+    # Ida e volta em cada seção da tela inicial da entrevista
+    tree = load_screen_tree()
+    steps = ['starting_screen']
+    for _, section in tree['starting_screen'].button_texts:
+        if section in tree:
+            steps += [section, 'back']
+    return steps + ['back']
+
+class TransitionBenchmark(object):
+    def __init__(self, app, profiles, rounds):
+        self.app = app
+        self.profiles = list(profiles)
+        self.rounds = rounds
+        self.results = {}
+        self.frames = []
+
+    def start(self, dt):
+        manager = self.app.screen_manager
+        # Constrói todas as telas e carrega as imagens antes, para que
+        # construção e envio de texturas não caiam nos quadros medidos
+        manager.build_all_screens()
+        texture_cache.prefetch([question_image_source(key) for key in constants.RELACAO_IMAGENS_TEXTOS])
+        Clock.schedule_interval(self.record_frame, 0)
+        Clock.schedule_once(lambda dt: self.next_profile(), WARMUP_SECONDS)
+
+    def record_frame(self, dt):
+        if self.app.screen_manager.transition.is_active:
+            self.frames.append(dt * 1000)
+
+    def next_profile(self):
+        if not self.profiles:
+            self.app.stop()
+            return
+        self.profile = self.profiles.pop(0)
+        self.app.screen_manager.transition = make_transition(self.profile)
+        self.frames = []
+        self.steps = navigation_steps() * self.rounds
+        self.navigations = len(self.steps)
+        Clock.schedule_interval(self.next_step, 0)
+
+    def next_step(self, dt):
+        manager = self.app.screen_manager
+        if manager.transition.is_active:
+            return
+        if not self.steps:
+            self.results[self.profile] = (list(self.frames), self.navigations)
+            Clock.schedule_once(lambda dt: self.next_profile(), 0.2)
+            return False
+        step = self.steps.pop(0)
+        if step == 'back':
+            manager.go_to_previous_screen()
+        else:
+            manager.current = step
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Tempo de quadro durante as transições de tela.')
+    parser.add_argument('--profiles', nargs='+', default=['none', 'slide', 'fade'], choices=['none', 'slide', 'fade'])
+    parser.add_argument('--rounds', type=int, default=1)
+    args = parser.parse_args(argv)
+
+    constants.TRANSITION_PROFILE = args.profiles[0]
+    app = SlideApp()
+    benchmark = TransitionBenchmark(app, args.profiles, args.rounds)
+    Clock.schedule_once(benchmark.start, 1)
+    app.run()
+
+    for profile, (frames, navigations) in benchmark.results.items():
+        if not frames:
+            print(f"{profile:>5}: {navigations} navigations, no transition frames")
+            continue
+        frames = sorted(frames)
+        dropped = sum(1 for frame in frames if frame > DROPPED_FRAME_MS)
+        print(f"{profile:>5}: {navigations} navigations, {len(frames)} frames, median {statistics.median(frames):.1f} ms, "
+              f"p95 {frames[int(len(frames) * 0.95)]:.1f} ms, max {frames[-1]:.1f} ms, "
+              f"{dropped} dropped (> {DROPPED_FRAME_MS:.0f} ms)")
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
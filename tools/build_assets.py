@@ -0,0 +1,108 @@
+# tools/build_assets.py
+#
+# Gera variantes redimensionadas e comprimidas das imagens das perguntas.
+# Uso (a partir da raiz do projeto):
+#     python -m tools.build_assets
+import argparse
+import hashlib
+import json
+import os
+import sys
+
+from PIL import Image
+
+import constants
+
+# Variantes geradas, como fração do tamanho da janela alvo (constants.WINDOW_SIZE)
+VARIANT_SCALES = {
+    'thumb': 0.25,
+    '1x': 1,
+    '2x': 2,
+}
+
+JPEG_QUALITY = 80
+
+def file_hash(path):
+    sha1 = hashlib.sha1()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(65536), b''):
+            sha1.update(chunk)
+    return sha1.hexdigest()
+
+def load_manifest(path):
+    if os.path.exists(path):
+        with open(path, encoding='utf-8') as f:
+            return json.load(f)
+    return {}
+
+def build_variants(key, source, output_dir):
+    variants = {}
+    with Image.open(source) as im:
+        im = im.convert('RGB')
+        for variant, scale in VARIANT_SCALES.items():
+            box = (int(constants.WINDOW_SIZE[0] * scale), int(constants.WINDOW_SIZE[1] * scale))
+            resized = im.copy()
+            # Nunca aumenta a imagem: se a original já é menor, mantém o tamanho
+            resized.thumbnail(box, Image.LANCZOS)
+
+            path = os.path.join(output_dir, f'{key}@{variant}.jpg')
+            resized.save(path, 'JPEG', quality=JPEG_QUALITY, optimize=True, progressive=True)
+            variants[variant] = {
+                'path': path.replace(os.sep, '/'),
+                'width': resized.width,
+                'height': resized.height,
+                'bytes': os.path.getsize(path),
+                'sha1': file_hash(path),
+            }
+    return variants
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Gera variantes das imagens das perguntas.')
+    parser.add_argument('--force', action='store_true', help='regera todas as variantes')
+    args = parser.parse_args(argv)
+
+    output_dir = constants.VARIANTS_DIR
+    os.makedirs(output_dir, exist_ok=True)
+    old_manifest = {} if args.force else load_manifest(constants.VARIANTS_MANIFEST)
+    manifest = {}
+    missing = []
+
+    for key in constants.RELACAO_IMAGENS_TEXTOS:
+        source = os.path.join(constants.IMAGES_DIR, f'{key}.jpg')
+        if not os.path.exists(source):
+            missing.append(key)
+            continue
+
+        source_hash = file_hash(source)
+        entry = old_manifest.get(key)
+        # Reaproveita as variantes se a imagem original não mudou
+        if entry and entry['sha1'] == source_hash and \
+                all(os.path.exists(v['path']) for v in entry['variants'].values()):
+            manifest[key] = entry
+            continue
+
+        with Image.open(source) as im:
+            width, height = im.size
+        manifest[key] = {
+            'source': source.replace(os.sep, '/'),
+            'width': width,
+            'height': height,
+            'bytes': os.path.getsize(source),
+            'sha1': source_hash,
+            'variants': build_variants(key, source, output_dir),
+        }
+        print(f"{key}: {', '.join(manifest[key]['variants'])}")
+
+    with open(constants.VARIANTS_MANIFEST, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=1, ensure_ascii=False, sort_keys=True)
+
+    source_bytes = sum(entry['bytes'] for entry in manifest.values())
+    for variant in VARIANT_SCALES:
+        variant_bytes = sum(entry['variants'][variant]['bytes'] for entry in manifest.values())
+        print(f"{variant}: {variant_bytes / 1024:.0f} KB (originais: {source_bytes / 1024:.0f} KB)")
+    for key in missing:
+        print(f"Image not found: {key}")
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,68 @@
+# tools/build_atlas.py
+#
+# Empacota imagens pequenas da interface (e as miniaturas geradas por
+# tools/build_assets.py) em atlas do Kivy, acessados via atlas://
+# Uso (a partir da raiz do projeto):
+#     python -m tools.build_atlas
+import glob
+import os
+import sys
+import tempfile
+
+from PIL import Image
+from kivy.atlas import Atlas
+
+import constants
+
+# Imagens da interface empacotadas no atlas 'ui'
+UI_IMAGES = [
+    'left_arrow.png',
+]
+
+# Maior lado das imagens da interface no atlas (o botão voltar tem 50x50)
+UI_MAX_SIZE = 128
+
+ATLAS_SIZE = 2048
+
+def downscale(filenames, max_size, output_dir):
+    # Reduz as imagens ao tamanho de exibição antes de empacotá-las
+    resized = []
+    for filename in filenames:
+        with Image.open(filename) as im:
+            im = im.copy()
+        im.thumbnail((max_size, max_size), Image.LANCZOS)
+        path = os.path.join(output_dir, os.path.basename(filename))
+        im.save(path)
+        resized.append(path)
+    return resized
+
+def build_atlas(name, filenames):
+    outname = os.path.join(constants.ATLAS_DIR, name)
+    ret = Atlas.create(outname, filenames, ATLAS_SIZE)
+    if not ret:
+        print(f"Failed to create atlas: {name}")
+        return False
+    atlas_filename, meta = ret
+    ids = sum(len(images) for images in meta.values())
+    print(f"{atlas_filename}: {ids} images in {len(meta)} page(s)")
+    return True
+
+def main(argv=None):
+    os.makedirs(constants.ATLAS_DIR, exist_ok=True)
+    ok = True
+
+    with tempfile.TemporaryDirectory() as tmp:
+        ui_images = [os.path.join(constants.IMAGES_DIR, f) for f in UI_IMAGES]
+        ok &= build_atlas('ui', downscale(ui_images, UI_MAX_SIZE, tmp))
+
+    # As miniaturas já estão no tamanho final
+    thumbnails = sorted(glob.glob(os.path.join(constants.VARIANTS_DIR, '*@thumb.jpg')))
+    if thumbnails:
+        ok &= build_atlas('thumbs', thumbnails)
+    else:
+        print("No thumbnails found; run tools.build_assets first")
+
+    return 0 if ok else 1
+
+if __name__ == '__main__':
+    sys.exit(main())
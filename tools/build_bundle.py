@@ -0,0 +1,49 @@
+# tools/build_bundle.py
+#
+# Empacota as imagens das perguntas (originais e as variantes 1x/2x geradas
+# por tools/build_assets.py) em um único arquivo lido via mmap pelo app.
+# As miniaturas ficam de fora: já estão no atlas de tools/build_atlas.py.
+# Uso (a partir da raiz do projeto, depois de tools.build_assets):
+#     python -m tools.build_bundle
+import argparse
+import os
+import sys
+
+from PIL import Image
+
+import constants
+from bundle import write_bundle
+from textures import get_variant_manifest
+
+def bundle_entries():
+    # (caminho, largura, altura) de cada imagem, com os caminhos exatamente
+    # como o app os pede (question_image_source / pick_variant)
+    manifest = get_variant_manifest()
+    entries = []
+    for key in constants.RELACAO_IMAGENS_TEXTOS:
+        entry = manifest.get(key)
+        if entry:
+            entries.append((entry['source'], entry['width'], entry['height']))
+            for name, variant in sorted(entry['variants'].items()):
+                if name != 'thumb':
+                    entries.append((variant['path'], variant['width'], variant['height']))
+            continue
+
+        source = f'{constants.IMAGES_DIR}/{key}.jpg'
+        if os.path.exists(source):
+            with Image.open(source) as im:
+                entries.append((source, im.width, im.height))
+    return entries
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Empacota as imagens das perguntas em um único arquivo.')
+    parser.add_argument('--output', default=constants.ASSET_BUNDLE)
+    args = parser.parse_args(argv)
+
+    index = write_bundle(args.output, bundle_entries())
+    total = sum(length for _, length, _, _ in index.values())
+    print(f"{args.output}: {len(index)} images, {total / 1024:.0f} KB")
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,63 @@
+# tools/build_posters.py
+#
+# Extrai o primeiro quadro de cada clipe em Libras (constants.VIDEOS_DIR/
+# <pergunta>.mp4) para <pergunta>.jpg, o pôster mostrado pelo popup
+# enquanto o vídeo começa a tocar. Sem o pôster o clipe não é usado.
+# Uso (a partir da raiz do projeto):
+#     pip install ffpyplayer pillow
+#     python -m tools.build_posters
+import argparse
+import os
+import sys
+import time
+
+from ffpyplayer.player import MediaPlayer
+from PIL import Image
+
+import constants
+from video import clip_path, poster_path
+
+JPEG_QUALITY = 85
+
+def first_frame(path, timeout):
+    player = MediaPlayer(path, ff_opts={'an': True, 'sn': True, 'out_fmt': 'rgb24'})
+    try:
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            frame, val = player.get_frame()
+            if frame is not None:
+                image, _ = frame
+                return Image.frombytes('RGB', image.get_size(), bytes(image.to_bytearray()[0]))
+            if val == 'eof':
+                break
+            time.sleep(0.01)
+        return None
+    finally:
+        player.close_player()
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Extrai os pôsteres dos clipes em Libras.')
+    parser.add_argument('--force', action='store_true', help='regera pôsteres já existentes')
+    parser.add_argument('--timeout', type=float, default=10, help='segundos de espera pelo primeiro quadro')
+    args = parser.parse_args(argv)
+
+    built = failed = 0
+    for key in constants.RELACAO_IMAGENS_TEXTOS:
+        source, poster = clip_path(key), poster_path(key)
+        if not os.path.exists(source):
+            continue
+        if os.path.exists(poster) and os.path.getmtime(poster) >= os.path.getmtime(source) and not args.force:
+            continue
+        image = first_frame(source, args.timeout)
+        if image is None:
+            print(f"error: {source} has no video frame")
+            failed += 1
+            continue
+        image.save(poster, 'JPEG', quality=JPEG_QUALITY)
+        print(f"{poster}: {image.width}x{image.height}")
+        built += 1
+    print(f"{built} posters built, {failed} failed")
+    return 1 if failed else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
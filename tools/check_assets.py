@@ -0,0 +1,131 @@
+# tools/check_assets.py
+#
+# Verifica, antes de empacotar o app, se cada botão da árvore de telas
+# (constants.ARVORE_TELAS) leva a uma tela existente ou a uma pergunta com
+# texto e imagem que decodifica. As imagens são decodificadas em paralelo
+# (um processo por núcleo) e as muito diferentes das demais em tamanho ou
+# dimensões são apontadas. Sai com código 1 no primeiro erro.
+# Uso (a partir da raiz do projeto):
+#     python -m tools.check_assets
+#     python -m tools.check_assets --all      # lista todos os erros
+import argparse
+import os
+import statistics
+import sys
+from collections import Counter
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+from PIL import Image
+
+import constants
+from navigation import section_paths, validate_screen_tree
+
+# Imagens com mais que OUTLIER_FACTOR vezes a mediana de bytes são apontadas
+OUTLIER_FACTOR = 3
+
+def decode(path):
+    # Roda em um processo do conjunto: decodifica a imagem inteira
+    with Image.open(path) as im:
+        im.load()
+        return path, im.width, im.height, os.path.getsize(path)
+
+def question_targets(tree, screens):
+    # (tela, pergunta) dos botões das telas indicadas, sem repetir perguntas
+    # nem as que são desenhadas no lugar da imagem (mapa do corpo, escalas)
+    seen = set()
+    for name in screens:
+        for _, target in tree[name]:
+            if target in constants.RELACAO_IMAGENS_TEXTOS and target not in tree and target not in seen \
+                    and target not in constants.MAPA_CORPORAL_PERGUNTAS and target not in constants.ESCALAS:
+                seen.add(target)
+                yield name, target
+
+def check_tree(tree, fail_fast):
+    # Erros de estrutura nas telas acessíveis a partir da inicial; nas telas
+    # fora da árvore (ex.: DECÁLOGO DA DOR, comentada) viram avisos
+    reachable = section_paths(tree)
+    errors, warnings = [], []
+    for name, target, problem in validate_screen_tree(tree, constants.RELACAO_IMAGENS_TEXTOS):
+        (errors if name in reachable else warnings).append(f"'{target}' ({name}) {problem}")
+        if errors and fail_fast:
+            break
+
+    for name in tree:
+        if name not in reachable:
+            warnings.append(f"screen '{name}' is not reachable from home_screen")
+    used = {target for button_texts in tree.values() for _, target in button_texts}
+    for question_key in constants.RELACAO_IMAGENS_TEXTOS:
+        if question_key not in used:
+            warnings.append(f"question '{question_key}' is not used by any screen")
+    return reachable, errors, warnings
+
+def check_images(tree, reachable, workers, fail_fast):
+    errors, warnings, decoded = [], [], []
+    jobs = []
+    for name, question_key in question_targets(tree, tree):
+        path = os.path.join(constants.IMAGES_DIR, f'{question_key}.jpg')
+        if os.path.exists(path):
+            jobs.append((name, question_key, path))
+            continue
+        message = f"'{question_key}' ({name}) has no image {path}"
+        if name not in reachable:
+            warnings.append(message)
+            continue
+        errors.append(message)
+        if fail_fast:
+            return errors, warnings, decoded
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = {executor.submit(decode, path): (name, question_key) for name, question_key, path in jobs}
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                name, question_key = pending.pop(future)
+                try:
+                    decoded.append((question_key,) + future.result())
+                except Exception as e:
+                    errors.append(f"'{question_key}' ({name}) image does not decode: {e}")
+            if errors and fail_fast:
+                for future in pending:
+                    future.cancel()
+                break
+    return errors, warnings, decoded
+
+def find_outliers(decoded):
+    # Imagens muito maiores que a mediana ou com dimensões fora do padrão
+    if not decoded:
+        return []
+    warnings = []
+    median_bytes = statistics.median(size for *_, size in decoded)
+    common_size, _ = Counter((width, height) for _, _, width, height, _ in decoded).most_common(1)[0]
+    for question_key, path, width, height, size in sorted(decoded):
+        if size > OUTLIER_FACTOR * median_bytes:
+            warnings.append(f"'{question_key}' {path} has {size / 1024:.0f} KB (median {median_bytes / 1024:.0f} KB)")
+        if (width, height) != common_size:
+            warnings.append(f"'{question_key}' {path} is {width}x{height} (most images are {common_size[0]}x{common_size[1]})")
+    return warnings
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Verifica a árvore de telas e as imagens das perguntas.')
+    parser.add_argument('--all', action='store_true', help='continua depois do primeiro erro')
+    parser.add_argument('--workers', type=int, default=None, help='processos de decodificação (padrão: um por núcleo)')
+    args = parser.parse_args(argv)
+    fail_fast = not args.all
+
+    tree = {name: [tuple(button) for button in data['botoes']] for name, data in constants.ARVORE_TELAS.items()}
+    reachable, errors, warnings = check_tree(tree, fail_fast)
+    decoded = []
+    if not (errors and fail_fast):
+        image_errors, image_warnings, decoded = check_images(tree, reachable, args.workers, fail_fast)
+        errors += image_errors
+        warnings += image_warnings + find_outliers(decoded)
+
+    for warning in warnings:
+        print(f"warning: {warning}")
+    for error in errors:
+        print(f"error: {error}")
+    print(f"{len(decoded)} images decoded, {len(warnings)} warnings, {len(errors)} errors")
+    return 1 if errors else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,113 @@
+# tools/sync_server.py
+#
+# Servidor HTTP local que faz o papel do servidor da clínica para testar o
+# envio das consultas (sync.py): aceita os lotes em pedaços (HEAD/PATCH com
+# Upload-Offset), grava cada lote completo em JSON e pode derrubar conexões
+# de propósito para testar a retomada.
+# Uso (a partir da raiz do projeto):
+#     python -m tools.sync_server --port 8080 --output recebidos --drop-rate 0.2
+#     ACESSO_SYNC_URL=http://127.0.0.1:8080/consultas python main.py
+import argparse
+import gzip
+import json
+import os
+import random
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+class UploadHandler(BaseHTTPRequestHandler):
+    # HTTP/1.1: a conexão fica aberta entre as requisições (keep-alive)
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super(UploadHandler, self).log_message(format, *args)
+
+    def batch_id(self):
+        return self.path.rstrip('/').rsplit('/', 1)[-1]
+
+    def reply(self, status, offset=None):
+        self.send_response(status)
+        if offset is not None:
+            self.send_header('Upload-Offset', str(offset))
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+
+    def do_HEAD(self):
+        with self.server.lock:
+            data = self.server.uploads.get(self.batch_id())
+        if data is None:
+            self.reply(404)
+        else:
+            self.reply(200, len(data))
+
+    def do_PATCH(self):
+        batch_id = self.batch_id()
+        offset = int(self.headers['Upload-Offset'])
+        total = int(self.headers['Upload-Length'])
+        chunk = self.rfile.read(int(self.headers['Content-Length']))
+        if random.random() < self.server.drop_rate:
+            # Simula a queda da rede: metade das vezes depois de guardar o
+            # pedaço, sem que o cliente receba a confirmação
+            if random.random() < 0.5:
+                self.store(batch_id, offset, total, chunk)
+            self.close_connection = True
+            self.connection.shutdown(2)
+            return
+        status, offset = self.store(batch_id, offset, total, chunk)
+        self.reply(status, offset)
+
+    def store(self, batch_id, offset, total, chunk):
+        with self.server.lock:
+            data = self.server.uploads.setdefault(batch_id, bytearray())
+            if offset != len(data):
+                return 409, len(data)
+            data += chunk
+            if len(data) == total and batch_id not in self.server.completed:
+                self.server.completed.add(batch_id)
+                self.server.save(batch_id, bytes(data))
+            return 204, len(data)
+
+class UploadServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address, output=None, drop_rate=0, verbose=False):
+        super(UploadServer, self).__init__(address, UploadHandler)
+        self.output = output
+        self.drop_rate = drop_rate
+        self.verbose = verbose
+        self.lock = threading.Lock()
+        self.uploads = {}
+        self.completed = set()
+        self.consultations = {}
+
+    def save(self, batch_id, data):
+        batch = json.loads(gzip.decompress(data))
+        for consultation in batch['consultations']:
+            self.consultations[consultation['id']] = consultation
+        if self.output:
+            with open(os.path.join(self.output, f'{batch_id}.json'), 'w', encoding='utf-8') as f:
+                json.dump(batch, f, ensure_ascii=False, indent=1)
+        if self.verbose:
+            print(f"batch {batch_id}: {len(batch['consultations'])} consultations, {len(data)} bytes")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Servidor local de teste para o envio das consultas.')
+    parser.add_argument('--port', type=int, default=8080)
+    parser.add_argument('--output', help='pasta onde gravar os lotes recebidos')
+    parser.add_argument('--drop-rate', type=float, default=0, help='fração dos pedaços em que a conexão cai')
+    args = parser.parse_args(argv)
+    if args.output:
+        os.makedirs(args.output, exist_ok=True)
+
+    server = UploadServer(('127.0.0.1', args.port), args.output, args.drop_rate, verbose=True)
+    print(f"Listening on http://127.0.0.1:{args.port}/consultas")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,53 @@
+# transitions.py
+import statistics
+import time
+
+from kivy.clock import Clock
+from kivy.core.window import Window
+from kivy.uix.screenmanager import FadeTransition, NoTransition, SlideTransition
+
+import constants
+
+def make_transition(profile):
+    # 'none' troca a tela direto; 'slide' move as duas telas sem FBO;
+    # 'fade' mistura as duas telas em FBOs (mais caro na GPU)
+    if profile == 'none':
+        return NoTransition()
+    if profile == 'fade':
+        # FBOs transparentes: as telas não desenham fundo próprio, então o
+        # fundo compartilhado precisa aparecer por trás durante a mistura
+        return FadeTransition(duration=constants.TRANSITION_DURATION, clearcolor=(0, 0, 0, 0))
+    return SlideTransition(duration=constants.TRANSITION_DURATION)
+
+def profile_for_frame_time(frame_ms):
+    # Só escolhe transições sem FBO: a deslizante se o aparelho desenha a
+    # janela inteira a tempo, senão nenhuma
+    if frame_ms <= constants.TRANSITION_SLIDE_MAX_FRAME_MS:
+        return 'slide'
+    return 'none'
+
+class FrameProbe(object):
+    # Mede o tempo de quadro forçando o redesenho da janela inteira por
+    # alguns quadros e chama callback(mediana em ms)
+    def __init__(self, frames, callback):
+        self.frames = frames
+        self.callback = callback
+        self.times = []
+        self.last_flip = None
+
+    def start(self):
+        Window.bind(on_flip=self.on_flip)
+        self.event = Clock.schedule_interval(self.request_frame, 0)
+
+    def request_frame(self, dt):
+        Window.canvas.ask_update()
+
+    def on_flip(self, *args):
+        now = time.perf_counter()
+        if self.last_flip is not None:
+            self.times.append((now - self.last_flip) * 1000)
+        self.last_flip = now
+        if len(self.times) >= self.frames:
+            Window.unbind(on_flip=self.on_flip)
+            self.event.cancel()
+            self.callback(statistics.median(self.times))
@@ -0,0 +1,198 @@
+# video.py
+#
+# Clipes em Libras das perguntas (constants.VIDEOS_DIR/<pergunta>.mp4),
+# tocados em loop no popup no lugar da imagem. Cada clipe aberto tem uma
+# thread que decodifica os quadros para um buffer circular limitado; a
+# thread principal só envia o quadro mais recente para a textura. O primeiro
+# quadro vem de um pôster pré-extraído (<pergunta>.jpg, gerado por
+# tools/build_posters.py), mostrado pelo cache de texturas como as imagens.
+# Depende do ffpyplayer, opcional: sem ele (ou sem o clipe) o popup mostra a
+# imagem da pergunta
+import os
+import threading
+import time
+from collections import OrderedDict, deque
+
+from kivy.graphics.texture import Texture
+
+import constants
+
+try:
+    from ffpyplayer.player import MediaPlayer
+except ImportError:
+    MediaPlayer = None
+
+def clip_path(question_key):
+    return os.path.join(constants.VIDEOS_DIR, f'{question_key}.mp4')
+
+def poster_path(question_key):
+    return os.path.join(constants.VIDEOS_DIR, f'{question_key}.jpg')
+
+def has_clip(question_key):
+    # Só usa o clipe quando há o vídeo e o pôster do primeiro quadro
+    return (MediaPlayer is not None and constants.LIBRAS_VIDEOS
+            and os.path.exists(clip_path(question_key)) and os.path.exists(poster_path(question_key)))
+
+class ClipStream(object):
+    # Um clipe aberto e pausado até play(). O MediaPlayer já entrega os
+    # quadros no ritmo do vídeo; a thread de decodificação converte cada um
+    # para RGB e para de pedir quadros quando o buffer enche, então a memória
+    # fica limitada a buffer_frames quadros e o arquivo nunca é lido inteiro.
+    # Só a thread de decodificação chama o MediaPlayer: play() e pause()
+    # apenas marcam o pedido, que ela aplica entre um quadro e outro
+    def __init__(self, question_key, buffer_frames):
+        self.question_key = question_key
+        self.poster = poster_path(question_key)
+        self.frames = deque()
+        self.buffer_frames = buffer_frames
+        self.condition = threading.Condition()
+        # Pedidos da thread principal (protegidos por condition)
+        self.playing = False
+        self.restart = False
+        self.closed = False
+        # Estado do MediaPlayer, lido e alterado só pela thread de decodificação
+        self.player_paused = True
+        self.texture = None
+        # Abrir o arquivo (leitura do contêiner e inicialização do
+        # decodificador) é a parte lenta: acontece ao pré-abrir o clipe
+        self.player = MediaPlayer(clip_path(question_key), ff_opts={
+            'paused': True, 'loop': 0, 'an': True, 'sn': True, 'out_fmt': 'rgb24'})
+        self.thread = threading.Thread(target=self.run, name=f'video-{question_key}', daemon=True)
+        self.thread.start()
+
+    def has_command(self):
+        return self.closed or self.restart or self.playing == self.player_paused
+
+    def run(self):
+        while True:
+            with self.condition:
+                while not self.has_command() and (not self.playing or len(self.frames) >= self.buffer_frames):
+                    self.condition.wait()
+                if self.closed:
+                    break
+                restart, self.restart = self.restart, False
+                playing = self.playing
+            if restart:
+                self.player.seek(0, relative=False)
+            if playing == self.player_paused:
+                self.player.set_pause(not playing)
+                self.player_paused = not playing
+            if not playing:
+                continue
+
+            frame, val = self.player.get_frame()
+            if val == 'eof':
+                self.player.seek(0, relative=False)
+                continue
+            if frame is None:
+                # val é o tempo até o próximo quadro (ou 'paused')
+                time.sleep(min(val, 0.05) if isinstance(val, float) and val > 0 else 0.005)
+                continue
+            image, _ = frame
+            data = bytes(image.to_bytearray()[0])
+            with self.condition:
+                # Quadro decodificado antes de um play() pendente: é de antes do recomeço
+                if self.playing and not self.restart:
+                    self.frames.append((image.get_size(), data))
+        self.player.close_player()
+
+    def play(self):
+        # Recomeça do início, que é o quadro mostrado pelo pôster
+        with self.condition:
+            self.frames.clear()
+            self.restart = True
+            self.playing = True
+            self.condition.notify()
+
+    def pause(self):
+        with self.condition:
+            self.playing = False
+            self.restart = False
+            self.frames.clear()
+            self.condition.notify()
+
+    def close(self):
+        with self.condition:
+            self.playing = False
+            self.closed = True
+            self.frames.clear()
+            self.condition.notify()
+
+    def next_texture(self):
+        # Thread principal: descarta os quadros atrasados e envia o mais
+        # recente para a textura. None quando não chegou quadro novo
+        with self.condition:
+            if not self.frames:
+                return None
+            while len(self.frames) > 1:
+                self.frames.popleft()
+            size, data = self.frames.popleft()
+            self.condition.notify()
+        if self.texture is None or self.texture.size != size:
+            self.texture = Texture.create(size=size, colorfmt='rgb')
+            self.texture.flip_vertical()
+        self.texture.blit_buffer(data, colorfmt='rgb', bufferfmt='ubyte')
+        return self.texture
+
+class ClipPool(object):
+    # Clipes abertos: o da pergunta atual e os das perguntas vizinhas na
+    # tela, para que trocar de pergunta não espere a abertura do arquivo.
+    # Os vizinhos são pré-abertos depois de o popup aparecer (preopen).
+    # Mantém no máximo max_open clipes, fechando os usados há mais tempo
+    def __init__(self, max_open, buffer_frames):
+        self.max_open = max_open
+        self.buffer_frames = buffer_frames
+        self.streams = OrderedDict()
+
+    def open(self, question_key):
+        stream = self.streams.get(question_key)
+        if stream is None:
+            try:
+                stream = ClipStream(question_key, self.buffer_frames)
+            except Exception as e:
+                print(f"Failed to open clip for {question_key}: {e}")
+                return None
+            self.streams[question_key] = stream
+        self.streams.move_to_end(question_key)
+        return stream
+
+    def get(self, question_key):
+        # Clipe da pergunta, ou None
+        stream = self.open(question_key) if has_clip(question_key) else None
+        self.trim()
+        return stream
+
+    def preopen(self, question_keys, current=None):
+        # Abre os clipes das perguntas vizinhas. O clipe atual fica por
+        # último: não é fechado pelo limite
+        for key in question_keys:
+            if has_clip(key):
+                self.open(key)
+        if current in self.streams:
+            self.streams.move_to_end(current)
+        self.trim()
+
+    def trim(self):
+        while len(self.streams) > self.max_open:
+            _, oldest = self.streams.popitem(last=False)
+            oldest.close()
+
+    def close(self):
+        for stream in self.streams.values():
+            stream.close()
+        self.streams.clear()
+
+def adjacent_questions(question_keys, question_key):
+    # Perguntas antes e depois de question_key na lista de botões da tela
+    if question_key not in question_keys:
+        return []
+    index = question_keys.index(question_key)
+    return [question_keys[i] for i in (index + 1, index - 1) if 0 <= i < len(question_keys)]
+
+clip_pool = None
+
+def get_clip_pool():
+    global clip_pool
+    if clip_pool is None:
+        clip_pool = ClipPool(constants.VIDEO_OPEN_CLIPS, constants.VIDEO_BUFFER_FRAMES)
+    return clip_pool
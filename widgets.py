@@ -1,6 +1,287 @@
 # widgets.py
 from kivy.uix.image import Image
 from kivy.uix.behaviors import ButtonBehavior
+from kivy.uix.boxlayout import BoxLayout
+from kivy.uix.button import Button
+from kivy.uix.label import Label
+from kivy.uix.popup import Popup
+from kivy.uix.recycleboxlayout import RecycleBoxLayout
+from kivy.uix.recycleview import RecycleView
+from kivy.uix.recycleview.views import RecycleDataViewBehavior
+from kivy.uix.textinput import TextInput
+from kivy.uix.widget import Widget
+from kivy.clock import Clock
+from kivy.graphics import Color, Rectangle
+from kivy.properties import BooleanProperty, ListProperty, NumericProperty, StringProperty
+from kivy.utils import get_color_from_hex
+
+import constants
+from textures import atlas_source, text_cache
 
 class ImageButton(ButtonBehavior, Image):
-    pass
+    def __init__(self, **kwargs):
+        # Usa a imagem do atlas quando disponível, compartilhando uma só textura
+        if kwargs.get('source'):
+            kwargs['source'] = atlas_source(kwargs['source'])
+        super(ImageButton, self).__init__(**kwargs)
+
+class ImagePopup(Popup):
+    # Popup construído uma única vez e reaproveitado: a cada pergunta apenas
+    # a imagem, o texto e o título são trocados
+    def __init__(self, **kwargs):
+        content = BoxLayout(orientation='vertical', padding=10)
+
+        # Add image. Algumas perguntas trocam a imagem por um widget
+        # interativo (ex.: mapa do corpo), que ocupa o mesmo lugar
+        self.image = Image()
+        self.media = BoxLayout()
+        self.media.add_widget(self.image)
+        content.add_widget(self.media)
+
+        # Add text info
+        self.info_label = Label(
+            size_hint=(1, None),
+            height=40,
+            halign='center',
+            valign='middle',
+            color=get_color_from_hex('#000000')
+        )
+        self.info_label.bind(
+            size=lambda s, w: setattr(s, 'text_size', (s.width, None))  # Update text size for wrapping
+        )
+        content.add_widget(self.info_label)
+
+        # Resposta do paciente, registrada na consulta atual com SALVAR
+        answer_layout = BoxLayout(orientation='horizontal', size_hint_y=None, height=40, spacing=10)
+        self.answer_input = TextInput(
+            hint_text='Resposta do paciente',
+            multiline=False,
+            font_size=constants.BUTTON_FONT_SIZE * 0.8
+        )
+        self.answer_input.bind(on_text_validate=lambda instance: self.save_answer())
+        answer_layout.add_widget(self.answer_input)
+        self.save_button = Button(
+            text='SALVAR',
+            size_hint_x=None, width=100,
+            background_color=get_color_from_hex(constants.BUTTON_BACKGROUND_COLOR),
+            background_normal='',
+            font_name='Roboto',
+            bold=True
+        )
+        self.save_button.bind(on_press=lambda instance: self.save_answer())
+        answer_layout.add_widget(self.save_button)
+        content.add_widget(answer_layout)
+        content.add_widget(Widget(size_hint_y=None, height=10))
+
+        # Add close button
+        close_button = Button(
+            text='FECHAR',
+            size_hint_y=None, height=40,
+            background_color=get_color_from_hex(constants.BUTTON_BACKGROUND_COLOR),
+            background_normal='',
+            font_name='Roboto',
+            bold=True
+        )
+        close_button.bind(on_press=lambda instance: self.dismiss())
+        content.add_widget(close_button)
+
+        self.clip = None
+        self.clip_event = None
+        self.question_widget = None
+
+        # Configure Popup with white background
+        super(ImagePopup, self).__init__(
+            title_color=get_color_from_hex('#000000'),
+            title_size=constants.TITLE_FONT_SIZE,
+            content=content,
+            size_hint=(1, 1),
+            background='',  # Remove background image
+            **kwargs
+        )
+
+    def show(self, texture, text_info, image_description, source=None, question_key=None, answer='', on_answer=None, clip=None, question_widget=None):
+        # source identifica a imagem esperada; texturas que chegarem depois
+        # para outra imagem (popup já trocado) são ignoradas em set_texture.
+        # on_answer(question_key, answer) é chamado ao salvar a resposta.
+        # Com clip (video.ClipStream), a imagem é o pôster do clipe e os
+        # quadros do vídeo a substituem assim que começam a chegar. Com
+        # question_widget, o widget aparece no lugar da imagem e a resposta
+        # tocada nele vai para o campo de resposta
+        self.stop_clip()
+        self.set_question_widget(question_widget)
+        self.source = source
+        self.question_key = question_key
+        self.on_answer = on_answer
+        self.title = image_description.capitalize()
+        self.image.texture = texture
+        self.info_label.text = text_info
+        self.set_answer(answer)
+        self.answer_input.disabled = self.save_button.disabled = on_answer is None or question_key is None
+        if question_widget is not None:
+            question_widget.disabled = self.answer_input.disabled
+        self.open()
+        if clip is not None:
+            self.clip = clip
+            clip.play()
+            self.clip_event = Clock.schedule_interval(self.update_clip_frame, 0)
+
+    def update_clip_frame(self, dt):
+        texture = self.clip.next_texture()
+        if texture is not None:
+            # O pôster que ainda estiver decodificando não substitui o vídeo
+            self.source = None
+            self.image.texture = texture
+            # A textura é a mesma a cada quadro: o Image precisa redesenhar
+            self.image.canvas.ask_update()
+
+    def stop_clip(self):
+        if self.clip is not None:
+            self.clip_event.cancel()
+            self.clip.pause()
+            self.clip = self.clip_event = None
+
+    def on_dismiss(self):
+        self.stop_clip()
+
+    def set_question_widget(self, widget):
+        if widget is self.question_widget:
+            return
+        self.media.clear_widgets()
+        if self.question_widget is not None:
+            self.question_widget.unbind(answer=self.on_widget_answer)
+        self.question_widget = widget
+        if widget is not None:
+            widget.bind(answer=self.on_widget_answer)
+            self.media.add_widget(widget)
+        else:
+            self.media.add_widget(self.image)
+
+    def on_widget_answer(self, widget, answer):
+        self.answer_input.text = answer
+
+    def set_answer(self, answer):
+        # O widget mostra o que reconhecer da resposta; o campo mantém o
+        # texto como foi salvo (ex.: digitado antes de existir o widget)
+        if self.question_widget is not None:
+            self.question_widget.set_answer(answer)
+        self.answer_input.text = answer
+
+    def save_answer(self):
+        answer = self.answer_input.text.strip()
+        if answer and self.on_answer is not None and self.question_key is not None:
+            self.on_answer(self.question_key, answer)
+            self.dismiss()
+
+    def set_texture(self, source, texture):
+        if source == self.source and texture is not None:
+            self.image.texture = texture
+
+class TextLabel(Widget):
+    # Texto desenhado a partir do cache de textos compartilhado, em vez de
+    # cada Label rasterizar a sua própria textura
+    text = StringProperty('')
+    font_size = NumericProperty(constants.BUTTON_FONT_SIZE)
+    font_name = StringProperty('Roboto')
+    bold = BooleanProperty(False)
+    color = ListProperty([1, 1, 1, 1])
+    # Largura máxima do texto (quebra de linha); None para não quebrar
+    text_width = NumericProperty(None, allownone=True)
+
+    def __init__(self, **kwargs):
+        super(TextLabel, self).__init__(**kwargs)
+        with self.canvas:
+            Color(1, 1, 1, 1)
+            self.text_rect = Rectangle()
+        self.bind(pos=self.update_text, size=self.update_text, text=self.update_text)
+        self.update_text()
+
+    @property
+    def texture(self):
+        return text_cache.get(self.text, self.font_size, self.text_width, self.bold, self.color, self.font_name)
+
+    @property
+    def texture_height(self):
+        return self.texture.height
+
+    def update_text(self, *args):
+        texture = self.texture
+        self.text_rect.texture = texture
+        self.text_rect.size = texture.size
+        self.text_rect.pos = (int(self.center_x - texture.width / 2), int(self.center_y - texture.height / 2))
+
+def button_text_texture(text):
+    return text_cache.get(text, constants.BUTTON_FONT_SIZE, constants.BUTTON_WIDTH - constants.BUTTON_MARGIN, True)
+
+def button_height(text):
+    # Altura do botão a partir do texto em cache, sem criar widgets nem
+    # depender de um bind em texture_size para cada botão
+    return button_text_texture(text).height + constants.BUTTON_MARGIN
+
+class MenuButton(RecycleDataViewBehavior, ButtonBehavior, Widget):
+    # Botão reciclado pela MenuList: recebe texto, destino e altura dos dados.
+    # O texto vem do cache de textos, então textos repetidos não são rasterizados de novo
+    text = StringProperty('')
+    target = StringProperty('')
+
+    def __init__(self, **kwargs):
+        super(MenuButton, self).__init__(**kwargs)
+        self.menu_list = None
+        with self.canvas:
+            self.background_color = Color(*get_color_from_hex(constants.BUTTON_BACKGROUND_COLOR))
+            self.background = Rectangle()
+            Color(1, 1, 1, 1)
+            self.text_rect = Rectangle()
+        self.bind(pos=self.update_canvas, size=self.update_canvas, text=self.update_canvas, state=self.update_color)
+
+    def update_canvas(self, *args):
+        self.background.pos = self.pos
+        self.background.size = self.size
+
+        texture = button_text_texture(self.text)
+        self.text_rect.texture = texture
+        self.text_rect.size = texture.size
+        self.text_rect.pos = (int(self.center_x - texture.width / 2), int(self.center_y - texture.height / 2))
+
+    def update_color(self, instance, state):
+        # Escurece o botão enquanto pressionado
+        r, g, b, a = get_color_from_hex(constants.BUTTON_BACKGROUND_COLOR)
+        factor = 0.7 if state == 'down' else 1
+        self.background_color.rgba = (r * factor, g * factor, b * factor, a)
+
+    def refresh_view_attrs(self, rv, index, data):
+        self.menu_list = rv
+        return super(MenuButton, self).refresh_view_attrs(rv, index, data)
+
+    def on_press(self):
+        if self.menu_list is not None:
+            self.menu_list.dispatch('on_item_press', self.target)
+
+class MenuList(RecycleView):
+    # Lista de botões (texto, destino) baseada em RecycleView: só existem
+    # widgets para os botões visíveis, independente do tamanho da lista
+    __events__ = ('on_item_press',)
+
+    def __init__(self, **kwargs):
+        super(MenuList, self).__init__(**kwargs)
+
+        layout = RecycleBoxLayout(
+            viewclass=MenuButton,
+            orientation='vertical',
+            spacing=constants.BUTTON_HEIGHT/2,
+            size_hint_y=None,
+            default_size=(constants.BUTTON_WIDTH, constants.BUTTON_HEIGHT),
+            default_size_hint=(None, None),
+            default_pos_hint={'center_x': 0.5},
+        )
+        layout.bind(minimum_height=layout.setter('height'))
+        self.add_widget(layout)
+
+    def set_items(self, button_texts):
+        self.data = [
+            {'text': text, 'target': target, 'height': button_height(text)}
+            for text, target in button_texts
+        ]
+        self.scroll_y = 1
+
+    def on_item_press(self, target):
+        pass